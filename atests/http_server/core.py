@@ -1,11 +1,15 @@
 # This code is part of httpbin project source code https://github.com/postmanlabs/httpbin
 # See AUTHORS and LICENSE for more information
 
+import gzip
+import uuid
+
 from flask import Flask, Response, jsonify as flask_jsonify, request
 
 from .structures import CaseInsensitiveDict
 from .helpers import get_dict, status_code
 from .utils import weighted_choice
+from werkzeug.http import http_date
 
 
 app = Flask(__name__)
@@ -67,6 +71,99 @@ def view_anything(anything=None):
     )
 
 
+@app.route("/cache")
+def cache():
+    """Returns a 304 if an If-Modified-Since header or If-None-Match is present. Returns the same as a GET otherwise.
+    ---
+    tags:
+      - Response inspection
+    produces:
+      - application/json
+    responses:
+      200:
+        description: Cached response
+      304:
+        description: Modified
+
+    """
+    is_conditional = request.headers.get("If-Modified-Since") or request.headers.get(
+        "If-None-Match"
+    )
+
+    if is_conditional is None:
+        response = view_anything()
+        response.headers["Last-Modified"] = http_date()
+        response.headers["ETag"] = uuid.uuid4().hex
+        return response
+    else:
+        return status_code(304)
+
+
+@app.route("/cache/<int:value>")
+def cache_control(value):
+    """Sets a Cache-Control header for n seconds.
+    ---
+    tags:
+      - Response inspection
+    parameters:
+      - in: path
+        name: value
+        type: integer
+    produces:
+      - application/json
+    responses:
+      200:
+        description: Cache control set
+    """
+    response = view_anything()
+    response.headers["Cache-Control"] = "public, max-age={0}".format(value)
+    return response
+
+
+@app.route("/range/<int:numbytes>", methods=["GET", "HEAD"])
+def range_request(numbytes):
+    """Streams n bytes of the alphabet, supporting the Range header.
+    ---
+    tags:
+      - Dynamic data
+    parameters:
+      - in: path
+        name: numbytes
+        type: integer
+    produces:
+      - application/octet-stream
+    responses:
+      200:
+        description: Bytes.
+      206:
+        description: Requested range of bytes.
+    """
+    data = bytes(ord("a") + i % 26 for i in range(numbytes))
+    response = Response(data, mimetype="application/octet-stream")
+    return response.make_conditional(request, accept_ranges=True, complete_length=numbytes)
+
+
+@app.route("/gzip/<int:numbytes>")
+def gzip_bytes(numbytes):
+    """Returns n zero bytes gzip-encoded.
+    ---
+    tags:
+      - Response formats
+    parameters:
+      - in: path
+        name: numbytes
+        type: integer
+    produces:
+      - application/octet-stream
+    responses:
+      200:
+        description: Gzip-encoded bytes.
+    """
+    response = Response(gzip.compress(b"\0" * numbytes), mimetype="application/octet-stream")
+    response.headers["Content-Encoding"] = "gzip"
+    return response
+
+
 @app.route(
     "/status/<codes>", methods=["GET", "POST", "PUT", "DELETE", "PATCH", "TRACE", "HEAD", "CONNECT"]
 )
@@ -21,7 +21,9 @@ Programming Language :: Python :: 3.9
 Topic :: Software Development :: Testing
 """[1:-1]
 
-TEST_REQUIRE = ['robotframework>=3.2.1', 'pytest', 'flask', 'six', 'coverage', 'flake8']
+COMPRESSION_REQUIRE = ['brotli', 'zstandard', 'backports.zstd; python_version < "3.14"']
+
+TEST_REQUIRE = ['robotframework>=3.2.1', 'pytest', 'flask', 'six', 'coverage', 'flake8', 'httpx[http2]']
 
 VERSION = None
 version_file = join(dirname(abspath(__file__)), 'src', 'RequestsLibrary', 'version.py')
@@ -53,5 +55,6 @@ setup(name='robotframework-requests',
           'requests'
       ],
       extras_require={
-          'test': TEST_REQUIRE
+          'test': TEST_REQUIRE,
+          'compression': COMPRESSION_REQUIRE
       })
@@ -1,10 +1,43 @@
+import hashlib
+import os
+import threading
+import types
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 import robot
+from robot.api import logger
 from robot.api.deco import keyword
 from robot.libraries.BuiltIn import BuiltIn
 
-from RequestsLibrary import log
+from RequestsLibrary.chunked import (
+    CHUNK_SIZE,
+    ChunkedBody,
+    check_chunk_size,
+    iter_file_chunks,
+    iter_rechunked,
+)
 from RequestsLibrary.compat import urljoin
+from RequestsLibrary.download import (
+    Download,
+    check_digest,
+    check_download_settings,
+    check_max_size,
+    file_digest,
+    preallocate,
+    ranged_download_size,
+    resume_headers,
+    resume_validator,
+    save_range,
+    save_response,
+    split_ranges,
+)
+from RequestsLibrary.multipart import build_multipart_encoder
+from RequestsLibrary.recorder import TrafficRecorder
+from RequestsLibrary.stats import response_size
+from RequestsLibrary.timings import TimingHTTPAdapter
+from RequestsLibrary.trafficlog import LogSettings, TrafficLog
+from RequestsLibrary.wiretrace import log_wire_trace
 from RequestsLibrary.utils import (
     is_list_or_tuple,
     is_file_descriptor,
@@ -13,39 +46,239 @@ from RequestsLibrary.utils import (
 
 
 class RequestsKeywords(object):
-
-    def __init__(self):
+    ROBOT_LISTENER_API_VERSION = 2
+
+    def __init__(
+        self,
+        session_less_keep_alive=False,
+        log_binary_digest=None,
+        log_mode="full",
+        log_buffer_size=10,
+        log_sample_rate=1,
+        log_byte_budget=None,
+    ):
         self._cache = robot.utils.ConnectionCache("No sessions created")
         self.builtin = BuiltIn()
-        self.debug = 0
-        # The following variables are related to session but used in _common_request :(
-        self.timeout = None
-        self.cookies = None
-        self.last_response = None
+        # The last response is kept by thread, so keywords run in parallel threads
+        # don't see each other's responses
+        self._local = threading.local()
+
+        self._session_less_adapters = None
+        if self.builtin.convert_to_boolean(session_less_keep_alive):
+            # urllib3 pools are keyed by scheme, host and port
+            self._session_less_adapters = {
+                "http://": TimingHTTPAdapter(),
+                "https://": TimingHTTPAdapter(),
+            }
+
+        if log_binary_digest and log_binary_digest not in hashlib.algorithms_available:
+            raise ValueError("Unknown digest algorithm: %s" % log_binary_digest)
+        self.log_binary_digest = log_binary_digest or None
+        self._traffic_log = TrafficLog(
+            LogSettings(log_mode, log_sample_rate, log_byte_budget),
+            log_buffer_size,
+            self.log_binary_digest,
+        )
+        self._recorder = None
+        # Listener that reports at the end of each test what hasn't been logged
+        self.ROBOT_LIBRARY_LISTENER = self
+
+    @property
+    def last_response(self):
+        return getattr(self._local, "last_response", None)
+
+    @last_response.setter
+    def last_response(self, response):
+        self._local.last_response = response
 
     def _common_request(self, method, session, uri, **kwargs):
 
         if session:
             request_function = getattr(session, "request")
         else:
-            request_function = getattr(requests, "request")
+            request_function = self._get_session_less_request_function()
+
+        try:
+            resp = self._send_request(
+                request_function, method, session, uri, **kwargs
+            )
+        except requests.exceptions.RequestException:
+            self._traffic_log.flush()
+            raise
+
+        self._log_exchange(session, resp)
 
-        self._capture_output()
+        self._set_last_response(session, resp)
 
-        resp = request_function(
-            method,
-            self._merge_url(session, uri),
-            timeout=self._get_timeout(kwargs.pop("timeout", None)),
-            cookies=kwargs.pop("cookies", self.cookies),
-            **kwargs
+        return resp
+
+    def _common_download(
+        self,
+        session,
+        uri,
+        path,
+        chunk_size,
+        digest,
+        max_size,
+        connections=1,
+        resume=0,
+        **kwargs
+    ):
+        """
+        Helper method that sends a streamed GET request and writes the body of a successful
+        response to ``path`` one chunk at a time, so that it's never loaded in memory.
+        Error responses are read and logged as usual.
+
+        With more than one of ``connections`` the resource is downloaded in ranges
+        when the server supports them, see _ranged_download.
+        A body interrupted by a connection error is resumed up to ``resume`` times
+        with a range request of the missing bytes.
+        """
+        chunk_size, max_size, connections = check_download_settings(
+            chunk_size, max_size, connections
         )
+        kwargs["stream"] = True
+        resp = None
+        try:
+            if connections > 1:
+                resp = self._send_request(
+                    session.request, "HEAD", session, uri, **dict(kwargs, stream=False)
+                )
+                resp.download = self._ranged_download(
+                    session,
+                    resp,
+                    path,
+                    chunk_size,
+                    digest,
+                    max_size,
+                    connections,
+                    resume,
+                    **kwargs
+                )
+                if resp.download is None:
+                    resp = None
+            if resp is None:
+                resp = self._send_request(session.request, "GET", session, uri, **kwargs)
+                if 200 <= resp.status_code < 300:
+                    resp.download = save_response(
+                        resp,
+                        path,
+                        chunk_size,
+                        digest,
+                        max_size,
+                        self._reopen_download(session, resp.url, **kwargs),
+                        resume,
+                    )
+        except (requests.exceptions.RequestException, AssertionError):
+            # Log the response of a failed download too, without reading the rest of its body
+            if resp is not None:
+                if resp._content is False:
+                    resp._content_consumed = True
+                self._log_exchange(session, resp)
+            self._traffic_log.flush()
+            raise
+
+        self._log_exchange(session, resp)
+        self._set_last_response(session, resp)
 
-        log.log_request(resp)
-        self._print_debug()
+        return resp
 
-        log.log_response(resp)
+    def _reopen_download(self, session, url, **kwargs):
+        """
+        Returns the function that sends the streamed GET request of a download again,
+        on its final ``url``, with the additional headers of a resumed download.
+        """
+        kwargs.pop("params", None)
+        headers = kwargs.pop("headers", None) or {}
+
+        def reopen(resume_headers):
+            return self._send_request(
+                session.request,
+                "GET",
+                session,
+                url,
+                headers=dict(headers, **resume_headers),
+                **kwargs
+            )
 
-        self.last_response = resp
+        return reopen
+
+    def _ranged_download(
+        self,
+        session,
+        probe,
+        path,
+        chunk_size,
+        digest,
+        max_size,
+        connections,
+        resume,
+        **kwargs
+    ):
+        """
+        Helper method that, when the ``probe`` response of a HEAD request shows that the server
+        accepts byte ranges, downloads the resource with up to ``connections`` concurrent range
+        requests, each one written at its offset of a preallocated ``.part`` file.
+
+        Returns the ``Download``, or None when the resource can't be downloaded in ranges
+        or is not bigger than one ``chunk_size``.
+        """
+        digest = check_digest(digest)
+        size = ranged_download_size(probe)
+        if size is None or size <= chunk_size:
+            return None
+        check_max_size(probe, size, max_size)
+
+        # The probe url already has the params and the redirects resolved
+        kwargs.pop("params", None)
+        headers = dict(kwargs.pop("headers", None) or {})
+        headers["Accept-Encoding"] = "identity"
+        ranges = split_ranges(size, min(connections, -(-size // chunk_size)))
+        part_path = path + ".part"
+        reopen = self._reopen_download(session, probe.url, headers=headers, **kwargs)
+        validator = resume_validator(probe)
+
+        def download_range(byte_range):
+            first, last = byte_range
+            # If-Range makes a changed resource answer 200, that check_range rejects
+            resp = reopen(resume_headers(first, last, validator))
+            save_range(
+                resp, part_path, first, last, chunk_size, reopen, resume, validator
+            )
+
+        try:
+            preallocate(part_path, size)
+            with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                list(executor.map(download_range, ranges))
+            hexdigest = file_digest(part_path, digest, chunk_size) if digest else None
+            os.replace(part_path, path)
+        except BaseException:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise
+        return Download(path, size, digest, hexdigest, len(ranges))
+
+    def _send_request(self, request_function, method, session, uri, **kwargs):
+        """
+        Helper method that sends the request and closes any file descriptor passed.
+        It doesn't log nor change the library state, only the thread safe session statistics,
+        so it's safe to be called from other threads.
+        """
+        self._stream_multipart_files(kwargs)
+        self._wrap_chunked_body(kwargs)
+        url = self._merge_url(session, uri)
+        try:
+            resp = request_function(
+                method,
+                url,
+                timeout=self._get_timeout(session, kwargs.pop("timeout", None)),
+                cookies=kwargs.pop("cookies", getattr(session, "request_cookies", None)),
+                **kwargs
+            )
+        except requests.exceptions.RequestException:
+            self._record_statistics(session, method, url)
+            raise
+        self._record_statistics(session, method, url, resp)
 
         files = kwargs.get("files", {}) or {}
         data = kwargs.get("data", []) or []
@@ -54,6 +287,137 @@ class RequestsKeywords(object):
 
         return resp
 
+    async def _common_request_async(self, method, session, uri, **kwargs):
+
+        try:
+            resp = await self._send_request_async(method, session, uri, **kwargs)
+        except requests.exceptions.RequestException:
+            self._traffic_log.flush()
+            raise
+
+        self._log_exchange(session, resp)
+
+        self._set_last_response(session, resp)
+
+        return resp
+
+    async def _send_request_async(self, method, session, uri, **kwargs):
+        """
+        Async counterpart of _send_request that uses the session async engine.
+        """
+        if not session.async_engine:
+            raise ValueError("Session has not been created with engine=async")
+
+        self._stream_multipart_files(kwargs)
+        self._wrap_chunked_body(kwargs)
+        url = self._merge_url(session, uri)
+        try:
+            resp = await session.async_engine.request(
+                method,
+                url,
+                timeout=self._get_timeout(session, kwargs.pop("timeout", None)),
+                cookies=kwargs.pop("cookies", getattr(session, "request_cookies", None)),
+                **kwargs
+            )
+        except requests.exceptions.RequestException:
+            self._record_statistics(session, method, url)
+            raise
+        self._record_statistics(session, method, url, resp)
+
+        files = kwargs.get("files", {}) or {}
+        data = kwargs.get("data", []) or []
+
+        self._close_file_descriptors(files, data)
+
+        return resp
+
+    def _set_last_response(self, session, resp):
+        self.last_response = resp
+        if session is not None:
+            session.last_response = resp
+
+    def _log_exchange(self, session, resp):
+        log_wire_trace(resp)
+        if self._recorder:
+            self._recorder.record(resp)
+        self._traffic_log.log(resp, getattr(session, "log_settings", None))
+
+    def _end_test(self, name, attributes):
+        self._traffic_log.settings.report()
+        for session in self._cache:
+            settings = getattr(session, "log_settings", None)
+            if settings is not None:
+                settings.report()
+
+    @staticmethod
+    def _record_statistics(session, method, url, resp=None):
+        """
+        Records the response, or the failed request when there's none, in the session statistics.
+        """
+        statistics = getattr(session, "statistics", None)
+        if statistics is None:
+            return
+        if resp is None:
+            statistics.record(method, url, error=True)
+        elif isinstance(resp, requests.Response):
+            statistics.record(
+                method,
+                url,
+                resp.elapsed.total_seconds(),
+                response_size(resp),
+                resp.status_code >= 400,
+            )
+
+    def _get_session_less_request_function(self):
+        """
+        Helper method that returns the function used by session-less keywords.
+        When keep alive is enabled a new throwaway session, so without cookies and headers
+        of previous requests, is mounted on the shared adapters to recycle their connections.
+        """
+        if not self._session_less_adapters:
+            return self._session_less_request
+
+        session = requests.Session()
+        for prefix, adapter in self._session_less_adapters.items():
+            session.mount(prefix, adapter)
+        return getattr(session, "request")
+
+    @staticmethod
+    def _session_less_request(method, url, **kwargs):
+        """
+        Same as requests.request but with the adapters that record the request timings.
+        """
+        with requests.Session() as session:
+            session.mount("http://", TimingHTTPAdapter())
+            session.mount("https://", TimingHTTPAdapter())
+            return session.request(method, url, **kwargs)
+
+    @staticmethod
+    def _stream_multipart_files(kwargs):
+        """
+        Helper method that replaces the ``files`` and ``data`` of a request with a multipart
+        encoder that streams the files opened in binary mode, instead of requests
+        encoding the whole body in memory. The encoder closes the files when it's closed.
+        """
+        headers = kwargs.get("headers") or {}
+        if any(name.lower() == "content-type" for name in headers):
+            return
+        encoder = build_multipart_encoder(kwargs.get("data"), kwargs.get("files"))
+        if encoder is None:
+            return
+        kwargs["headers"] = dict(headers, **{"Content-Type": encoder.content_type})
+        kwargs["data"] = encoder
+        kwargs["files"] = None
+
+    @staticmethod
+    def _wrap_chunked_body(kwargs):
+        """
+        Helper method that wraps a generator passed as ``data`` in a chunked body,
+        so that the bytes sent are counted and logged like the ones of the chunked body keywords.
+        """
+        if isinstance(kwargs.get("data"), types.GeneratorType):
+            kwargs["data"] = ChunkedBody(kwargs["data"])
+
     @staticmethod
     def _close_file_descriptors(files, data):
         """
@@ -138,6 +502,30 @@ class RequestsKeywords(object):
             response = self.last_response
         self._check_status(expected_status, response, msg)
 
+    @keyword("Response Time Should Be Less Than")
+    def response_time_should_be_less_than(self, max_time, response=None, msg=None):
+        """
+        Fails if the response took more than ``max_time`` to be received.
+
+        ``max_time`` is given in Robot Framework time format like ``200ms``, ``1.5s``
+        or ``2 seconds``, plain numbers are seconds.
+        The time is measured from when the request is sent until the response headers
+        are parsed, as in the ``elapsed`` attribute of the response.
+
+        ``response`` is the output of other requests keywords like `GET` or `GET On Session`.
+        If omitted the last response will be used.
+
+        A custom failure message ``msg`` can be added like in built-in keywords.
+
+        `* On Session` keywords can do the same check with the ``expected_max_time`` argument.
+
+        |   ${resp}=    GET On Session    jsonplaceholder    /posts/1
+        |   Response Time Should Be Less Than    500ms    ${resp}
+        """
+        if response is None:
+            response = self.last_response
+        self._check_response_time(max_time, response, msg)
+
     @keyword("Request Should Be Successful")
     def request_should_be_successful(self, response=None):
         """
@@ -154,6 +542,53 @@ class RequestsKeywords(object):
             response = self.last_response
         self._check_status(None, response, msg=None)
 
+    @keyword("Start Recording Traffic")
+    def start_recording_traffic(
+        self, path, format="jsonl", queue_size=1000, summary_log=True
+    ):
+        """
+        Starts writing every request and response of the library to the file at ``path``.
+
+        ``format`` is ``jsonl``, a JSON object on each line, or ``har``, the HTTP Archive format
+        that browsers and many other tools can open. In both cases the requests and responses
+        are HAR entries, with headers, bodies and timings. Binary bodies are encoded in base64
+        and the ``Authorization`` header is masked.
+
+        The file is written by a background thread, so requests never wait for the disk.
+        Up to ``queue_size`` requests wait to be written, when the queue is full the following
+        ones are not recorded and they are counted by `Stop Recording Traffic`.
+
+        While recording, the requests are logged with a one line summary only,
+        set ``summary_log`` to False to keep logging them as usual.
+
+        A recording already in progress is stopped first.
+
+        |   Start Recording Traffic    ${OUTPUT_DIR}/traffic.har    format=har
+        |   GET On Session    jsonplaceholder    /posts/1
+        |   Stop Recording Traffic
+        """
+        self.stop_recording_traffic()
+        self._recorder = TrafficRecorder(path, format, queue_size)
+        self._traffic_log.summary_only = self.builtin.convert_to_boolean(summary_log)
+        logger.info("Recording traffic to %s" % path)
+
+    @keyword("Stop Recording Traffic")
+    def stop_recording_traffic(self):
+        """
+        Stops the recording started with `Start Recording Traffic`, waiting for all the
+        requests to be written, and returns the number of recorded requests.
+
+        Redirects are recorded as separate requests.
+        Nothing happens if there's no recording in progress.
+        """
+        recorder, self._recorder = self._recorder, None
+        if recorder is None:
+            return 0
+        self._traffic_log.summary_only = False
+        recorder.close()
+        logger.info("Recorded %d requests to %s" % (recorder.recorded, recorder.path))
+        return recorder.recorded
+
     @staticmethod
     @keyword("Get File For Streaming Upload")
     def get_file_for_streaming_upload(path):
@@ -168,11 +603,55 @@ class RequestsKeywords(object):
         """
         return open(path, "rb")
 
+    @staticmethod
+    @keyword("Get Chunked Body From File")
+    def get_chunked_body_from_file(path, chunk_size=CHUNK_SIZE):
+        """
+        Returns a body that reads the file at ``path`` in chunks of ``chunk_size`` bytes,
+        64 KiB by default, to be passed as ``data`` parameter to other requests keywords.
+
+        The body is sent with ``Transfer-Encoding: chunked``, one chunk at a time while the file
+        is read, so its length doesn't have to be known and it's never loaded in memory.
+        The file is opened when the request is sent and closed once it's read.
+        The request log contains only the number of bytes and chunks sent and the throughput.
+
+        The body can be sent only once, get a new one for each request.
+
+        |   ${body}=    Get Chunked Body From File    ${CURDIR}/dump.ndjson    chunk_size=1048576
+        |   ${resp}=    POST On Session    alias    /import    data=${body}
+        """
+        return ChunkedBody(iter_file_chunks(path, check_chunk_size(chunk_size)), path)
+
+    @staticmethod
+    @keyword("Get Chunked Body From List")
+    def get_chunked_body_from_list(items, chunk_size=None):
+        """
+        Returns a body made of the ``items`` of a list, to be passed as ``data``
+        parameter to other requests keywords.
+
+        The body is sent with ``Transfer-Encoding: chunked`` like the one of
+        `Get Chunked Body From File`. Each item is sent as a chunk, strings encoded as UTF-8,
+        unless ``chunk_size`` is given: the items are then joined and split in chunks
+        of ``chunk_size`` bytes while the body is sent.
+
+        |   ${lines}=    Create List    {"id": 1}\n    {"id": 2}\n
+        |   ${body}=    Get Chunked Body From List    ${lines}
+        |   ${resp}=    POST On Session    alias    /import    data=${body}
+        """
+        if chunk_size is not None:
+            items = iter_rechunked(items, check_chunk_size(chunk_size))
+        return ChunkedBody(items)
+
     @keyword("Last response")
-    def get_last_response(self) -> requests.Response:
+    def get_last_response(self, alias=None) -> requests.Response:
         """
         Returns the response from the last request.
+
+        ``alias`` returns the last response of that session instead, by default it's
+        the last response of any request sent by the current thread.
         """
+        if alias is not None:
+            return getattr(self._cache.get_connection(alias), "last_response", None)
         return self.last_response
 
     @keyword("GET")
@@ -1,5 +1,9 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
 from robot.api.deco import keyword
 
+from RequestsLibrary.download import DEFAULT_CHUNK_SIZE
 from RequestsLibrary.utils import warn_if_equal_symbol_in_url_on_session
 
 from .SessionKeywords import SessionKeywords
@@ -10,7 +14,14 @@ class RequestsOnSessionKeywords(SessionKeywords):
     @keyword("GET On Session")
     @warn_if_equal_symbol_in_url_on_session
     def get_on_session(
-        self, alias, url, params=None, expected_status=None, msg=None, **kwargs
+        self,
+        alias,
+        url,
+        params=None,
+        expected_status=None,
+        msg=None,
+        expected_max_time=None,
+        **kwargs
     ):
         """
         Sends a GET request on a previously created HTTP Session.
@@ -25,6 +36,8 @@ class RequestsOnSessionKeywords(SessionKeywords):
         read more about it in `Status Should Be` keyword documentation.
         In order to disable this implicit assert mechanism you can pass as ``expected_status`` the values ``any`` or
         ``anything``.
+        The keyword also fails if the response takes more than ``expected_max_time``, when given,
+        read more about it in `Response Time Should Be Less Than` keyword documentation.
 
         Other optional requests arguments can be passed using ``**kwargs``
         see the `GET` keyword for the complete list.
@@ -32,12 +45,21 @@ class RequestsOnSessionKeywords(SessionKeywords):
         session = self._cache.switch(alias)
         response = self._common_request("GET", session, url, params=params, **kwargs)
         self._check_status(expected_status, response, msg)
+        self._check_response_time(expected_max_time, response, msg)
         return response
 
     @keyword("POST On Session")
     @warn_if_equal_symbol_in_url_on_session
     def post_on_session(
-        self, alias, url, data=None, json=None, expected_status=None, msg=None, **kwargs
+        self,
+        alias,
+        url,
+        data=None,
+        json=None,
+        expected_status=None,
+        msg=None,
+        expected_max_time=None,
+        **kwargs
     ):
         """
         Sends a POST request on a previously created HTTP Session.
@@ -54,6 +76,8 @@ class RequestsOnSessionKeywords(SessionKeywords):
         read more about it in `Status Should Be` keyword documentation.
         In order to disable this implicit assert mechanism you can pass as ``expected_status`` the values ``any`` or
         ``anything``.
+        The keyword also fails if the response takes more than ``expected_max_time``, when given,
+        read more about it in `Response Time Should Be Less Than` keyword documentation.
 
         Other optional requests arguments can be passed using ``**kwargs``
         see the `GET` keyword for the complete list.
@@ -63,12 +87,21 @@ class RequestsOnSessionKeywords(SessionKeywords):
             "POST", session, url, data=data, json=json, **kwargs
         )
         self._check_status(expected_status, response, msg)
+        self._check_response_time(expected_max_time, response, msg)
         return response
 
     @keyword("PATCH On Session")
     @warn_if_equal_symbol_in_url_on_session
     def patch_on_session(
-        self, alias, url, data=None, json=None, expected_status=None, msg=None, **kwargs
+        self,
+        alias,
+        url,
+        data=None,
+        json=None,
+        expected_status=None,
+        msg=None,
+        expected_max_time=None,
+        **kwargs
     ):
         """
         Sends a PATCH request on a previously created HTTP Session.
@@ -85,6 +118,8 @@ class RequestsOnSessionKeywords(SessionKeywords):
         read more about it in `Status Should Be` keyword documentation.
         In order to disable this implicit assert mechanism you can pass as ``expected_status`` the values ``any`` or
         ``anything``.
+        The keyword also fails if the response takes more than ``expected_max_time``, when given,
+        read more about it in `Response Time Should Be Less Than` keyword documentation.
 
         Other optional requests arguments can be passed using ``**kwargs``
         see the `GET` keyword for the complete list.
@@ -94,12 +129,21 @@ class RequestsOnSessionKeywords(SessionKeywords):
             "PATCH", session, url, data=data, json=json, **kwargs
         )
         self._check_status(expected_status, response, msg)
+        self._check_response_time(expected_max_time, response, msg)
         return response
 
     @keyword("PUT On Session")
     @warn_if_equal_symbol_in_url_on_session
     def put_on_session(
-        self, alias, url, data=None, json=None, expected_status=None, msg=None, **kwargs
+        self,
+        alias,
+        url,
+        data=None,
+        json=None,
+        expected_status=None,
+        msg=None,
+        expected_max_time=None,
+        **kwargs
     ):
         """
         Sends a PUT request on a previously created HTTP Session.
@@ -116,6 +160,8 @@ class RequestsOnSessionKeywords(SessionKeywords):
         read more about it in `Status Should Be` keyword documentation.
         In order to disable this implicit assert mechanism you can pass as ``expected_status`` the values ``any`` or
         ``anything``.
+        The keyword also fails if the response takes more than ``expected_max_time``, when given,
+        read more about it in `Response Time Should Be Less Than` keyword documentation.
 
         Other optional requests arguments can be passed using ``**kwargs``
         see the `GET` keyword for the complete list.
@@ -125,11 +171,20 @@ class RequestsOnSessionKeywords(SessionKeywords):
             "PUT", session, url, data=data, json=json, **kwargs
         )
         self._check_status(expected_status, response, msg)
+        self._check_response_time(expected_max_time, response, msg)
         return response
 
     @keyword("DELETE On Session")
     @warn_if_equal_symbol_in_url_on_session
-    def delete_on_session(self, alias, url, expected_status=None, msg=None, **kwargs):
+    def delete_on_session(
+        self,
+        alias,
+        url,
+        expected_status=None,
+        msg=None,
+        expected_max_time=None,
+        **kwargs
+    ):
         """
         Sends a DELETE request on a previously created HTTP Session.
 
@@ -141,6 +196,8 @@ class RequestsOnSessionKeywords(SessionKeywords):
         read more about it in `Status Should Be` keyword documentation.
         In order to disable this implicit assert mechanism you can pass as ``expected_status`` the values ``any`` or
         ``anything``.
+        The keyword also fails if the response takes more than ``expected_max_time``, when given,
+        read more about it in `Response Time Should Be Less Than` keyword documentation.
 
         Other optional requests arguments can be passed using ``**kwargs``
         see the `GET` keyword for the complete list.
@@ -148,11 +205,20 @@ class RequestsOnSessionKeywords(SessionKeywords):
         session = self._cache.switch(alias)
         response = self._common_request("DELETE", session, url, **kwargs)
         self._check_status(expected_status, response, msg)
+        self._check_response_time(expected_max_time, response, msg)
         return response
 
     @keyword("HEAD On Session")
     @warn_if_equal_symbol_in_url_on_session
-    def head_on_session(self, alias, url, expected_status=None, msg=None, **kwargs):
+    def head_on_session(
+        self,
+        alias,
+        url,
+        expected_status=None,
+        msg=None,
+        expected_max_time=None,
+        **kwargs
+    ):
         """
         Sends a HEAD request on a previously created HTTP Session.
 
@@ -167,6 +233,8 @@ class RequestsOnSessionKeywords(SessionKeywords):
         read more about it in `Status Should Be` keyword documentation.
         In order to disable this implicit assert mechanism you can pass as ``expected_status`` the values ``any`` or
         ``anything``.
+        The keyword also fails if the response takes more than ``expected_max_time``, when given,
+        read more about it in `Response Time Should Be Less Than` keyword documentation.
 
         Other optional requests arguments can be passed using ``**kwargs``
         see the `GET` keyword for the complete list.
@@ -179,11 +247,20 @@ class RequestsOnSessionKeywords(SessionKeywords):
 
         response = self._common_request("HEAD", session, url, **kwargs)
         self._check_status(expected_status, response, msg)
+        self._check_response_time(expected_max_time, response, msg)
         return response
 
     @keyword("OPTIONS On Session")
     @warn_if_equal_symbol_in_url_on_session
-    def options_on_session(self, alias, url, expected_status=None, msg=None, **kwargs):
+    def options_on_session(
+        self,
+        alias,
+        url,
+        expected_status=None,
+        msg=None,
+        expected_max_time=None,
+        **kwargs
+    ):
         """
         Sends an OPTIONS request on a previously created HTTP Session.
 
@@ -195,6 +272,8 @@ class RequestsOnSessionKeywords(SessionKeywords):
         read more about it in `Status Should Be` keyword documentation.
         In order to disable this implicit assert mechanism you can pass as ``expected_status`` the values ``any`` or
         ``anything``.
+        The keyword also fails if the response takes more than ``expected_max_time``, when given,
+        read more about it in `Response Time Should Be Less Than` keyword documentation.
 
         Other optional requests arguments can be passed using ``**kwargs``
         see the `GET` keyword for the complete list.
@@ -202,11 +281,20 @@ class RequestsOnSessionKeywords(SessionKeywords):
         session = self._cache.switch(alias)
         response = self._common_request("OPTIONS", session, url, **kwargs)
         self._check_status(expected_status, response, msg)
+        self._check_response_time(expected_max_time, response, msg)
         return response
 
     @keyword("CONNECT On Session")
     @warn_if_equal_symbol_in_url_on_session
-    def connect_on_session(self, alias, url, expected_status=None, msg=None, **kwargs):
+    def connect_on_session(
+        self,
+        alias,
+        url,
+        expected_status=None,
+        msg=None,
+        expected_max_time=None,
+        **kwargs
+    ):
         """
         Sends a CONNECT request on a previously created HTTP Session.
 
@@ -218,6 +306,8 @@ class RequestsOnSessionKeywords(SessionKeywords):
         read more about it in `Status Should Be` keyword documentation.
         In order to disable this implicit assert mechanism you can pass as ``expected_status`` the values ``any`` or
         ``anything``.
+        The keyword also fails if the response takes more than ``expected_max_time``, when given,
+        read more about it in `Response Time Should Be Less Than` keyword documentation.
 
         Other optional requests arguments can be passed using ``**kwargs``
         see the `GET` keyword for the complete list.
@@ -225,11 +315,20 @@ class RequestsOnSessionKeywords(SessionKeywords):
         session = self._cache.switch(alias)
         response = self._common_request("CONNECT", session, url, **kwargs)
         self._check_status(expected_status, response, msg)
+        self._check_response_time(expected_max_time, response, msg)
         return response
 
     @keyword("TRACE On Session")
     @warn_if_equal_symbol_in_url_on_session
-    def trace_on_session(self, alias, url, expected_status=None, msg=None, **kwargs):
+    def trace_on_session(
+        self,
+        alias,
+        url,
+        expected_status=None,
+        msg=None,
+        expected_max_time=None,
+        **kwargs
+    ):
         """
         Sends a TRACE request on a previously created HTTP Session.
 
@@ -241,6 +340,8 @@ class RequestsOnSessionKeywords(SessionKeywords):
         read more about it in `Status Should Be` keyword documentation.
         In order to disable this implicit assert mechanism you can pass as ``expected_status`` the values ``any`` or
         ``anything``.
+        The keyword also fails if the response takes more than ``expected_max_time``, when given,
+        read more about it in `Response Time Should Be Less Than` keyword documentation.
 
         Other optional requests arguments can be passed using ``**kwargs``
         see the `GET` keyword for the complete list.
@@ -248,4 +349,409 @@ class RequestsOnSessionKeywords(SessionKeywords):
         session = self._cache.switch(alias)
         response = self._common_request("TRACE", session, url, **kwargs)
         self._check_status(expected_status, response, msg)
+        self._check_response_time(expected_max_time, response, msg)
+        return response
+
+    @keyword("Download File On Session")
+    def download_file_on_session(
+        self,
+        alias,
+        url,
+        path,
+        params=None,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        digest="sha256",
+        max_size=None,
+        connections=1,
+        resume=0,
+        expected_status=None,
+        msg=None,
+        expected_max_time=None,
+        **kwargs
+    ):
+        """
+        Sends a GET request on a previously created HTTP Session and writes the response body
+        to the file at ``path``, without loading it in memory.
+
+        Session will be identified using the ``alias`` name.
+        The endpoint used to retrieve the resource is the ``url``, while query
+        string parameters can be passed as string, dictionary (or list of tuples or bytes)
+        through the ``params``.
+
+        The body is read in chunks of ``chunk_size`` bytes, 1 MiB by default, and written to
+        ``path`` with a ``.part`` suffix that is renamed once the download is complete.
+        Its ``digest`` is computed while downloading, ``sha256`` by default, use ``None``
+        to skip it. When ``max_size`` is given the download fails, and the partial file is
+        removed, as soon as the body is bigger than ``max_size`` bytes.
+
+        The file is written only for successful responses, error responses are read and
+        logged as usual. The log contains only the size, path and digest of the file.
+
+        With ``connections`` bigger than 1 the resource is first probed with a HEAD request.
+        When the server answers with ``Accept-Ranges: bytes`` and a ``Content-Length`` bigger
+        than ``chunk_size``, the file is downloaded with up to ``connections`` concurrent
+        ``Range`` requests on the session connection pool, each written in place to a
+        preallocated file, and the digest is computed once all of them are complete.
+        The returned response is then the one of the HEAD request. Otherwise, the file is
+        downloaded with a single request as usual. Connections beyond the ``pool_maxsize``
+        of the session are not kept alive.
+
+        When the connection drops in the middle of the body, the download is resumed up to
+        ``resume`` times, by default never, with a ``Range`` request of the missing bytes.
+        Its ``If-Range`` header, the ``ETag`` or ``Last-Modified`` of the response, makes the
+        server send the whole body again when the resource has changed, and the download
+        then starts over. Compressed responses and responses without any validator are
+        always downloaded again from the start.
+
+        The returned response has a ``download`` attribute with the ``path``, ``size``,
+        ``algorithm``, hex ``digest`` and number of ``ranges`` of the file.
+
+        The ``expected_status``, ``msg`` and ``expected_max_time`` parameters work as in `GET On Session`,
+        where ``expected_max_time`` doesn't include the download of the body.
+        Other optional requests arguments can be passed using ``**kwargs``
+        see the `GET` keyword for the complete list.
+
+        |   ${resp}=    Download File On Session    artifacts    /builds/42/image.iso    ${OUTPUT_DIR}/image.iso
+        |   Should Be Equal    ${resp.download.digest}    ${EXPECTED_SHA256}
+        |   ${resp}=    Download File On Session    artifacts    /builds/42/image.iso    ${OUTPUT_DIR}/image.iso
+        |   ...    connections=4    resume=3
+        """
+        session = self._cache.switch(alias)
+        kwargs.pop("stream", None)
+        response = self._common_download(
+            session,
+            url,
+            path,
+            chunk_size,
+            digest,
+            max_size,
+            connections,
+            resume,
+            params=params,
+            **kwargs
+        )
+        self._check_status(expected_status, response, msg)
+        self._check_response_time(expected_max_time, response, msg)
+        return response
+
+    @keyword("GET On Session Async")
+    @warn_if_equal_symbol_in_url_on_session
+    async def get_on_session_async(
+        self,
+        alias,
+        url,
+        params=None,
+        expected_status=None,
+        msg=None,
+        expected_max_time=None,
+        **kwargs
+    ):
+        """
+        Sends a GET request on a previously created HTTP Session with ``engine=async``.
+
+        This is the asyncio counterpart of `GET On Session`, with the same arguments and status check,
+        that doesn't block the Robot Framework event loop while waiting for the response.
+        """
+        session = self._cache.switch(alias)
+        response = await self._common_request_async(
+            "GET", session, url, params=params, **kwargs
+        )
+        self._check_status(expected_status, response, msg)
+        self._check_response_time(expected_max_time, response, msg)
+        return response
+
+    @keyword("POST On Session Async")
+    @warn_if_equal_symbol_in_url_on_session
+    async def post_on_session_async(
+        self,
+        alias,
+        url,
+        data=None,
+        json=None,
+        expected_status=None,
+        msg=None,
+        expected_max_time=None,
+        **kwargs
+    ):
+        """
+        Sends a POST request on a previously created HTTP Session with ``engine=async``.
+
+        This is the asyncio counterpart of `POST On Session`, with the same arguments and status check,
+        that doesn't block the Robot Framework event loop while waiting for the response.
+        """
+        session = self._cache.switch(alias)
+        response = await self._common_request_async(
+            "POST", session, url, data=data, json=json, **kwargs
+        )
+        self._check_status(expected_status, response, msg)
+        self._check_response_time(expected_max_time, response, msg)
+        return response
+
+    @keyword("PATCH On Session Async")
+    @warn_if_equal_symbol_in_url_on_session
+    async def patch_on_session_async(
+        self,
+        alias,
+        url,
+        data=None,
+        json=None,
+        expected_status=None,
+        msg=None,
+        expected_max_time=None,
+        **kwargs
+    ):
+        """
+        Sends a PATCH request on a previously created HTTP Session with ``engine=async``.
+
+        This is the asyncio counterpart of `PATCH On Session`, with the same arguments and status check,
+        that doesn't block the Robot Framework event loop while waiting for the response.
+        """
+        session = self._cache.switch(alias)
+        response = await self._common_request_async(
+            "PATCH", session, url, data=data, json=json, **kwargs
+        )
+        self._check_status(expected_status, response, msg)
+        self._check_response_time(expected_max_time, response, msg)
+        return response
+
+    @keyword("PUT On Session Async")
+    @warn_if_equal_symbol_in_url_on_session
+    async def put_on_session_async(
+        self,
+        alias,
+        url,
+        data=None,
+        json=None,
+        expected_status=None,
+        msg=None,
+        expected_max_time=None,
+        **kwargs
+    ):
+        """
+        Sends a PUT request on a previously created HTTP Session with ``engine=async``.
+
+        This is the asyncio counterpart of `PUT On Session`, with the same arguments and status check,
+        that doesn't block the Robot Framework event loop while waiting for the response.
+        """
+        session = self._cache.switch(alias)
+        response = await self._common_request_async(
+            "PUT", session, url, data=data, json=json, **kwargs
+        )
+        self._check_status(expected_status, response, msg)
+        self._check_response_time(expected_max_time, response, msg)
+        return response
+
+    @keyword("DELETE On Session Async")
+    @warn_if_equal_symbol_in_url_on_session
+    async def delete_on_session_async(
+        self,
+        alias,
+        url,
+        expected_status=None,
+        msg=None,
+        expected_max_time=None,
+        **kwargs
+    ):
+        """
+        Sends a DELETE request on a previously created HTTP Session with ``engine=async``.
+
+        This is the asyncio counterpart of `DELETE On Session`, with the same arguments and status check,
+        that doesn't block the Robot Framework event loop while waiting for the response.
+        """
+        session = self._cache.switch(alias)
+        response = await self._common_request_async("DELETE", session, url, **kwargs)
+        self._check_status(expected_status, response, msg)
+        self._check_response_time(expected_max_time, response, msg)
         return response
+
+    @keyword("HEAD On Session Async")
+    @warn_if_equal_symbol_in_url_on_session
+    async def head_on_session_async(
+        self,
+        alias,
+        url,
+        expected_status=None,
+        msg=None,
+        expected_max_time=None,
+        **kwargs
+    ):
+        """
+        Sends a HEAD request on a previously created HTTP Session with ``engine=async``.
+
+        This is the asyncio counterpart of `HEAD On Session`, with the same arguments and status check,
+        that doesn't block the Robot Framework event loop while waiting for the response.
+        """
+        session = self._cache.switch(alias)
+        # Do not allow redirects for HEAD method by default.
+        if "allow_redirects" not in kwargs:
+            kwargs["allow_redirects"] = False
+
+        response = await self._common_request_async("HEAD", session, url, **kwargs)
+        self._check_status(expected_status, response, msg)
+        self._check_response_time(expected_max_time, response, msg)
+        return response
+
+    @keyword("OPTIONS On Session Async")
+    @warn_if_equal_symbol_in_url_on_session
+    async def options_on_session_async(
+        self,
+        alias,
+        url,
+        expected_status=None,
+        msg=None,
+        expected_max_time=None,
+        **kwargs
+    ):
+        """
+        Sends an OPTIONS request on a previously created HTTP Session with ``engine=async``.
+
+        This is the asyncio counterpart of `OPTIONS On Session`, with the same arguments and status check,
+        that doesn't block the Robot Framework event loop while waiting for the response.
+        """
+        session = self._cache.switch(alias)
+        response = await self._common_request_async("OPTIONS", session, url, **kwargs)
+        self._check_status(expected_status, response, msg)
+        self._check_response_time(expected_max_time, response, msg)
+        return response
+
+    @keyword("CONNECT On Session Async")
+    @warn_if_equal_symbol_in_url_on_session
+    async def connect_on_session_async(
+        self,
+        alias,
+        url,
+        expected_status=None,
+        msg=None,
+        expected_max_time=None,
+        **kwargs
+    ):
+        """
+        Sends a CONNECT request on a previously created HTTP Session with ``engine=async``.
+
+        This is the asyncio counterpart of `CONNECT On Session`, with the same arguments and status check,
+        that doesn't block the Robot Framework event loop while waiting for the response.
+        """
+        session = self._cache.switch(alias)
+        response = await self._common_request_async("CONNECT", session, url, **kwargs)
+        self._check_status(expected_status, response, msg)
+        self._check_response_time(expected_max_time, response, msg)
+        return response
+
+    @keyword("TRACE On Session Async")
+    @warn_if_equal_symbol_in_url_on_session
+    async def trace_on_session_async(
+        self,
+        alias,
+        url,
+        expected_status=None,
+        msg=None,
+        expected_max_time=None,
+        **kwargs
+    ):
+        """
+        Sends a TRACE request on a previously created HTTP Session with ``engine=async``.
+
+        This is the asyncio counterpart of `TRACE On Session`, with the same arguments and status check,
+        that doesn't block the Robot Framework event loop while waiting for the response.
+        """
+        session = self._cache.switch(alias)
+        response = await self._common_request_async("TRACE", session, url, **kwargs)
+        self._check_status(expected_status, response, msg)
+        self._check_response_time(expected_max_time, response, msg)
+        return response
+
+    @keyword("Send Requests Concurrently")
+    def send_requests_concurrently(self, alias, requests, max_workers=10):
+        """
+        Sends a list of requests at the same time on a previously created HTTP Session
+        and returns the list of responses in the same order of the requests.
+
+        Session will be identified using the ``alias`` name.
+        Each item of ``requests`` is a dictionary with the ``method`` and the ``url`` of the request.
+        The optional ``expected_status``, ``msg`` and ``expected_max_time`` keys are used to verify
+        the response status and time as in the `* On Session` keywords, read more about it
+        in `Status Should Be` and `Response Time Should Be Less Than` keywords documentation.
+        All the other keys are passed as optional requests arguments, see the `GET` keyword for the complete list.
+
+        Requests are sent by a pool of ``max_workers`` threads that share the session connections,
+        create the session with a ``pool_maxsize`` at least equal to ``max_workers`` otherwise
+        the connections in excess are discarded instead of being recycled.
+        If the session has been created with ``engine=async``, up to ``max_workers`` requests
+        are sent at the same time on the Robot Framework event loop, without any thread.
+
+        Requests and responses are logged, and status codes verified, once all the requests are completed.
+        The keyword fails on the first response that has not the expected status.
+
+        |   ${req_1}=    Create Dictionary    method=GET    url=/posts/1
+        |   ${req_2}=    Create Dictionary    method=POST    url=/posts    json=${data}    expected_status=201
+        |   ${requests}=    Create List    ${req_1}    ${req_2}
+        |   ${responses}=    Send Requests Concurrently    jsonplaceholder    ${requests}    max_workers=2
+        """
+        session = self._cache.switch(alias)
+        requests = [dict(request) for request in requests]
+        for request in requests:
+            if "method" not in request or "url" not in request:
+                raise ValueError(
+                    "Request must contain the method and the url: %s" % request
+                )
+            # Do not allow redirects for HEAD method by default.
+            if request["method"].upper() == "HEAD" and "allow_redirects" not in request:
+                request["allow_redirects"] = False
+
+        checks = [
+            (
+                request.pop("expected_status", None),
+                request.pop("msg", None),
+                request.pop("expected_max_time", None),
+            )
+            for request in requests
+        ]
+
+        if session.async_engine:
+            return self._send_requests_concurrently_async(
+                session, requests, checks, max_workers
+            )
+
+        with ThreadPoolExecutor(max_workers=int(max_workers)) as executor:
+            futures = [
+                executor.submit(
+                    self._send_request,
+                    session.request,
+                    request.pop("method"),
+                    session,
+                    request.pop("url"),
+                    **request
+                )
+                for request in requests
+            ]
+            responses = [future.result() for future in futures]
+
+        return self._check_concurrent_responses(session, responses, checks)
+
+    async def _send_requests_concurrently_async(
+        self, session, requests, checks, max_workers
+    ):
+        semaphore = asyncio.Semaphore(int(max_workers))
+
+        async def send(request):
+            async with semaphore:
+                return await self._send_request_async(
+                    request.pop("method"), session, request.pop("url"), **request
+                )
+
+        responses = await asyncio.gather(*[send(request) for request in requests])
+        return self._check_concurrent_responses(session, responses, checks)
+
+    def _check_concurrent_responses(self, session, responses, checks):
+        for response in responses:
+            self._log_exchange(session, response)
+
+        if responses:
+            self._set_last_response(session, responses[-1])
+
+        for response, (expected_status, msg, expected_max_time) in zip(
+            responses, checks
+        ):
+            self._check_status(expected_status, response, msg)
+            self._check_response_time(expected_max_time, response, msg)
+        return list(responses)
@@ -1,5 +1,4 @@
 import logging
-import sys
 
 import requests
 from requests.cookies import merge_cookies
@@ -7,11 +6,24 @@ from requests.models import Response
 from requests.sessions import merge_setting
 from robot.api import logger
 from robot.api.deco import keyword
+from robot.utils import timestr_to_secs
 from robot.utils.asserts import assert_equal
 
 from RequestsLibrary import utils
-from RequestsLibrary.compat import RetryAdapter, httplib
+from RequestsLibrary.apptransport import build_app_adapter
+from RequestsLibrary.cache import CachingAdapter, ResponseCache
+from RequestsLibrary.compression import (
+    CompressingAdapter,
+    DecodedSizeLimitAdapter,
+    check_request_compression,
+)
+from RequestsLibrary.compat import RetryAdapter
 from RequestsLibrary.exceptions import InvalidExpectedStatus, InvalidResponse
+from RequestsLibrary.httpxclient import AsyncEngine, HTTP2Adapter
+from RequestsLibrary.replay import Cassette, ReplayAdapter
+from RequestsLibrary.stats import SessionStatistics
+from RequestsLibrary.timings import TimingHTTPAdapter
+from RequestsLibrary.trafficlog import flush_traffic_log_on_failure
 from RequestsLibrary.utils import is_string_type
 
 from .RequestsKeywords import RequestsKeywords
@@ -25,6 +37,125 @@ except ImportError:
 class SessionKeywords(RequestsKeywords):
     DEFAULT_RETRY_METHOD_LIST = RetryAdapter.get_default_allowed_methods()
 
+    @staticmethod
+    def _wrap_adapters(http, https, factory):
+        """
+        Returns the ``http`` and ``https`` adapters wrapped by ``factory``,
+        wrapped only once when the same adapter is used for both schemes.
+        """
+        if http is https:
+            wrapped = factory(http)
+            return wrapped, wrapped
+        return factory(http), factory(https)
+
+    def _build_transports(
+        self,
+        transport,
+        http2,
+        max_retries,
+        backoff_factor,
+        retry_status_list,
+        retry_method_list,
+        pool_connections,
+        pool_maxsize,
+        pool_block,
+        debug,
+    ):
+        """
+        Returns the ``http`` and ``https`` transport adapters of a new session.
+        """
+        if max_retries > 0:
+            retry = RetryAdapter(
+                total=max_retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=retry_status_list,
+                allowed_methods=retry_method_list,
+            )
+        else:
+            retry = 0
+
+        if transport is not None:
+            # a single adapter that doesn't open connections
+            http = https = transport
+        elif self.builtin.convert_to_boolean(http2):
+            # a single transport for both schemes, connections are multiplexed by host
+            http = https = HTTP2Adapter(
+                max_retries=max_retries,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+                wire_trace=debug,
+            )
+        else:
+            http = TimingHTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                max_retries=retry,
+                pool_block=pool_block,
+                wire_trace=debug,
+            )
+            https = TimingHTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                max_retries=retry,
+                pool_block=pool_block,
+                wire_trace=debug,
+            )
+        return http, https
+
+    def _wrap_transports(
+        self,
+        s,
+        http,
+        https,
+        compress_requests,
+        compress_min_size,
+        max_decoded_size,
+        replay,
+        replay_mode,
+        replay_match,
+        cache,
+        cache_max_entries,
+        cache_max_bytes,
+    ):
+        """
+        Returns the ``http`` and ``https`` adapters of the session ``s`` wrapped by the
+        compression, decoded size limit, replay and cache adapters that are enabled.
+        """
+        s.compress_requests, compress_min_size = check_request_compression(
+            compress_requests, compress_min_size
+        )
+        if s.compress_requests:
+            # innermost, so that the cache and the cassette see the uncompressed request
+            http, https = self._wrap_adapters(
+                http,
+                https,
+                lambda adapter: CompressingAdapter(
+                    adapter, s.compress_requests, compress_min_size
+                ),
+            )
+
+        if max_decoded_size is not None:
+            http, https = self._wrap_adapters(
+                http,
+                https,
+                lambda adapter: DecodedSizeLimitAdapter(adapter, max_decoded_size),
+            )
+
+        s.cassette = None
+        if replay:
+            s.cassette = Cassette(replay, replay_mode, replay_match)
+            http, https = self._wrap_adapters(
+                http, https, lambda adapter: ReplayAdapter(adapter, s.cassette)
+            )
+
+        s.response_cache = None
+        if self.builtin.convert_to_boolean(cache):
+            s.response_cache = ResponseCache(cache_max_entries, cache_max_bytes)
+            http, https = self._wrap_adapters(
+                http, https, lambda adapter: CachingAdapter(adapter, s.response_cache)
+            )
+        return http, https
+
     def _create_session(
         self,
         alias,
@@ -41,6 +172,24 @@ class SessionKeywords(RequestsKeywords):
         disable_warnings,
         retry_status_list,
         retry_method_list,
+        pool_connections=10,
+        pool_maxsize=10,
+        pool_block=False,
+        engine="requests",
+        http2=False,
+        log_mode=None,
+        log_sample_rate=None,
+        log_byte_budget=None,
+        cache=False,
+        cache_max_entries=1000,
+        cache_max_bytes=64 * 1024 * 1024,
+        replay=None,
+        replay_mode="new_episodes",
+        replay_match="method,url",
+        compress_requests=None,
+        compress_min_size=1024,
+        max_decoded_size=None,
+        transport=None,
     ):
 
         logger.debug("Creating session: %s" % alias)
@@ -50,26 +199,50 @@ class SessionKeywords(RequestsKeywords):
         s.proxies = proxies if proxies else s.proxies
 
         try:
+            debug = int(debug)
             max_retries = int(max_retries)
+            pool_connections = int(pool_connections)
+            pool_maxsize = int(pool_maxsize)
             retry_status_list = (
                 [int(x) for x in retry_status_list] if retry_status_list else None
             )
+            max_decoded_size = (
+                int(max_decoded_size) if max_decoded_size is not None else None
+            )
         except ValueError as err:
             raise ValueError("Error converting session parameter: %s" % err)
+        pool_block = self.builtin.convert_to_boolean(pool_block)
+
+        http, https = self._build_transports(
+            transport,
+            http2,
+            max_retries,
+            backoff_factor,
+            retry_status_list,
+            retry_method_list,
+            pool_connections,
+            pool_maxsize,
+            pool_block,
+            debug,
+        )
+        http, https = self._wrap_transports(
+            s,
+            http,
+            https,
+            compress_requests,
+            compress_min_size,
+            max_decoded_size,
+            replay,
+            replay_mode,
+            replay_match,
+            cache,
+            cache_max_entries,
+            cache_max_bytes,
+        )
 
-        if max_retries > 0:
-            retry = RetryAdapter(
-                total=max_retries,
-                backoff_factor=backoff_factor,
-                status_forcelist=retry_status_list,
-                allowed_methods=retry_method_list,
-            )
-            http = requests.adapters.HTTPAdapter(max_retries=retry)
-            https = requests.adapters.HTTPAdapter(max_retries=retry)
-
-            # Replace the session's original adapters
-            s.mount("http://", http)
-            s.mount("https://", https)
+        # Replace the session's original adapters
+        s.mount("http://", http)
+        s.mount("https://", https)
 
         # Disable requests warnings, useful when you have large number of testcase
         # you will observe drastical changes in Robot log.html and output.xml files size
@@ -96,16 +269,24 @@ class SessionKeywords(RequestsKeywords):
             # not a Boolean nor a String
             s.verify = verify
 
-        # cant pass these into the Session anymore
-        self.timeout = timeout
-        self.cookies = cookies
+        # cant pass these into the Session anymore, they are used by _send_request
+        s.timeout = timeout
+        s.request_cookies = cookies
+        s.last_response = None
 
         s.url = url
+        s.wire_trace = debug
+        s.statistics = SessionStatistics()
+        s.log_settings = self._traffic_log.settings.override(
+            log_mode or None, log_sample_rate, log_byte_budget
+        )
 
-        # Enable http verbosity
-        if int(debug) >= 1:
-            self.debug = int(debug)
-            httplib.HTTPConnection.debuglevel = self.debug
+        if engine == "async":
+            s.async_engine = AsyncEngine(s)
+        elif engine == "requests":
+            s.async_engine = None
+        else:
+            raise ValueError("Unknown session engine: %s" % engine)
 
         self._cache.register(session, alias=alias)
         return session
@@ -127,6 +308,23 @@ class SessionKeywords(RequestsKeywords):
         disable_warnings=0,
         retry_status_list=[],
         retry_method_list=DEFAULT_RETRY_METHOD_LIST,
+        pool_connections=10,
+        pool_maxsize=10,
+        pool_block=False,
+        engine="requests",
+        http2=False,
+        log_mode=None,
+        log_sample_rate=None,
+        log_byte_budget=None,
+        cache=False,
+        cache_max_entries=1000,
+        cache_max_bytes=67108864,
+        replay=None,
+        replay_mode="new_episodes",
+        replay_match="method,url",
+        compress_requests=None,
+        compress_min_size=1024,
+        max_decoded_size=None,
     ):
         """Create Session: create a HTTP session to a server
 
@@ -147,8 +345,8 @@ class SessionKeywords(RequestsKeywords):
 
         ``verify`` Whether the SSL cert will be verified. A CA_BUNDLE path can also be provided.
 
-        ``debug`` Enable http verbosity option more information. Valid values are 0, 1, 2 ...
-                https://docs.python.org/2/library/httplib.html#httplib.HTTPConnection.set_debuglevel
+        ``debug`` Enables the wire trace of the session requests when 1 or more: request line,
+        headers, status line, body byte counts and timings of each request are logged at DEBUG level.
 
         ``max_retries`` Number of maximum retries each connection should attempt.
                         By default it will retry 3 times in case of connection errors only.
@@ -171,6 +369,87 @@ class SessionKeywords(RequestsKeywords):
                               eg. set to [502, 503] to retry requests if those status are returned.
                               Note that max_retries must be greater than 0.
 
+        ``pool_connections`` Number of connection pools to cache, one pool is used for each different host.
+
+        ``pool_maxsize`` Maximum number of connections to keep alive in each pool.
+                         When the session is used by many threads at the same time, connections above this
+                         number are discarded once the request is completed, unless ``pool_block`` is set.
+
+        ``pool_block`` Whether the connection pool should block waiting for a free connection
+                       instead of opening a new one when ``pool_maxsize`` is reached.
+
+        ``engine`` Set to ``async`` to enable the `* On Session Async` keywords on this session,
+                   they send the requests with the asyncio ``httpx`` client that must be installed.
+                   With the async engine `Send Requests Concurrently` runs the requests on the
+                   Robot Framework event loop instead of a pool of threads.
+                   Defaults to ``requests``, the `* On Session` keywords always use requests.
+
+        ``http2`` Send the requests with an HTTP/2 capable transport, that requires ``httpx`` and ``h2``
+                  to be installed. When the server supports it, many concurrent requests to the same host
+                  share a single connection instead of opening one for each request, otherwise HTTP/1.1 is used.
+                  Responses are the same of the other sessions, ``${resp.raw.version}`` is ``20`` for HTTP/2.
+                  With HTTP/2 only connection errors are retried, ``retry_status_list`` is ignored.
+
+        ``log_mode`` How requests and responses of this session are logged, ``full`` or ``on_failure``.
+                     By default the ``log_mode`` of the library import is used, see `Importing`.
+
+        ``log_sample_rate`` Log only one request every ``log_sample_rate`` of this session.
+                            By default the ``log_sample_rate`` of the library import is used.
+
+        ``log_byte_budget`` Maximum size of the bodies logged for this session in each suite.
+                            By default the ``log_byte_budget`` of the library import is used.
+
+        ``cache`` Keep the responses of GET requests in memory and reuse them following
+                  the HTTP caching headers, like a browser does. Fresh responses, by Cache-Control
+                  max-age, Expires or Last-Modified, are returned without sending the request,
+                  stale ones with an ETag or Last-Modified are revalidated with a conditional request.
+                  Responses from the cache have ``${resp.from_cache}`` set to True.
+                  The `* On Session Async` keywords don't use the cache.
+
+        ``cache_max_entries`` Maximum number of responses in the cache, the least recently used
+                              ones are evicted first.
+
+        ``cache_max_bytes`` Maximum size of the bodies of the responses in the cache, 64 MiB by default.
+
+        ``replay`` Path of a cassette file where the requests and responses of the session are recorded,
+                   to play them back later without the network. Responses played back from the cassette
+                   have ``${resp.replayed}`` set to True. The `* On Session Async` keywords don't use it.
+
+        ``replay_mode`` ``record`` sends all the requests and records them in a new cassette,
+                        ``replay`` plays back all the requests and fails the ones that are not recorded,
+                        ``new_episodes``, the default, plays back the recorded requests and records the others.
+
+        ``replay_match`` Comma separated attributes that a request must have equal to the recorded one
+                         to be played back: ``method``, ``url``, ``body`` and ``headers``, that compares
+                         only the ``Accept``, ``Accept-Language`` and ``Content-Type`` headers.
+                         Other headers can be compared one by one with ``header:<name>``,
+                         like ``method,url,header:X-Tenant``.
+                         Defaults to ``method,url``. Requests that match more than one recorded request
+                         get their responses in the recorded order.
+                         The ``Authorization``, ``Proxy-Authorization`` and ``Cookie`` headers
+                         are masked in the cassette.
+
+        ``compress_requests`` Compress the request bodies with ``gzip``, ``deflate`` or ``zstd``,
+                              that requires ``zstandard`` to be installed, like with
+                              ``pip install robotframework-requests[compression]``, and send them with the
+                              ``Content-Encoding`` header. Files and other streamed bodies are compressed
+                              while they are sent with ``Transfer-Encoding: chunked``. Bodies that already
+                              have a ``Content-Encoding`` header are sent as they are.
+                              The `* On Session Async` keywords don't compress the bodies.
+
+        ``compress_min_size`` Minimum size in bytes of the request bodies that are compressed, 1024 by default.
+                              Streamed bodies of unknown length are always compressed.
+
+        ``max_decoded_size`` Maximum size in bytes of the decoded response bodies. Bodies are decoded
+                             one chunk at a time while they are read, and the request fails with a
+                             ``ContentDecodingError`` as soon as the limit is exceeded, so that a
+                             compressed response, like a decompression bomb, is never decoded whole.
+                             The responses are decoded from gzip and deflate, and from br and zstd
+                             when the ``compression`` extra is installed with
+                             ``pip install robotframework-requests[compression]``, the ``Accept-Encoding``
+                             header advertises only the ones that can be decoded.
+                             The `* On Session Async` keywords don't check the limit.
+
         """
         auth = requests.auth.HTTPBasicAuth(*auth) if auth else None
 
@@ -195,6 +474,92 @@ class SessionKeywords(RequestsKeywords):
             disable_warnings=disable_warnings,
             retry_status_list=retry_status_list,
             retry_method_list=retry_method_list,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            engine=engine,
+            http2=http2,
+            log_mode=log_mode,
+            log_sample_rate=log_sample_rate,
+            log_byte_budget=log_byte_budget,
+            cache=cache,
+            cache_max_entries=cache_max_entries,
+            cache_max_bytes=cache_max_bytes,
+            replay=replay,
+            replay_mode=replay_mode,
+            replay_match=replay_match,
+            compress_requests=compress_requests,
+            compress_min_size=compress_min_size,
+            max_decoded_size=max_decoded_size,
+        )
+
+    @keyword("Create App Session")
+    def create_app_session(
+        self,
+        alias,
+        app,
+        url="http://testserver",
+        headers={},
+        cookies={},
+        auth=None,
+        log_mode=None,
+        log_sample_rate=None,
+        log_byte_budget=None,
+    ):
+        """Create App Session: create a HTTP session that calls a Python web application in process
+
+        ``alias`` Robot Framework alias to identify the session
+
+        ``app`` WSGI application, like Flask or Django, or ASGI application, like FastAPI or Starlette.
+                It can be the application object or its ``module:app`` name, like ``myservice.main:app``,
+                the module must be importable from the Robot Framework ``PYTHONPATH``.
+
+        ``url`` Base url of the requests, only its scheme, host and port are visible to the application
+
+        ``headers`` Dictionary of default headers
+
+        ``cookies`` Dictionary of cookies
+
+        ``auth`` List of username & password for HTTP Basic Auth
+
+        ``log_mode``, ``log_sample_rate`` and ``log_byte_budget`` as in `Create Session`.
+
+        The application is called in the Robot Framework process for each request,
+        without any server nor socket, all the `* On Session` keywords can be used.
+        ASGI applications are called on a new event loop for each request and they
+        don't receive lifespan events. Exceptions raised by the application are not
+        converted to error responses, so they fail the keyword with their own message.
+
+        |   Create App Session    service    myservice.main:app
+        |   ${resp}=    GET On Session    service    /health    expected_status=200
+        """
+        auth = requests.auth.HTTPBasicAuth(*auth) if auth else None
+        transport = build_app_adapter(app)
+
+        logger.info(
+            "Creating App Session using : alias=%s, app=%s, url=%s, headers=%s, \
+                    cookies=%s, auth=%s"
+            % (alias, app, url, headers, cookies, auth)
+        )
+        return self._create_session(
+            alias=alias,
+            url=url,
+            headers=headers,
+            cookies=cookies,
+            auth=auth,
+            timeout=None,
+            proxies=None,
+            verify=False,
+            debug=0,
+            max_retries=0,
+            backoff_factor=0,
+            disable_warnings=0,
+            retry_status_list=[],
+            retry_method_list=self.DEFAULT_RETRY_METHOD_LIST,
+            log_mode=log_mode,
+            log_sample_rate=log_sample_rate,
+            log_byte_budget=log_byte_budget,
+            transport=transport,
         )
 
     @keyword("Create Client Cert Session")
@@ -215,6 +580,9 @@ class SessionKeywords(RequestsKeywords):
         disable_warnings=0,
         retry_status_list=[],
         retry_method_list=DEFAULT_RETRY_METHOD_LIST,
+        pool_connections=10,
+        pool_maxsize=10,
+        pool_block=False,
     ):
         """Create Session: create a HTTP session to a server
 
@@ -238,8 +606,8 @@ class SessionKeywords(RequestsKeywords):
         ``verify`` Whether the SSL cert will be verified. A CA_BUNDLE path can also be provided.
                  Defaults to False.
 
-        ``debug`` Enable http verbosity option more information. Valid values are 0, 1, 2 ...
-                https://docs.python.org/2/library/httplib.html#httplib.HTTPConnection.set_debuglevel
+        ``debug`` Enables the wire trace of the session requests when 1 or more: request line,
+        headers, status line, body byte counts and timings of each request are logged at DEBUG level.
 
         ``max_retries`` Number of maximum retries each connection should attempt.
                         By default it will retry 3 times in case of connection errors only.
@@ -261,6 +629,15 @@ class SessionKeywords(RequestsKeywords):
         ``retry_status_list`` List of integer HTTP status codes that, if returned, a retry is attempted.
                               eg. set to [502, 503] to retry requests if those status are returned.
                               Note that max_retries must be greater than 0.
+
+        ``pool_connections`` Number of connection pools to cache, one pool is used for each different host.
+
+        ``pool_maxsize`` Maximum number of connections to keep alive in each pool.
+                         When the session is used by many threads at the same time, connections above this
+                         number are discarded once the request is completed, unless ``pool_block`` is set.
+
+        ``pool_block`` Whether the connection pool should block waiting for a free connection
+                       instead of opening a new one when ``pool_maxsize`` is reached.
         """
         auth = requests.auth.HTTPBasicAuth(*auth) if auth else None
 
@@ -297,6 +674,9 @@ class SessionKeywords(RequestsKeywords):
             disable_warnings=disable_warnings,
             retry_status_list=retry_status_list,
             retry_method_list=retry_method_list,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
         )
 
         session.cert = tuple(client_certs)
@@ -319,6 +699,9 @@ class SessionKeywords(RequestsKeywords):
         disable_warnings=0,
         retry_status_list=[],
         retry_method_list=DEFAULT_RETRY_METHOD_LIST,
+        pool_connections=10,
+        pool_maxsize=10,
+        pool_block=False,
     ):
         """Create Session: create a HTTP session to a server
 
@@ -341,8 +724,8 @@ class SessionKeywords(RequestsKeywords):
         ``verify`` Whether the SSL cert will be verified. A CA_BUNDLE path can also be provided.
                  Defaults to False.
 
-        ``debug`` Enable http verbosity option more information. Valid values are 0, 1, 2 ...
-                https://docs.python.org/2/library/httplib.html#httplib.HTTPConnection.set_debuglevel
+        ``debug`` Enables the wire trace of the session requests when 1 or more: request line,
+        headers, status line, body byte counts and timings of each request are logged at DEBUG level.
 
         ``max_retries`` Number of maximum retries each connection should attempt.
                         By default it will retry 3 times in case of connection errors only.
@@ -364,6 +747,15 @@ class SessionKeywords(RequestsKeywords):
         ``retry_status_list`` List of integer HTTP status codes that, if returned, a retry is attempted.
                               eg. set to [502, 503] to retry requests if those status are returned.
                               Note that max_retries must be greater than 0.
+
+        ``pool_connections`` Number of connection pools to cache, one pool is used for each different host.
+
+        ``pool_maxsize`` Maximum number of connections to keep alive in each pool.
+                         When the session is used by many threads at the same time, connections above this
+                         number are discarded once the request is completed, unless ``pool_block`` is set.
+
+        ``pool_block`` Whether the connection pool should block waiting for a free connection
+                       instead of opening a new one when ``pool_maxsize`` is reached.
         """
 
         logger.info(
@@ -388,6 +780,9 @@ class SessionKeywords(RequestsKeywords):
             disable_warnings=disable_warnings,
             retry_status_list=retry_status_list,
             retry_method_list=retry_method_list,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
         )
 
     @keyword("Create Digest Session")
@@ -407,6 +802,9 @@ class SessionKeywords(RequestsKeywords):
         disable_warnings=0,
         retry_status_list=[],
         retry_method_list=DEFAULT_RETRY_METHOD_LIST,
+        pool_connections=10,
+        pool_maxsize=10,
+        pool_block=False,
     ):
         """Create Session: create a HTTP session to a server
 
@@ -428,8 +826,8 @@ class SessionKeywords(RequestsKeywords):
         ``verify`` Whether the SSL cert will be verified. A CA_BUNDLE path can also be provided.
                  Defaults to False.
 
-        ``debug`` Enable http verbosity option more information. Valid values are 0, 1, 2 ...
-                https://docs.python.org/2/library/httplib.html#httplib.HTTPConnection.set_debuglevel
+        ``debug`` Enables the wire trace of the session requests when 1 or more: request line,
+        headers, status line, body byte counts and timings of each request are logged at DEBUG level.
 
         ``max_retries`` Number of maximum retries each connection should attempt.
                         By default it will retry 3 times in case of connection errors only.
@@ -451,6 +849,15 @@ class SessionKeywords(RequestsKeywords):
         ``retry_status_list`` List of integer HTTP status codes that, if returned, a retry is attempted.
                               eg. set to [502, 503] to retry requests if those status are returned.
                               Note that max_retries must be greater than 0.
+
+        ``pool_connections`` Number of connection pools to cache, one pool is used for each different host.
+
+        ``pool_maxsize`` Maximum number of connections to keep alive in each pool.
+                         When the session is used by many threads at the same time, connections above this
+                         number are discarded once the request is completed, unless ``pool_block`` is set.
+
+        ``pool_block`` Whether the connection pool should block waiting for a free connection
+                       instead of opening a new one when ``pool_maxsize`` is reached.
         """
         digest_auth = requests.auth.HTTPDigestAuth(*auth) if auth else None
 
@@ -469,6 +876,9 @@ class SessionKeywords(RequestsKeywords):
             disable_warnings=disable_warnings,
             retry_status_list=retry_status_list,
             retry_method_list=retry_method_list,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
         )
 
     @keyword("Create Ntlm Session")
@@ -488,6 +898,9 @@ class SessionKeywords(RequestsKeywords):
         disable_warnings=0,
         retry_status_list=[],
         retry_method_list=DEFAULT_RETRY_METHOD_LIST,
+        pool_connections=10,
+        pool_maxsize=10,
+        pool_block=False,
     ):
         """Create Session: create a HTTP session to a server
 
@@ -509,8 +922,8 @@ class SessionKeywords(RequestsKeywords):
         ``verify`` Whether the SSL cert will be verified. A CA_BUNDLE path can also be provided.
                  Defaults to False.
 
-        ``debug`` Enable http verbosity option more information. Valid values are 0, 1, 2 ...
-                https://docs.python.org/2/library/httplib.html#httplib.HTTPConnection.set_debuglevel
+        ``debug`` Enables the wire trace of the session requests when 1 or more: request line,
+        headers, status line, body byte counts and timings of each request are logged at DEBUG level.
 
         ``max_retries`` Number of maximum retries each connection should attempt.
                         By default it will retry 3 times in case of connection errors only.
@@ -532,6 +945,15 @@ class SessionKeywords(RequestsKeywords):
         ``retry_status_list`` List of integer HTTP status codes that, if returned, a retry is attempted.
                               eg. set to [502, 503] to retry requests if those status are returned.
                               Note that max_retries must be greater than 0.
+
+        ``pool_connections`` Number of connection pools to cache, one pool is used for each different host.
+
+        ``pool_maxsize`` Maximum number of connections to keep alive in each pool.
+                         When the session is used by many threads at the same time, connections above this
+                         number are discarded once the request is completed, unless ``pool_block`` is set.
+
+        ``pool_block`` Whether the connection pool should block waiting for a free connection
+                       instead of opening a new one when ``pool_maxsize`` is reached.
         """
         try:
             HttpNtlmAuth
@@ -576,6 +998,9 @@ class SessionKeywords(RequestsKeywords):
                 disable_warnings=disable_warnings,
                 retry_status_list=retry_status_list,
                 retry_method_list=retry_method_list,
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
             )
 
     @keyword("Session Exists")
@@ -590,11 +1015,50 @@ class SessionKeywords(RequestsKeywords):
         except RuntimeError:
             return False
 
+    @keyword("Get Session Statistics")
+    def get_session_statistics(self, alias, reset=False):
+        """Returns the statistics of the requests sent on the session
+
+        ``alias`` that has been used to identify the Session object in the cache
+
+        ``reset`` clears the statistics after they are returned, by default is False.
+
+        The result is a dictionary with the total ``count`` of requests, the ``errors``
+        (failed requests and responses with a 4xx or 5xx status), the received ``bytes``
+        and the ``p50``, ``p90``, ``p99`` and ``max`` response times in seconds.
+        The ``requests`` key contains the same statistics by method and URL template,
+        where numeric, uuid and hexadecimal path segments are replaced by ``{id}``
+        like in ``GET /posts/{id}``. Only the first 100 templates are kept, the requests
+        of any other template are counted together in the ``other`` key.
+
+        Response times are recorded in a fixed size histogram, so memory doesn't grow
+        with the number of requests and percentiles have a precision of about 2%.
+
+        Sessions created with ``cache`` also have a ``cache`` key with the ``hits`` and
+        ``misses`` of the cache, and the number of ``entries`` and ``bytes`` it contains.
+        Responses served from the cache are counted as requests too.
+
+        |   ${stats}=    Get Session Statistics    jsonplaceholder
+        |   Should Be True    ${stats}[p99] < 0.5
+        |   Should Be Equal As Integers    ${stats}[requests][GET /posts/{id}][errors]    0
+        """
+        session = self._cache.switch(alias)
+        statistics = session.statistics
+        summary = statistics.summary()
+        if getattr(session, "response_cache", None) is not None:
+            summary["cache"] = session.response_cache.summary()
+        if self.builtin.convert_to_boolean(reset):
+            statistics.reset()
+        return summary
+
     @keyword("Delete All Sessions")
     def delete_all_sessions(self):
         """Removes all the session objects"""
         logger.info("Deleting All Sessions")
 
+        for session in self._cache:
+            if session.async_engine:
+                session.async_engine.close()
         self._cache.close_all()
 
     # TODO this is not covered by any tests
@@ -609,8 +1073,8 @@ class SessionKeywords(RequestsKeywords):
         session.headers = merge_setting(headers, session.headers)
         session.cookies = merge_cookies(session.cookies, cookies)
 
-    @staticmethod
-    def _check_status(expected_status, resp, msg=None):
+    @flush_traffic_log_on_failure
+    def _check_status(self, expected_status, resp, msg=None):
         """
         Helper method to check HTTP status
         """
@@ -631,29 +1095,31 @@ class SessionKeywords(RequestsKeywords):
             msg = "{}Url: {} Expected status".format(msg, resp.url)
             assert_equal(resp.status_code, expected_status, msg)
 
-    def _get_timeout(self, timeout):
-        result = timeout if timeout is not None else self.timeout
+    @flush_traffic_log_on_failure
+    def _check_response_time(self, max_time, resp, msg=None):
+        """
+        Helper method to check the HTTP response time
+        """
+        if max_time is None:
+            return
+        if not isinstance(resp, Response):
+            raise InvalidResponse(resp)
+        max_seconds = timestr_to_secs(max_time)
+        elapsed = resp.elapsed.total_seconds()
+        if elapsed >= max_seconds:
+            msg = "" if msg is None else "{} ".format(msg)
+            raise AssertionError(
+                "{}Url: {} Response time {:.3f}s is not less than {:.3f}s".format(
+                    msg, resp.url, elapsed, max_seconds
+                )
+            )
+
+    @staticmethod
+    def _get_timeout(session, timeout):
+        result = timeout if timeout is not None else getattr(session, "timeout", None)
 
         if result is None:
             return None
         if type(result) is tuple:
             return (float(result[0]), float(result[1]))
         return float(result)
-
-    def _capture_output(self):
-        if self.debug >= 1:
-            self.http_log = utils.WritableObject()
-            sys.stdout = self.http_log
-
-    def _print_debug(self):
-        if self.debug >= 1:
-            sys.stdout = sys.__stdout__  # Restore stdout
-            debug_info = (
-                "".join(self.http_log.content).replace("\\r", "").replace("'", "")
-            )
-
-            # Remove empty lines
-            debug_info = "\n".join(
-                [ll.rstrip() for ll in debug_info.splitlines() if ll.strip()]
-            )
-            logger.debug(debug_info)
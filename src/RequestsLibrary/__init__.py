@@ -90,6 +90,7 @@ class RequestsLibrary(RequestsOnSessionKeywords):
        | ok      | Returns True if status_code is less than 400, False if not. |
        | reason  | Textual reason of responded HTTP Status, e.g. ``Not Found`` or ``OK``. |
        | status_code | Integer Code of responded HTTP Status, e.g. 404 or 200. |
+       | timings | Durations in seconds of the request phases: ``dns``, ``connect``, ``tls``, ``ttfb`` (time to first byte, connection setup excluded), ``download`` (reading the body) and ``total``. For example ``${response.timings.ttfb}``. The connection setup phases are 0 when an open connection is reused. Timings are logged at ``DEBUG`` level. |
        | text    | Content of the response, in unicode. If ``response.encoding`` is ``None``, encoding will be guessed using chardet. The encoding of the response content is determined based solely on HTTP headers, following RFC 2616 to the letter. If you can take advantage of non-HTTP knowledge to make a better guess at the encoding, you should set ``response.encoding`` appropriately before accessing this property. |
        | url     | Final URL location of Response. |
 
@@ -109,6 +110,10 @@ class RequestsLibrary(RequestsOnSessionKeywords):
        |
        |       ${resp}=    POST  https://someurl  files=${files}
 
+       Files opened in binary mode, like the ones of `Get File For Streaming Upload`, are streamed from
+       disk while the request is sent, with a ``Content-Length`` computed upfront, so that the memory
+       used doesn't depend on the size of the files. The other fields and files are encoded in memory as usual.
+
        You can find a working test example in `atests/test_post_multipart.robot`.
 
        For a complete reference verify the official Requests documentation:
@@ -128,3 +133,58 @@ class RequestsLibrary(RequestsOnSessionKeywords):
 
     __version__ = VERSION
     ROBOT_LIBRARY_SCOPE = "GLOBAL"
+
+    def __init__(
+        self,
+        session_less_keep_alive=False,
+        log_binary_digest=None,
+        log_mode="full",
+        log_buffer_size=10,
+        log_sample_rate=1,
+        log_byte_budget=None,
+    ):
+        """
+        ``session_less_keep_alive`` Recycle the connections of the session-less keywords like `GET` or `POST`.
+        By default each of them opens a brand new connection, with the DNS, TCP and SSL handshake
+        repeated for every request. When enabled, connections are kept alive in a library wide pool,
+        one for each scheme and host, and reused by the following requests.
+        Cookies and headers are still not shared among session-less requests.
+
+        ``log_binary_digest`` Digest algorithm, like ``sha256`` or ``md5``, used to log a checksum
+        of binary request and response bodies. Binary bodies, like images or files, are never
+        decoded in the log, only their length, content type and the hex of the first bytes are logged.
+        By default no digest is computed.
+
+        ``log_mode`` How requests and responses are logged. With ``full``, the default, every request
+        and response is logged with headers and body. With ``on_failure`` only a one line summary
+        of each request is logged, while the last ``log_buffer_size`` requests and responses are kept
+        in memory and logged in full only when a status or response time check of the library fails,
+        or when a request can't be sent. It keeps the log small in polling loops and long suites.
+        Sessions can override it with the ``log_mode`` argument of `Create Session`.
+
+        ``log_sample_rate`` Log only one request every ``log_sample_rate``, by default all of them are logged.
+        The number of requests not logged is reported in the log of the next logged one
+        and at the end of each test.
+
+        ``log_byte_budget`` Maximum size, in characters, of the request and response bodies logged in each
+        suite. Once the budget is spent requests and responses are still logged, but without bodies,
+        and their number is reported at the end of each test. By default there's no limit.
+
+        Sessions can override ``log_sample_rate`` and ``log_byte_budget`` with the arguments
+        of `Create Session`, they are sampled and budgeted apart from the other requests.
+        A failure in ``on_failure`` mode always logs the buffered requests in full.
+
+        |   ***** Settings *****
+        |   Library    RequestsLibrary    session_less_keep_alive=${True}
+        |   Library    RequestsLibrary    log_binary_digest=sha256
+        |   Library    RequestsLibrary    log_mode=on_failure    log_buffer_size=20
+        |   Library    RequestsLibrary    log_sample_rate=100    log_byte_budget=1000000
+        """
+        super(RequestsLibrary, self).__init__(
+            session_less_keep_alive=session_less_keep_alive,
+            log_binary_digest=log_binary_digest,
+            log_mode=log_mode,
+            log_buffer_size=log_buffer_size,
+            log_sample_rate=log_sample_rate,
+            log_byte_budget=log_byte_budget,
+        )
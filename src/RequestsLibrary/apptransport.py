@@ -0,0 +1,235 @@
+import asyncio
+import importlib
+import inspect
+import io
+import sys
+
+from requests.adapters import BaseAdapter
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from RequestsLibrary.compat import httplib, unquote_to_bytes, urlparse
+from RequestsLibrary.replay import BufferedRawResponse
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def import_app(app):
+    """
+    Returns the application object of a ``module:app`` string, any other value
+    is returned as it is. The attribute can be dotted, like ``module:factory.app``.
+    """
+    if not isinstance(app, str):
+        return app
+    module_name, _, attribute = app.partition(":")
+    if not module_name or not attribute:
+        raise ValueError("App must be in module:app format: %s" % app)
+    app = importlib.import_module(module_name)
+    for name in attribute.split("."):
+        app = getattr(app, name)
+    return app
+
+
+def is_asgi_app(app):
+    call = app if inspect.isfunction(app) else getattr(app, "__call__", None)
+    return inspect.iscoroutinefunction(app) or inspect.iscoroutinefunction(call)
+
+
+def read_body(body):
+    """
+    Reads the whole request body, whatever type requests prepared it with.
+    """
+    if body is None:
+        return b""
+    if isinstance(body, str):
+        return body.encode("utf-8")
+    if isinstance(body, bytes):
+        return body
+    if hasattr(body, "read"):
+        data = body.read()
+    else:
+        data = b"".join(
+            chunk.encode("utf-8") if isinstance(chunk, str) else chunk for chunk in body
+        )
+    return data.encode("utf-8") if isinstance(data, str) else data
+
+
+def build_app_response(request, status_code, reason, headers, content):
+    response = Response()
+    response.status_code = status_code
+    response.reason = reason
+    response.url = request.url
+    response.headers = CaseInsensitiveDict()
+    for name, value in headers:
+        if name in response.headers:
+            response.headers[name] = "%s, %s" % (response.headers[name], value)
+        else:
+            response.headers[name] = value
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.raw = BufferedRawResponse(status_code, reason, headers, content)
+    response._content = content
+    response._content_consumed = True
+    response.request = request
+    return response
+
+
+class WSGIAdapter(BaseAdapter):
+    """
+    Transport adapter that calls a WSGI application in process, without sockets.
+    """
+
+    def __init__(self, app):
+        super(WSGIAdapter, self).__init__()
+        self.app = app
+
+    def build_environ(self, request, body):
+        url = urlparse(request.url)
+        environ = {
+            "REQUEST_METHOD": request.method,
+            "SCRIPT_NAME": "",
+            "PATH_INFO": unquote_to_bytes(url.path or "/").decode("latin-1"),
+            "QUERY_STRING": url.query,
+            "SERVER_NAME": url.hostname or "localhost",
+            "SERVER_PORT": str(url.port or DEFAULT_PORTS.get(url.scheme, 80)),
+            "SERVER_PROTOCOL": "HTTP/1.1",
+            "REMOTE_ADDR": "127.0.0.1",
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": url.scheme,
+            "wsgi.input": io.BytesIO(body),
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": False,
+            "wsgi.run_once": False,
+        }
+        for name, value in request.headers.items():
+            key = name.upper().replace("-", "_")
+            if key in ("CONTENT_TYPE", "CONTENT_LENGTH"):
+                environ[key] = value
+            else:
+                environ["HTTP_" + key] = value
+        if body and "CONTENT_LENGTH" not in environ:
+            environ["CONTENT_LENGTH"] = str(len(body))
+        return environ
+
+    def send(self, request, **kwargs):
+        status_and_headers = []
+
+        def start_response(status, headers, exc_info=None):
+            # Nothing is sent before the app returns, so an error page can always replace the response
+            status_and_headers[:] = [status, headers]
+            return chunks.append
+
+        chunks = []
+        body = read_body(request.body)
+        result = self.app(self.build_environ(request, body), start_response)
+        try:
+            for chunk in result:
+                chunks.append(chunk)
+        finally:
+            if hasattr(result, "close"):
+                result.close()
+
+        status, headers = status_and_headers
+        code, _, reason = status.partition(" ")
+        return build_app_response(request, int(code), reason, headers, b"".join(chunks))
+
+    def close(self):
+        pass
+
+
+class ASGIAdapter(BaseAdapter):
+    """
+    Transport adapter that calls an ASGI application in process, without sockets.
+    Each request runs the application on a new event loop, lifespan events are not sent.
+    """
+
+    def __init__(self, app):
+        super(ASGIAdapter, self).__init__()
+        self.app = app
+
+    def build_scope(self, request):
+        url = urlparse(request.url)
+        path = url.path or "/"
+        return {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": request.method,
+            "scheme": url.scheme,
+            "path": unquote_to_bytes(path).decode("utf-8", errors="replace"),
+            "raw_path": path.encode("ascii"),
+            "query_string": url.query.encode("ascii"),
+            "root_path": "",
+            "headers": [
+                (name.lower().encode("latin-1"), value.encode("latin-1"))
+                for name, value in request.headers.items()
+            ],
+            "client": ("127.0.0.1", 0),
+            "server": (
+                url.hostname or "localhost",
+                url.port or DEFAULT_PORTS.get(url.scheme, 80),
+            ),
+        }
+
+    async def call_app(self, scope, body):
+        response = {"status": None, "headers": [], "chunks": []}
+        completed = asyncio.Event()
+        request_sent = False
+
+        async def receive():
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            await completed.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+                response["headers"] = [
+                    (name.decode("latin-1"), value.decode("latin-1"))
+                    for name, value in message.get("headers", [])
+                ]
+            elif message["type"] == "http.response.body":
+                response["chunks"].append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    completed.set()
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            completed.set()
+        return response
+
+    def send(self, request, **kwargs):
+        loop = asyncio.new_event_loop()
+        try:
+            response = loop.run_until_complete(
+                self.call_app(self.build_scope(request), read_body(request.body))
+            )
+        finally:
+            loop.close()
+        if response["status"] is None:
+            raise RuntimeError("ASGI app returned without starting the response")
+        return build_app_response(
+            request,
+            response["status"],
+            httplib.responses.get(response["status"], ""),
+            response["headers"],
+            b"".join(response["chunks"]),
+        )
+
+    def close(self):
+        pass
+
+
+def build_app_adapter(app):
+    """
+    Returns the adapter that calls ``app``, a WSGI or ASGI application or its ``module:app`` name.
+    """
+    app = import_app(app)
+    if not callable(app):
+        raise ValueError("App is not callable: %s" % app)
+    return ASGIAdapter(app) if is_asgi_app(app) else WSGIAdapter(app)
@@ -0,0 +1,300 @@
+import threading
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+
+from requests.adapters import BaseAdapter
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+
+CACHEABLE_METHODS = ("GET",)
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS", "TRACE")
+# Status codes that can be cached without explicit freshness, RFC 7231 6.1
+HEURISTICALLY_CACHEABLE_STATUS = (200, 203, 204, 300, 301, 308, 404, 405, 410, 414, 501)
+# Headers of a 304 response that must not replace the stored ones
+NOT_UPDATED_HEADERS = ("content-length", "content-encoding", "transfer-encoding")
+
+
+def parse_cache_control(value):
+    """
+    Parses a Cache-Control header to a dictionary of lower case directives,
+    directives without argument have None as value.
+    """
+    directives = {}
+    for directive in (value or "").split(","):
+        name, _, argument = directive.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') if argument else None
+    return directives
+
+
+def parse_http_date(value):
+    """
+    Returns the epoch time of an HTTP date, None if it's missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def parse_seconds(value):
+    try:
+        return max(int(value), 0)
+    except (TypeError, ValueError):
+        return None
+
+
+class CacheEntry(object):
+    """
+    A stored response with the times needed to compute its age, RFC 7234 4.2.3.
+    """
+
+    def __init__(self, response, request_time, response_time):
+        self.status_code = response.status_code
+        self.reason = response.reason
+        self.url = response.url
+        self.encoding = response.encoding
+        self.headers = CaseInsensitiveDict(response.headers)
+        self.content = response.content
+        self.vary = dict(
+            (name, response.request.headers.get(name))
+            for name in self.vary_headers()
+        )
+        self.update(request_time, response_time)
+
+    def update(self, request_time, response_time, headers=None):
+        if headers:
+            for name, value in headers.items():
+                if name.lower() not in NOT_UPDATED_HEADERS:
+                    self.headers[name] = value
+        self.request_time = request_time
+        self.response_time = response_time
+
+    def vary_headers(self):
+        vary = self.headers.get("Vary", "")
+        return [name.strip() for name in vary.split(",") if name.strip()]
+
+    def matches(self, request):
+        return all(request.headers.get(name) == value for name, value in self.vary.items())
+
+    def age(self, now):
+        date = parse_http_date(self.headers.get("Date"))
+        apparent_age = max(self.response_time - date, 0) if date is not None else 0
+        age = parse_seconds(self.headers.get("Age")) or 0
+        response_delay = self.response_time - self.request_time
+        corrected_initial_age = max(apparent_age, age + response_delay)
+        return corrected_initial_age + now - self.response_time
+
+    def _date(self):
+        date = parse_http_date(self.headers.get("Date"))
+        return date if date is not None else self.response_time
+
+    def freshness_lifetime(self):
+        cache_control = parse_cache_control(self.headers.get("Cache-Control"))
+        if "max-age" in cache_control:
+            return parse_seconds(cache_control["max-age"]) or 0
+        if "Expires" in self.headers:
+            expires = parse_http_date(self.headers["Expires"])
+            # Invalid dates, like 0, mean already expired
+            return max(expires - self._date(), 0) if expires is not None else 0
+        last_modified = parse_http_date(self.headers.get("Last-Modified"))
+        if last_modified is not None and self.status_code in HEURISTICALLY_CACHEABLE_STATUS:
+            # 10% of the time since the last modification, RFC 7234 4.2.2
+            return max(self._date() - last_modified, 0) / 10
+        return 0
+
+    def is_fresh(self, now):
+        cache_control = parse_cache_control(self.headers.get("Cache-Control"))
+        if "no-cache" in cache_control:
+            return False
+        return self.freshness_lifetime() > self.age(now)
+
+    def validators(self):
+        """
+        Returns the headers of a conditional request to revalidate the entry.
+        """
+        headers = {}
+        if "ETag" in self.headers:
+            headers["If-None-Match"] = self.headers["ETag"]
+        if "Last-Modified" in self.headers:
+            headers["If-Modified-Since"] = self.headers["Last-Modified"]
+        return headers
+
+    def build_response(self, request, now):
+        response = Response()
+        response.status_code = self.status_code
+        response.reason = self.reason
+        response.url = self.url
+        response.encoding = self.encoding
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.headers["Age"] = str(int(self.age(now)))
+        response._content = self.content
+        response._content_consumed = True
+        response.request = request
+        response.from_cache = True
+        return response
+
+
+class ResponseCache(object):
+    """
+    In memory store of the responses of a session, with least recently used
+    eviction when there are more than ``max_entries`` or their bodies are
+    bigger than ``max_bytes`` in total.
+    """
+
+    def __init__(self, max_entries=1000, max_bytes=64 * 1024 * 1024):
+        try:
+            max_entries = int(max_entries)
+            max_bytes = int(max_bytes)
+        except ValueError as err:
+            raise ValueError("Error converting cache parameter: %s" % err)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def record(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def summary(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "bytes": self.size,
+            }
+
+    def get(self, url):
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+
+    def put(self, url, entry):
+        if len(entry.content) > self.max_bytes:
+            self.delete(url)
+            return
+        with self._lock:
+            previous = self._entries.pop(url, None)
+            if previous is not None:
+                self.size -= len(previous.content)
+            self._entries[url] = entry
+            self.size += len(entry.content)
+            while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted.content)
+
+    def delete(self, url):
+        with self._lock:
+            entry = self._entries.pop(url, None)
+            if entry is not None:
+                self.size -= len(entry.content)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+class CachingAdapter(BaseAdapter):
+    """
+    Transport adapter that serves GET requests from a ``ResponseCache``, following
+    the rules of a private HTTP cache in RFC 7234, and sends the others to ``adapter``.
+
+    Fresh responses, according to Cache-Control max-age, Expires or Last-Modified,
+    are returned without any request. Stale ones are revalidated with a conditional
+    request when they have an ETag or a Last-Modified, a 304 response refreshes
+    and returns the stored one. Successful unsafe requests invalidate the entry of
+    their URL. Streamed requests are never served from, nor stored in, the cache.
+    """
+
+    def __init__(self, adapter, cache):
+        super(CachingAdapter, self).__init__()
+        self.adapter = adapter
+        self.cache = cache
+
+    def send(self, request, stream=False, **kwargs):
+        response = self._send(request, stream, **kwargs)
+        if not getattr(response, "from_cache", False):
+            response.from_cache = False
+        return response
+
+    def _send(self, request, stream, **kwargs):
+        if request.method not in CACHEABLE_METHODS:
+            response = self.adapter.send(request, stream=stream, **kwargs)
+            if request.method not in SAFE_METHODS and response.status_code < 400:
+                self.cache.delete(request.url)
+            return response
+        if stream:
+            return self.adapter.send(request, stream=stream, **kwargs)
+
+        request_cache_control = parse_cache_control(request.headers.get("Cache-Control"))
+        if "no-store" in request_cache_control:
+            return self.adapter.send(request, stream=stream, **kwargs)
+
+        entry = self.cache.get(request.url)
+        if entry is not None and not entry.matches(request):
+            entry = None
+        now = time.time()
+        if (
+            entry is not None
+            and "no-cache" not in request_cache_control
+            and entry.is_fresh(now)
+        ):
+            self.cache.record(hit=True)
+            return entry.build_response(request, now)
+        self.cache.record(hit=False)
+
+        sent_request = request
+        validators = entry.validators() if entry is not None else {}
+        if validators:
+            sent_request = request.copy()
+            sent_request.headers.update(validators)
+
+        request_time = time.time()
+        response = self.adapter.send(sent_request, stream=stream, **kwargs)
+        response_time = time.time()
+
+        if entry is not None and response.status_code == 304:
+            entry.update(request_time, response_time, response.headers)
+            self.cache.put(request.url, entry)
+            response.close()
+            return entry.build_response(request, response_time)
+
+        if self.is_cacheable(response):
+            self.cache.put(request.url, CacheEntry(response, request_time, response_time))
+        else:
+            self.cache.delete(request.url)
+        return response
+
+    @staticmethod
+    def is_cacheable(response):
+        cache_control = parse_cache_control(response.headers.get("Cache-Control"))
+        if "no-store" in cache_control or response.headers.get("Vary", "").strip() == "*":
+            return False
+        # Partial responses would need to be combined, they are never stored
+        if response.status_code in (206, 304):
+            return False
+        if "max-age" in cache_control or "Expires" in response.headers:
+            return True
+        if response.status_code not in HEURISTICALLY_CACHEABLE_STATUS:
+            return False
+        return "ETag" in response.headers or "Last-Modified" in response.headers
+
+    def close(self):
+        self.adapter.close()
@@ -0,0 +1,101 @@
+import time
+
+CHUNK_SIZE = 64 * 1024
+
+
+def check_chunk_size(chunk_size):
+    try:
+        chunk_size = int(chunk_size)
+    except ValueError as err:
+        raise ValueError("Error converting chunk size parameter: %s" % err)
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1: %s" % chunk_size)
+    return chunk_size
+
+
+def to_bytes(item):
+    if isinstance(item, bytes):
+        return item
+    if isinstance(item, bytearray):
+        return bytes(item)
+    return str(item).encode("utf-8")
+
+
+def iter_file_chunks(path, chunk_size=CHUNK_SIZE):
+    """
+    Reads the file at ``path`` in chunks, the file is opened only once the
+    first chunk is read and closed after the last one.
+    """
+    with open(path, "rb") as body:
+        for chunk in iter(lambda: body.read(chunk_size), b""):
+            yield chunk
+
+
+def iter_rechunked(items, chunk_size):
+    """
+    Joins and splits ``items`` in chunks of ``chunk_size`` bytes, the last one can be shorter.
+    """
+    buffer = bytearray()
+    for item in items:
+        buffer += to_bytes(item)
+        while len(buffer) >= chunk_size:
+            yield bytes(buffer[:chunk_size])
+            del buffer[:chunk_size]
+    if buffer:
+        yield bytes(buffer)
+
+
+class ChunkedBody(object):
+    """
+    Request body of unknown length that requests sends with ``Transfer-Encoding: chunked``,
+    one chunk for each item of ``chunks``. It counts the bytes and chunks sent
+    and the time spent sending them, so that they are logged instead of the body.
+
+    The body can be sent only once.
+    """
+
+    def __init__(self, chunks, source=None):
+        self._chunks = chunks
+        self.source = source
+        self.bytes_sent = 0
+        self.chunks_sent = 0
+        self.started = None
+        self.finished = None
+
+    def __iter__(self):
+        if self.started is None:
+            self.started = time.perf_counter()
+        for chunk in self._chunks:
+            chunk = to_bytes(chunk)
+            # An empty chunk would end the chunked body
+            if not chunk:
+                continue
+            self.bytes_sent += len(chunk)
+            self.chunks_sent += 1
+            yield chunk
+        self.finished = time.perf_counter()
+
+    @property
+    def elapsed(self):
+        if self.started is None:
+            return None
+        return (self.finished or time.perf_counter()) - self.started
+
+    def __repr__(self):
+        return format_chunked_body_to_log_string(self)
+
+
+def format_chunked_body_to_log_string(body):
+    summary = "<chunked body"
+    if body.source:
+        summary += " from %s" % body.source
+    summary += ", %d bytes in %d chunks" % (body.bytes_sent, body.chunks_sent)
+    elapsed = body.elapsed
+    if elapsed:
+        summary += " sent in %.3f s, %.1f KiB/s" % (
+            elapsed,
+            body.bytes_sent / 1024.0 / elapsed,
+        )
+    if body.finished is None:
+        summary += ", not completely sent"
+    return summary + ">"
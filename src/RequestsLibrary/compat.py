@@ -1,7 +1,9 @@
 import copy
 import http.client as httplib  # noqa
+from urllib.parse import unquote_to_bytes  # noqa
 from urllib.parse import urlencode  # noqa
 from urllib.parse import urljoin  # noqa
+from urllib.parse import urlparse  # noqa
 
 from requests.packages.urllib3.util import Retry
 
@@ -0,0 +1,211 @@
+import zlib
+from time import perf_counter
+
+from requests.adapters import BaseAdapter
+from requests.exceptions import ContentDecodingError
+
+from RequestsLibrary.chunked import ChunkedBody
+from RequestsLibrary.httpxclient import iter_body
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+REQUEST_ENCODINGS = ("gzip", "deflate", "zstd")
+DEFAULT_MIN_SIZE = 1024
+
+
+def check_zstd_installed():
+    if zstandard is None:
+        raise AssertionError("zstandard module not installed")
+
+
+def check_request_compression(encoding, min_size=DEFAULT_MIN_SIZE):
+    """
+    Returns the validated request ``encoding``, None to not compress, and ``min_size``.
+    """
+    try:
+        min_size = int(min_size)
+    except ValueError as err:
+        raise ValueError("Error converting session parameter: %s" % err)
+    if not encoding:
+        return None, min_size
+    encoding = encoding.lower()
+    if encoding not in REQUEST_ENCODINGS:
+        raise ValueError(
+            "Unknown request compression: %s, valid values are %s"
+            % (encoding, ", ".join(REQUEST_ENCODINGS))
+        )
+    if encoding == "zstd":
+        check_zstd_installed()
+    return encoding, min_size
+
+
+def compressobj(encoding):
+    """
+    Returns a compressor with ``compress`` and ``flush`` methods for the ``Content-Encoding``.
+    The gzip header has no timestamp, so that the same body is always compressed the same.
+    """
+    if encoding == "gzip":
+        return zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    if encoding == "deflate":
+        # HTTP deflate is the zlib format, not raw deflate
+        return zlib.compressobj()
+    check_zstd_installed()
+    return zstandard.ZstdCompressor().compressobj()
+
+
+def compress_body(data, encoding):
+    compressor = compressobj(encoding)
+    return compressor.compress(data) + compressor.flush()
+
+
+def iter_compressed(chunks, encoding):
+    compressor = compressobj(encoding)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def compress_request(request, encoding, min_size=DEFAULT_MIN_SIZE):
+    """
+    Returns a copy of the prepared ``request`` with the body compressed and the
+    ``Content-Encoding`` header, or the request itself when it has no body, the body
+    is smaller than ``min_size`` bytes or it has already a ``Content-Encoding``.
+
+    Streamed bodies, like files or generators, are compressed while they are sent
+    with ``Transfer-Encoding: chunked``, since their compressed length is not known.
+    """
+    body = request.body
+    if not body or "Content-Encoding" in request.headers:
+        return request
+    compressed = request.copy()
+    if isinstance(body, (bytes, str)):
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        if len(body) < min_size:
+            return request
+        compressed.body = compress_body(body, encoding)
+        compressed.headers["Content-Length"] = str(len(compressed.body))
+    else:
+        length = request.headers.get("Content-Length")
+        if length is not None and int(length) < min_size:
+            return request
+        compressed.body = ChunkedBody(iter_compressed(iter_body(body), encoding))
+        compressed.headers.pop("Content-Length", None)
+        compressed.headers["Transfer-Encoding"] = "chunked"
+    compressed.headers["Content-Encoding"] = encoding
+    return compressed
+
+
+class CompressingAdapter(BaseAdapter):
+    """
+    Transport adapter that compresses the request bodies with ``encoding``
+    before sending them with ``adapter``.
+    """
+
+    def __init__(self, adapter, encoding, min_size=DEFAULT_MIN_SIZE):
+        super(CompressingAdapter, self).__init__()
+        self.adapter = adapter
+        self.encoding = encoding
+        self.min_size = min_size
+
+    def send(self, request, **kwargs):
+        return self.adapter.send(
+            compress_request(request, self.encoding, self.min_size), **kwargs
+        )
+
+    def close(self):
+        self.adapter.close()
+
+
+def check_decoded_size(response, size, max_size):
+    if size > max_size:
+        raise ContentDecodingError(
+            "Url: %s Decoded body is bigger than max size of %d bytes"
+            % (response.url, max_size)
+        )
+
+
+class DecodedSizeLimitRawResponse(object):
+    """
+    Raw response proxy that counts the decoded bytes read from ``raw`` and fails as soon as
+    they are more than ``max_size``, so that a decompression bomb is never decoded whole.
+    The body is still decoded one chunk at a time by ``raw``.
+    """
+
+    def __init__(self, raw, response, max_size):
+        self._raw = raw
+        self._response = response
+        self.max_size = max_size
+        self.decoded_size = 0
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+    def _count(self, data):
+        self.decoded_size += len(data)
+        if self.decoded_size > self.max_size:
+            self._raw.close()
+            check_decoded_size(self._response, self.decoded_size, self.max_size)
+        return data
+
+    def stream(self, *args, **kwargs):
+        for chunk in self._raw.stream(*args, **kwargs):
+            yield self._count(chunk)
+
+    def read(self, *args, **kwargs):
+        return self._count(self._raw.read(*args, **kwargs))
+
+
+def read_content(response):
+    """
+    Reads the body of a streamed ``response``, adding the time spent
+    to its ``timings`` and ``wire_trace`` when it has them.
+    """
+    started = perf_counter()
+    response.content
+    elapsed = perf_counter() - started
+    timings = getattr(response, "timings", None)
+    if timings is None:
+        return
+    response.timings = timings._replace(
+        download=timings.download + elapsed, total=timings.total + elapsed
+    )
+    trace = getattr(response, "wire_trace", None)
+    if trace is not None:
+        trace.timings = response.timings
+        trace.bytes_received = response.raw.tell()
+
+
+class DecodedSizeLimitAdapter(BaseAdapter):
+    """
+    Transport adapter that fails the responses of ``adapter`` with a decoded body
+    bigger than ``max_size`` bytes.
+
+    The responses are always streamed from ``adapter``, and when the request is not
+    streamed their body is read here, so that it's never decoded whole by the transport.
+    """
+
+    def __init__(self, adapter, max_size):
+        super(DecodedSizeLimitAdapter, self).__init__()
+        self.adapter = adapter
+        self.max_size = max_size
+
+    def send(self, request, stream=False, **kwargs):
+        response = self.adapter.send(request, stream=True, **kwargs)
+        if response._content_consumed:
+            check_decoded_size(response, len(response.content or b""), self.max_size)
+            return response
+        response.raw = DecodedSizeLimitRawResponse(
+            response.raw, response, self.max_size
+        )
+        if not stream:
+            read_content(response)
+        return response
+
+    def close(self):
+        self.adapter.close()
@@ -0,0 +1,312 @@
+import hashlib
+import os
+from collections import namedtuple
+
+import requests
+from robot.api import logger
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+PROGRESS_STEP = 10
+RESUMABLE_ERRORS = (
+    requests.exceptions.ChunkedEncodingError,
+    requests.exceptions.ConnectionError,
+)
+
+Download = namedtuple(
+    "Download", ["path", "size", "algorithm", "digest", "ranges"], defaults=(1,)
+)
+Download.__doc__ = """A response body saved to a file.
+
+``digest`` is the hex digest of the file with the ``algorithm``,
+both None when no digest algorithm is used. ``ranges`` is the number
+of range requests the file has been downloaded with.
+"""
+
+
+def check_digest(digest):
+    """
+    Returns the digest algorithm, None when it's empty or ``None``, also as a string.
+    """
+    if not digest or str(digest).lower() == "none":
+        return None
+    if digest not in hashlib.algorithms_available:
+        raise ValueError("Unknown digest algorithm: %s" % digest)
+    return digest
+
+
+def check_download_settings(chunk_size, max_size, connections=1):
+    try:
+        chunk_size = int(chunk_size)
+        max_size = int(max_size) if max_size is not None else None
+        connections = int(connections)
+    except ValueError as err:
+        raise ValueError("Error converting download parameter: %s" % err)
+    if chunk_size < 1:
+        raise ValueError("Download chunk size must be at least 1: %s" % chunk_size)
+    if connections < 1:
+        raise ValueError("Download connections must be at least 1: %s" % connections)
+    return chunk_size, max_size, connections
+
+
+def content_length(response):
+    try:
+        return int(response.headers["Content-Length"])
+    except (KeyError, ValueError):
+        return None
+
+
+def check_max_size(response, size, max_size):
+    if max_size is not None and size > max_size:
+        raise AssertionError(
+            "Url: %s Download is bigger than max size of %d bytes"
+            % (response.url, max_size)
+        )
+
+
+def resume_validator(response):
+    """
+    Returns the ``If-Range`` validator of ``response``, its strong ``ETag``
+    or its ``Last-Modified`` date, None when it has none.
+    """
+    etag = response.headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return response.headers.get("Last-Modified")
+
+
+def resume_headers(first, last=None, validator=None):
+    headers = {"Range": "bytes=%d-%s" % (first, "" if last is None else last)}
+    if validator:
+        headers["If-Range"] = validator
+    return headers
+
+
+def log_progress(size, total, next_progress):
+    """
+    Logs the progress once ``size`` bytes of ``total`` reach the ``next_progress``
+    percentage, and returns the percentage of the next log.
+    """
+    if not total or size * 100 < next_progress * total:
+        return next_progress
+    logger.debug("Downloaded %d%%, %d of %d bytes" % (size * 100 // total, size, total))
+    return size * 100 // total + PROGRESS_STEP
+
+
+def write_chunks(response, body, part, hasher, size, max_size, chunk_size):
+    """
+    Writes the chunks of ``body`` to the ``part`` file, that has already the first
+    ``size`` bytes of the body of ``response``, and returns the size written.
+    """
+    total = content_length(response)
+    next_progress = size * 100 // total + PROGRESS_STEP if total else None
+    for chunk in body.iter_content(chunk_size):
+        size += len(chunk)
+        check_max_size(response, size, max_size)
+        part.write(chunk)
+        if hasher:
+            hasher.update(chunk)
+        next_progress = log_progress(size, total, next_progress)
+    return size
+
+
+def resume_response(response, body, reopen, size, validator, error):
+    """
+    Closes the interrupted ``body`` and returns the response of ``reopen`` that
+    resumes the download after ``size`` bytes, or that restarts it from the beginning
+    when the server sends the whole body or ``response`` has no validator.
+    """
+    body.close()
+    logger.info(
+        "Download of %s interrupted after %d bytes, resuming: %s"
+        % (response.url, size, error)
+    )
+    body = reopen(resume_headers(size, validator=validator) if validator else {})
+    if is_partial_response(body, size):
+        return body
+    if body.status_code == 206 or not 200 <= body.status_code < 300:
+        body.close()
+        raise AssertionError(
+            "Url: %s Cannot resume the download after %d bytes, "
+            "the response is %s" % (response.url, size, body.status_code)
+        )
+    return body
+
+
+def save_response(
+    response,
+    path,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    digest="sha256",
+    max_size=None,
+    reopen=None,
+    resume=0,
+):
+    """
+    Writes the body of a streamed response to ``path`` one chunk at a time,
+    computing its digest on the way, and returns the ``Download``.
+
+    The body is written to ``path`` with a ``.part`` suffix that is renamed
+    when it's complete, and removed when the download fails.
+
+    When the body is interrupted by a connection error, it's resumed up to ``resume``
+    times calling ``reopen`` with the ``Range`` and ``If-Range`` headers of the missing
+    bytes, that returns the new streamed response. When the server sends the whole
+    body instead, or the response has no validator, the download starts over.
+    """
+    chunk_size, max_size, _ = check_download_settings(chunk_size, max_size)
+    digest = check_digest(digest)
+    hasher = hashlib.new(digest) if digest else None
+    total = content_length(response)
+    if total is not None:
+        check_max_size(response, total, max_size)
+    validator = resume_validator(response)
+    resumable = reopen is not None and "Content-Encoding" not in response.headers
+
+    part_path = path + ".part"
+    body = response
+    size = 0
+    resumes = 0
+    try:
+        with open(part_path, "wb") as part:
+            while True:
+                try:
+                    size = write_chunks(
+                        response, body, part, hasher, size, max_size, chunk_size
+                    )
+                    break
+                except RESUMABLE_ERRORS as err:
+                    size = part.tell()
+                    if not resumable or resumes >= int(resume):
+                        raise
+                    resumes += 1
+                    body = resume_response(response, body, reopen, size, validator, err)
+                    if not is_partial_response(body, size):
+                        part.seek(0)
+                        part.truncate()
+                        size = 0
+                        hasher = hashlib.new(digest) if digest else None
+        os.replace(part_path, path)
+    except BaseException:
+        body.close()
+        response.close()
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        raise
+    return Download(path, size, digest, hasher.hexdigest() if hasher else None)
+
+
+def ranged_download_size(response):
+    """
+    Returns the size of the resource when the probe ``response`` shows that
+    it can be downloaded with range requests, None otherwise.
+    """
+    if not 200 <= response.status_code < 300:
+        return None
+    if response.headers.get("Accept-Ranges", "").lower() != "bytes":
+        return None
+    if "Content-Encoding" in response.headers:
+        return None
+    return content_length(response)
+
+
+def split_ranges(size, parts):
+    """
+    Splits ``size`` bytes in ``parts`` contiguous ranges, first and last bytes included.
+    """
+    length, extra = divmod(size, parts)
+    ranges = []
+    start = 0
+    for index in range(parts):
+        end = start + length + (1 if index < extra else 0)
+        ranges.append((start, end - 1))
+        start = end
+    return ranges
+
+
+def preallocate(path, size):
+    with open(path, "wb") as part:
+        part.truncate(size)
+
+
+def is_partial_response(response, first, last=None):
+    return response.status_code == 206 and response.headers.get(
+        "Content-Range", ""
+    ).startswith("bytes %d-%s" % (first, "" if last is None else "%d/" % last))
+
+
+def check_range(response, first, last):
+    if not is_partial_response(response, first, last):
+        response.close()
+        raise AssertionError(
+            "Url: %s Expected the bytes %d-%d but the response is %s %s"
+            % (
+                response.url,
+                first,
+                last,
+                response.status_code,
+                response.headers.get("Content-Range", ""),
+            )
+        )
+
+
+def save_range(
+    response,
+    path,
+    start,
+    end,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    reopen=None,
+    resume=0,
+    validator=None,
+):
+    """
+    Writes the body of a streamed 206 response at its ``start`` offset
+    of the already allocated file at ``path``.
+
+    A range interrupted by a connection error is resumed up to ``resume`` times
+    like in ``save_response``, but a full body is an error.
+    """
+    check_range(response, start, end)
+    written = 0
+    resumes = 0
+    with open(path, "r+b") as part:
+        part.seek(start)
+        while True:
+            try:
+                for chunk in response.iter_content(chunk_size):
+                    part.write(chunk)
+                    written += len(chunk)
+                break
+            except RESUMABLE_ERRORS as err:
+                if reopen is None or resumes >= int(resume):
+                    raise
+                resumes += 1
+                response.close()
+                logger.info(
+                    "Range %d-%d of %s interrupted after %d bytes, resuming: %s"
+                    % (start, end, response.url, written, err)
+                )
+                response = reopen(resume_headers(start + written, end, validator))
+                check_range(response, start + written, end)
+    if written != end - start + 1:
+        raise AssertionError(
+            "Url: %s Expected %d bytes of the range %d-%d, received %d"
+            % (response.url, end - start + 1, start, end, written)
+        )
+
+
+def file_digest(path, digest, chunk_size=DEFAULT_CHUNK_SIZE):
+    hasher = hashlib.new(digest)
+    with open(path, "rb") as saved:
+        for chunk in iter(lambda: saved.read(chunk_size), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def format_download_to_log_string(download):
+    summary = "<downloaded %d bytes to %s" % (download.size, download.path)
+    if download.ranges > 1:
+        summary += " with %d range requests" % download.ranges
+    if download.digest:
+        summary += ", %s=%s" % (download.algorithm, download.digest)
+    return summary + ">"
@@ -0,0 +1,423 @@
+import asyncio
+import os
+import ssl
+import threading
+from time import perf_counter
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.cookies import RequestsCookieJar, extract_cookies_to_jar
+from requests.exceptions import (
+    ConnectionError,
+    ConnectTimeout,
+    ProxyError,
+    ReadTimeout,
+    SSLError,
+)
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import DEFAULT_CA_BUNDLE_PATH, get_encoding_from_headers, select_proxy
+from robot.api import logger
+
+from RequestsLibrary.compat import httplib
+from RequestsLibrary.timings import TraceTimer
+from RequestsLibrary.wiretrace import build_httpx_wire_trace
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa
+except ImportError:
+    h2 = None
+
+STREAMING_CHUNK_SIZE = 64 * 1024
+UNSUPPORTED_REQUEST_ARGUMENTS = ("proxies", "hooks", "stream", "verify", "cert")
+HTTP_VERSIONS = {"HTTP/1.0": 10, "HTTP/1.1": 11, "HTTP/2": 20}
+
+
+def check_httpx_installed():
+    if httpx is None:
+        raise AssertionError("httpx module not installed")
+
+
+def check_http2_installed():
+    check_httpx_installed()
+    if h2 is None:
+        raise AssertionError("h2 module not installed")
+
+
+def build_ssl_context(verify, cert=None):
+    """
+    Builds the SSL context from the requests ``verify`` and ``cert`` arguments.
+    """
+    if verify is False:
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    elif isinstance(verify, str) and os.path.isdir(verify):
+        context = ssl.create_default_context(capath=verify)
+    elif isinstance(verify, str):
+        context = ssl.create_default_context(cafile=verify)
+    else:
+        context = ssl.create_default_context(cafile=DEFAULT_CA_BUNDLE_PATH)
+
+    if isinstance(cert, str):
+        context.load_cert_chain(cert)
+    elif cert:
+        context.load_cert_chain(*cert)
+    return context
+
+
+def build_timeout(timeout):
+    """
+    Converts a requests timeout, a float or a (connect, read) tuple, to an httpx one.
+    Waiting for a free connection of the pool is never a timeout, like in requests.
+    """
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(None, connect=connect, read=read)
+    return httpx.Timeout(timeout, pool=None)
+
+
+def build_client_settings(session):
+    """
+    Returns the httpx client arguments that mirror the requests session ones.
+    """
+    https_adapter = session.get_adapter("https://")
+    # the caching and replay adapters wrap the transport one
+    while hasattr(https_adapter, "adapter"):
+        https_adapter = https_adapter.adapter
+    settings = {
+        "verify": build_ssl_context(session.verify, session.cert),
+        "http2": isinstance(https_adapter, HTTP2Adapter),
+    }
+    if session.proxies:
+        settings["mounts"] = {}
+        for scheme, proxy in session.proxies.items():
+            pattern = scheme if "://" in scheme else "%s://" % scheme
+            settings["mounts"][pattern] = httpx.AsyncHTTPTransport(proxy=proxy)
+    return settings
+
+
+def build_response(prepared_request, httpx_response, history=()):
+    """
+    Converts an httpx response to a requests Response, so that the usual
+    status checks, logging and user assertions can be used.
+    """
+    response = Response()
+    response.status_code = httpx_response.status_code
+    response.headers = CaseInsensitiveDict(httpx_response.headers.items())
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.reason = httpx_response.reason_phrase
+    response.url = str(httpx_response.url)
+    response.elapsed = httpx_response.elapsed
+    response.request = prepared_request
+    response.history = list(history)
+    response._content = httpx_response.content
+
+    cookies = RequestsCookieJar()
+    for cookie in httpx_response.cookies.jar:
+        cookies.set_cookie(cookie)
+    response.cookies = cookies
+    return response
+
+
+def iter_body(body):
+    """
+    Generator over a file descriptor or an iterable request body.
+    """
+    if hasattr(body, "read"):
+        chunk = body.read(STREAMING_CHUNK_SIZE)
+        while chunk:
+            yield chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+            chunk = body.read(STREAMING_CHUNK_SIZE)
+    else:
+        for chunk in body:
+            yield chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+
+
+async def aiter_body(body):
+    """
+    Async generator over a file descriptor or an iterable request body.
+    """
+    if hasattr(body, "read"):
+        chunk = body.read(STREAMING_CHUNK_SIZE)
+        while chunk:
+            yield chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+            chunk = body.read(STREAMING_CHUNK_SIZE)
+    else:
+        for chunk in body:
+            yield chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+
+
+def is_caused_by(error, error_type):
+    """
+    Returns True when ``error``, or one of the exceptions it has been raised from,
+    is an ``error_type``.
+    """
+    while error is not None:
+        if isinstance(error, error_type):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def to_requests_error(error, request):
+    """
+    Returns the requests exception that corresponds to the httpx transport ``error``.
+    """
+    if isinstance(error, httpx.ConnectTimeout):
+        return ConnectTimeout(error, request=request)
+    if isinstance(error, httpx.TimeoutException):
+        return ReadTimeout(error, request=request)
+    if isinstance(error, httpx.ProxyError):
+        return ProxyError(error, request=request)
+    if isinstance(error, httpx.ConnectError) and is_caused_by(error, ssl.SSLError):
+        return SSLError(error, request=request)
+    return ConnectionError(error, request=request)
+
+
+class AsyncEngine(object):
+    """
+    Sends the requests of a session through an httpx AsyncClient.
+
+    Requests are prepared by the requests session itself, so headers, cookies,
+    authentication and body encoding are exactly the same of the other keywords.
+    The client is bound to the event loop it was created in, a new one is created
+    if the engine is used by a different loop.
+    """
+
+    def __init__(self, session):
+        check_httpx_installed()
+        self.session = session
+        self._client = None
+        self._loop = None
+
+    def _get_client(self):
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            self._client = httpx.AsyncClient(**build_client_settings(self.session))
+            self._loop = loop
+        return self._client
+
+    async def request(
+        self,
+        method,
+        url,
+        params=None,
+        data=None,
+        headers=None,
+        cookies=None,
+        files=None,
+        auth=None,
+        timeout=None,
+        allow_redirects=True,
+        json=None,
+        **kwargs
+    ):
+        for name in kwargs:
+            if name not in UNSUPPORTED_REQUEST_ARGUMENTS:
+                raise TypeError("Unexpected request argument '%s'" % name)
+            logger.warn(
+                "Request argument '%s' is not supported by the async engine and it is ignored,"
+                " set it when creating the session instead." % name
+            )
+
+        request = requests.Request(
+            method=method,
+            url=url,
+            headers=headers,
+            files=files,
+            data=data,
+            json=json,
+            params=params,
+            auth=auth,
+            cookies=cookies,
+        )
+        prepared_request = self.session.prepare_request(request)
+
+        body = prepared_request.body
+        if body is not None and not isinstance(body, (bytes, str)):
+            body = aiter_body(body)
+
+        timer = TraceTimer()
+        try:
+            httpx_response = await self._get_client().request(
+                prepared_request.method,
+                prepared_request.url,
+                headers=dict(prepared_request.headers),
+                content=body,
+                timeout=build_timeout(timeout),
+                follow_redirects=allow_redirects,
+                extensions={"trace": timer.atrace},
+            )
+        except httpx.TransportError as err:
+            raise to_requests_error(err, prepared_request)
+
+        history = [build_response(prepared_request, r) for r in httpx_response.history]
+        response = build_response(prepared_request, httpx_response, history)
+        response.timings = timer.timings(perf_counter())
+        if getattr(self.session, "wire_trace", 0) >= 1:
+            for r, httpx_r in zip(history, httpx_response.history):
+                r.wire_trace = build_httpx_wire_trace(httpx_r.request, httpx_r)
+            response.wire_trace = build_httpx_wire_trace(
+                httpx_response.request, httpx_response, response.timings
+            )
+        for r in history + [response]:
+            self.session.cookies.update(r.cookies)
+        return response
+
+    def close(self):
+        if self._client is None:
+            return
+        if not self._loop.is_closed() and not self._loop.is_running():
+            self._loop.run_until_complete(self._client.aclose())
+        self._client = None
+        self._loop = None
+
+
+class HttpxRawResponse(object):
+    """
+    Minimal urllib3 like raw response over a streamed httpx response,
+    what requests needs to read the content and to extract the cookies.
+    """
+
+    def __init__(self, httpx_response):
+        self._response = httpx_response
+        self._chunks = None
+        self._buffer = b""
+        self.status = httpx_response.status_code
+        self.reason = httpx_response.reason_phrase
+        self.version = HTTP_VERSIONS.get(httpx_response.http_version, 11)
+        self.msg = httplib.HTTPMessage()
+        for name, value in httpx_response.headers.multi_items():
+            self.msg[name] = value
+        self._original_response = self
+
+    def stream(self, chunk_size=STREAMING_CHUNK_SIZE, decode_content=True):
+        if self._buffer:
+            yield self._buffer
+            self._buffer = b""
+        if self._chunks is None:
+            self._chunks = self._response.iter_bytes(chunk_size)
+        for chunk in self._chunks:
+            yield chunk
+
+    def read(self, amt=None):
+        if self._chunks is None:
+            self._chunks = self._response.iter_bytes(STREAMING_CHUNK_SIZE)
+        data = self._buffer
+        for chunk in self._chunks:
+            data += chunk
+            if amt is not None and len(data) >= amt:
+                break
+        if amt is None:
+            self._buffer = b""
+            return data
+        self._buffer = data[amt:]
+        return data[:amt]
+
+    def tell(self):
+        return self._response.num_bytes_downloaded
+
+    def close(self):
+        self._response.close()
+
+    def release_conn(self):
+        self._response.close()
+
+
+class HTTP2Adapter(BaseAdapter):
+    """
+    Transport adapter that sends the requests of a session with the HTTP/2 capable
+    httpx transport. Requests to the same host share a single connection when the
+    server negotiates HTTP/2, otherwise HTTP/1.1 is used as fallback.
+
+    Only connection errors are retried, as the httpx transport does.
+    When ``pool_block`` is set no more than ``pool_maxsize`` connections are opened,
+    otherwise ``pool_maxsize`` is only the number of connections kept alive.
+    When ``wire_trace`` is 1 or more the ``wire_trace`` of each request is attached
+    to the response.
+    """
+
+    def __init__(self, max_retries=0, pool_maxsize=10, pool_block=False, wire_trace=0):
+        check_http2_installed()
+        super(HTTP2Adapter, self).__init__()
+        self.max_retries = max_retries
+        self.wire_trace = int(wire_trace)
+        self._limits = httpx.Limits(
+            max_connections=pool_maxsize if pool_block else None,
+            max_keepalive_connections=pool_maxsize,
+        )
+        self._transports = {}
+        self._lock = threading.Lock()
+
+    def _get_transport(self, verify, cert, proxy):
+        key = (verify, tuple(cert) if isinstance(cert, list) else cert, proxy)
+        with self._lock:
+            if key not in self._transports:
+                self._transports[key] = httpx.HTTPTransport(
+                    verify=build_ssl_context(verify, cert),
+                    http2=True,
+                    limits=self._limits,
+                    proxy=proxy,
+                    retries=self.max_retries,
+                )
+            return self._transports[key]
+
+    def send(
+        self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None
+    ):
+        transport = self._get_transport(
+            verify, cert, select_proxy(request.url, proxies or {})
+        )
+
+        body = request.body
+        if body is not None and not isinstance(body, (bytes, str)):
+            body = iter_body(body)
+
+        timer = TraceTimer()
+        httpx_request = httpx.Request(
+            request.method,
+            request.url,
+            headers=list(request.headers.items()),
+            content=body,
+            extensions={"timeout": build_timeout(timeout).as_dict(), "trace": timer},
+        )
+
+        try:
+            httpx_response = transport.handle_request(httpx_request)
+        except httpx.TransportError as err:
+            raise to_requests_error(err, request)
+
+        response = self.build_response(request, httpx_response)
+        if not stream:
+            response.content
+        response.timings = timer.timings(perf_counter())
+        if self.wire_trace >= 1:
+            response.wire_trace = build_httpx_wire_trace(
+                httpx_request, httpx_response, response.timings
+            )
+        return response
+
+    def build_response(self, request, httpx_response):
+        response = Response()
+        response.status_code = httpx_response.status_code
+        response.headers = CaseInsensitiveDict(httpx_response.headers.items())
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = HttpxRawResponse(httpx_response)
+        response.reason = response.raw.reason
+        response.url = request.url
+        extract_cookies_to_jar(response.cookies, request, response.raw)
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self):
+        with self._lock:
+            for transport in self._transports.values():
+                transport.close()
+            self._transports = {}
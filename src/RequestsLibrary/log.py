@@ -1,23 +1,92 @@
+import hashlib
 import logging
 
+from requests.compat import chardet
 from robot.api import logger
+from robot.running.context import EXECUTION_CONTEXTS
 
+from RequestsLibrary.chunked import ChunkedBody, format_chunked_body_to_log_string
+from RequestsLibrary.download import Download, format_download_to_log_string
+from RequestsLibrary.stats import response_size
 from RequestsLibrary.utils import is_file_descriptor
 
 LOG_CHAR_LIMIT = 10000
 AUTHORIZATION = 'Authorization'
+BODY_NOT_LOGGED = "<not logged, the log byte budget is spent>"
+STREAMED_BODY_NOT_LOGGED = "<not logged, the body has been streamed>"
+# Bytes needed to decode one more character than the log limit, in any encoding
+MAX_BYTES_PER_CHAR = 4
+UTF8_CONTENT_TYPES = ("json", "xml", "javascript", "yaml", "x-www-form-urlencoded")
+BINARY_MAIN_TYPES = ("image", "audio", "video", "font")
+BINARY_SUBTYPES = (
+    "octet-stream",
+    "pdf",
+    "zip",
+    "gzip",
+    "x-tar",
+    "protobuf",
+    "x-protobuf",
+    "grpc",
+    "msgpack",
+    "x-msgpack",
+    "cbor",
+    "avro",
+    "vnd.",
+)
+BINARY_SNIFF_SIZE = 512
+BINARY_PREVIEW_SIZE = 16
+# Control characters that are not expected in text, like the file command does
+NON_TEXT_BYTES = bytes(set(range(32)) - {7, 8, 9, 10, 12, 13, 27}) + b"\x7f"
 
 
-def log_response(response):
+def log_response(response, digest=None, log_body=True):
+    """
+    Logs the response and returns the length of the logged body.
+    """
+    if is_log_level_hidden(logging.INFO):
+        return 0
+    body = (
+        format_response_body_to_log_string(response, digest)
+        if log_body
+        else BODY_NOT_LOGGED
+    )
     logger.info(
         "%s Response : url=%s \n " % (response.request.method.upper(), response.url)
         + "status=%s, reason=%s \n " % (response.status_code, response.reason)
         + "headers=%s \n " % response.headers
-        + "body=%s \n " % format_data_to_log_string(response.text)
+        + "body=%s \n " % body
+    )
+    timings = getattr(response, "timings", None)
+    if timings:
+        logger.debug(
+            "%s Response timings : %s"
+            % (response.request.method.upper(), format_timings_to_log_string(timings))
+        )
+    return len(body) if log_body and body else 0
+
+
+def log_summary(response):
+    if is_log_level_hidden(logging.INFO):
+        return
+    logger.info(
+        "%s %s : status=%s, reason=%s, elapsed=%.3fms, bytes=%s"
+        % (
+            response.request.method.upper(),
+            response.url,
+            response.status_code,
+            response.reason,
+            response.elapsed.total_seconds() * 1000,
+            response_size(response),
+        )
     )
 
 
-def log_request(response):
+def log_request(response, digest=None, log_body=True):
+    """
+    Logs the request of the response and returns the length of the logged body.
+    """
+    if is_log_level_hidden(logging.INFO):
+        return 0
     request = response.request
     if response.history:
         original_request = response.history[0].request
@@ -25,6 +94,11 @@ def log_request(response):
     else:
         original_request = request
         redirected = ""
+    body = (
+        format_request_body_to_log_string(original_request, digest)
+        if log_body
+        else BODY_NOT_LOGGED
+    )
     safe_headers = dict(original_request.headers)
     if logger.LOGLEVEL not in ['TRACE', 'DEBUG'] and AUTHORIZATION in safe_headers:
         safe_headers[AUTHORIZATION] = '*****'
@@ -33,8 +107,108 @@ def log_request(response):
         + "url=%s %s\n " % (original_request.url, redirected)
         + "path_url=%s \n " % original_request.path_url
         + "headers=%s \n " % safe_headers
-        + "body=%s \n " % format_data_to_log_string(original_request.body)
+        + "body=%s \n " % body
     )
+    return len(body) if log_body and body else 0
+
+
+def format_response_body_to_log_string(response, digest=None):
+    download = getattr(response, "download", None)
+    if isinstance(download, Download):
+        # The body has been streamed to a file, it can't be read again
+        return format_download_to_log_string(download)
+    if response._content is False and response._content_consumed:
+        # Partially read, like by a failed download, it can't be read again
+        return STREAMED_BODY_NOT_LOGGED
+    content = response.content
+    content_type = response.headers.get("Content-Type")
+    if isinstance(content, bytes) and is_binary(content, content_type):
+        return format_binary_to_log_string(content, content_type, digest)
+    return format_data_to_log_string(response_text_to_log(response))
+
+
+def format_request_body_to_log_string(request, digest=None):
+    body = request.body
+    if isinstance(body, ChunkedBody):
+        # The body has been streamed while it was sent, only its size is known
+        return format_chunked_body_to_log_string(body)
+    content_type = request.headers.get("Content-Type")
+    if isinstance(body, bytes) and is_binary(body, content_type):
+        return format_binary_to_log_string(body, content_type, digest)
+    return format_data_to_log_string(body)
+
+
+def is_binary(data, content_type=None):
+    """
+    Returns True if the body is binary, based on the content type when it's known
+    or on the presence of control characters in the first bytes otherwise.
+    """
+    if content_type:
+        mime_type = content_type.split(";")[0].strip().lower()
+        main_type, _, subtype = mime_type.partition("/")
+        if main_type == "text" or any(name in subtype for name in UTF8_CONTENT_TYPES):
+            return False
+        if main_type in BINARY_MAIN_TYPES or subtype.startswith(BINARY_SUBTYPES):
+            return True
+    sample = data[:BINARY_SNIFF_SIZE]
+    return len(sample.translate(None, NON_TEXT_BYTES)) != len(sample)
+
+
+def format_binary_to_log_string(data, content_type=None, digest=None):
+    """
+    Summary of a binary body with its length, content type, the hex of the first bytes
+    and, when a ``digest`` algorithm like ``sha256`` is given, the digest of the whole body.
+    """
+    summary = "<binary data: %d bytes" % len(data)
+    if content_type:
+        summary += ", content-type=%s" % content_type
+    summary += ", preview=%s" % data[:BINARY_PREVIEW_SIZE].hex(" ")
+    if len(data) > BINARY_PREVIEW_SIZE:
+        summary += " ..."
+    if digest:
+        summary += ", %s=%s" % (digest, hashlib.new(digest, data).hexdigest())
+    return summary + ">"
+
+
+def is_log_level_hidden(level):
+    """
+    Returns True when Robot Framework is running with a log level that doesn't show
+    messages of the given ``logging`` level.
+    """
+    return EXECUTION_CONTEXTS.current is not None and logging.getLogger().level > level
+
+
+def response_text_to_log(response, limit=LOG_CHAR_LIMIT):
+    """
+    Returns the response body as text, decoding only the part that is going to be logged.
+
+    The full ``response.text`` is decoded only when the log level shows the whole content.
+    Without a declared charset, text based content types are decoded as UTF-8 and the
+    encoding of the others is detected on the logged part only.
+    """
+    if logging.getLogger().level <= logging.DEBUG:
+        return response.text
+
+    content = response.content
+    if not isinstance(content, bytes):
+        # Response objects not built by requests may only provide the text
+        return response.text
+    if not content:
+        return ""
+
+    prefix = content[: (limit + 1) * MAX_BYTES_PER_CHAR]
+    encoding = response.encoding
+    if encoding is None:
+        content_type = response.headers.get("Content-Type", "").lower()
+        if any(name in content_type for name in UTF8_CONTENT_TYPES):
+            encoding = "utf-8"
+        else:
+            encoding = chardet.detect(prefix)["encoding"] or "utf-8"
+
+    try:
+        return str(prefix, encoding, errors="replace")
+    except LookupError:
+        return str(prefix, "utf-8", errors="replace")
 
 
 def format_data_to_log_string(data, limit=LOG_CHAR_LIMIT):
@@ -52,3 +226,9 @@ def format_data_to_log_string(data, limit=LOG_CHAR_LIMIT):
         )
 
     return data
+
+
+def format_timings_to_log_string(timings):
+    return ", ".join(
+        "%s=%.3fms" % (name, value * 1000) for name, value in timings._asdict().items()
+    )
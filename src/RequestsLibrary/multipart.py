@@ -0,0 +1,183 @@
+import io
+import os
+
+from requests.packages.urllib3.fields import RequestField
+from requests.packages.urllib3.filepost import choose_boundary
+from requests.utils import guess_filename, super_len, to_key_val_list
+
+
+def is_streamable_file(fp):
+    """
+    Returns True if ``fp`` is a file opened in binary mode, that can be read
+    again from any position, like the ones of `Get File For Streaming Upload`.
+    """
+    if not isinstance(fp, (io.RawIOBase, io.BufferedIOBase)):
+        return False
+    try:
+        return fp.seekable()
+    except ValueError:
+        return False
+
+
+def split_file_value(name, value):
+    """
+    Returns the filename, file object, content type and headers of a ``files`` value,
+    in any of the formats supported by requests.
+    """
+    content_type = None
+    headers = None
+    if isinstance(value, (tuple, list)):
+        if len(value) == 2:
+            filename, fp = value
+        elif len(value) == 3:
+            filename, fp, content_type = value
+        else:
+            filename, fp, content_type, headers = value
+    else:
+        filename = guess_filename(value) or name
+        fp = value
+    return filename, fp, content_type, headers
+
+
+def iter_data_fields(data):
+    for name, values in to_key_val_list(data or {}):
+        if isinstance(values, (str, bytes)) or not hasattr(values, "__iter__"):
+            values = [values]
+        for value in values:
+            if value is None:
+                continue
+            if not isinstance(value, bytes):
+                value = str(value)
+            yield (
+                name.decode("utf-8") if isinstance(name, bytes) else name,
+                value.encode("utf-8") if isinstance(value, str) else value,
+            )
+
+
+class MultipartEncoder(io.RawIOBase):
+    """
+    Read only, seekable, multipart/form-data body that reads the files
+    while it's sent, so that they are never loaded in memory.
+
+    Its length is computed upfront, so requests sends it with a ``Content-Length``
+    header. Closing the encoder closes the files.
+    """
+
+    def __init__(self, data=None, files=None, boundary=None):
+        super(MultipartEncoder, self).__init__()
+        self.boundary = boundary or choose_boundary()
+        self.content_type = "multipart/form-data; boundary=%s" % self.boundary
+        self._parts = []
+        self._files = []
+        for name, value in iter_data_fields(data):
+            field = RequestField(name=name, data=value)
+            field.make_multipart()
+            self._add_part(field, value)
+        for name, value in to_key_val_list(files or {}):
+            filename, fp, content_type, headers = split_file_value(name, value)
+            if fp is None:
+                continue
+            field = RequestField(name=name, data=b"", filename=filename, headers=headers)
+            field.make_multipart(content_type=content_type)
+            if is_streamable_file(fp):
+                self._files.append(fp)
+            elif isinstance(fp, str):
+                fp = fp.encode("utf-8")
+            elif hasattr(fp, "read"):
+                fp = fp.read()
+            self._add_part(field, fp)
+        self._append(("--%s--\r\n" % self.boundary).encode("latin-1"))
+        self._length = sum(size for _, _, size in self._parts)
+        self._position = 0
+
+    def _append(self, data, start=0, size=None):
+        self._parts.append((data, start, len(data) if size is None else size))
+
+    def _add_part(self, field, data):
+        self._append(
+            ("--%s\r\n" % self.boundary).encode("latin-1")
+            + field.render_headers().encode("utf-8")
+        )
+        if isinstance(data, (io.RawIOBase, io.BufferedIOBase)):
+            self._append(data, data.tell(), super_len(data))
+        else:
+            self._append(bytes(data))
+        self._append(b"\r\n")
+
+    def __len__(self):
+        return self._length
+
+    def __repr__(self):
+        return "<%s body of %d bytes with %d streamed files>" % (
+            self.content_type.split(";")[0],
+            self._length,
+            len(self._files),
+        )
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += self._length
+        if offset < 0:
+            raise ValueError("Negative seek position %d" % offset)
+        self._position = offset
+        return self._position
+
+    def readinto(self, buffer):
+        view = memoryview(buffer).cast("B")
+        written = 0
+        part_start = 0
+        for data, start, size in self._parts:
+            part_end = part_start + size
+            position = self._position
+            if written < len(view) and part_start <= position < part_end:
+                wanted = min(len(view) - written, part_end - position)
+                offset = position - part_start
+                if isinstance(data, bytes):
+                    chunk = data[offset:offset + wanted]
+                else:
+                    data.seek(start + offset)
+                    chunk = data.read(wanted)
+                    if not chunk:
+                        raise IOError(
+                            "File %s is shorter than its size when the upload started"
+                            % getattr(data, "name", data)
+                        )
+                view[written:written + len(chunk)] = chunk
+                written += len(chunk)
+                self._position += len(chunk)
+                if len(chunk) < wanted:
+                    break
+            part_start = part_end
+        return written
+
+    def close(self):
+        for fp in self._files:
+            fp.close()
+        super(MultipartEncoder, self).close()
+
+
+def build_multipart_encoder(data, files):
+    """
+    Returns the streaming encoder of the ``data`` fields and ``files`` of a request,
+    or None when requests has to encode them itself: no file is streamable,
+    or the data is not made of form fields.
+    """
+    if not files or isinstance(data, (str, bytes)) or hasattr(data, "read"):
+        return None
+    file_objects = [
+        split_file_value(name, value)[1] for name, value in to_key_val_list(files)
+    ]
+    if not any(is_streamable_file(fp) for fp in file_objects):
+        return None
+    return MultipartEncoder(data, files)
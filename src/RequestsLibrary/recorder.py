@@ -0,0 +1,237 @@
+import atexit
+import base64
+import json
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+from urllib.parse import parse_qsl, urlsplit
+
+from robot.api import logger
+
+from RequestsLibrary.log import AUTHORIZATION, is_binary
+from RequestsLibrary.version import VERSION
+
+RECORD_FORMATS = ("jsonl", "har")
+HAR_VERSION = "1.2"
+HTTP_VERSIONS = {10: "HTTP/1.0", 11: "HTTP/1.1", 20: "HTTP/2"}
+
+
+def build_har_headers(headers):
+    return [
+        {
+            "name": name,
+            "value": "*****" if name.lower() == AUTHORIZATION.lower() else value,
+        }
+        for name, value in headers.items()
+    ]
+
+
+def build_har_content(data, content_type=None):
+    """
+    Text bodies are recorded as they are, binary ones encoded in base64 like the HAR spec says.
+    """
+    if isinstance(data, str):
+        return {"text": data}
+    if is_binary(data, content_type):
+        return {"text": base64.b64encode(data).decode("ascii"), "encoding": "base64"}
+    return {"text": data.decode("utf-8", errors="replace")}
+
+
+def build_har_query_string(url):
+    return [
+        {"name": name, "value": value}
+        for name, value in parse_qsl(urlsplit(url).query, keep_blank_values=True)
+    ]
+
+
+def build_http_version(response):
+    return HTTP_VERSIONS.get(getattr(response.raw, "version", None), "HTTP/1.1")
+
+
+def build_har_request(request, http_version):
+    entry = {
+        "method": request.method,
+        "url": request.url,
+        "httpVersion": http_version,
+        "headers": build_har_headers(request.headers),
+        "cookies": [],
+        "queryString": build_har_query_string(request.url),
+        "headersSize": -1,
+        "bodySize": 0,
+    }
+    body = request.body
+    if isinstance(body, (bytes, str)) and body:
+        content_type = request.headers.get("Content-Type", "")
+        entry["bodySize"] = len(body)
+        entry["postData"] = dict(
+            build_har_content(body, content_type), mimeType=content_type
+        )
+    elif body is not None:
+        # Streamed bodies, like files or generators, have already been consumed
+        entry["bodySize"] = -1
+        entry["comment"] = "streamed body not recorded"
+    return entry
+
+
+def build_har_response(response):
+    content_type = response.headers.get("Content-Type", "")
+    entry = {
+        "status": response.status_code,
+        "statusText": response.reason or "",
+        "httpVersion": build_http_version(response),
+        "headers": build_har_headers(response.headers),
+        "cookies": [],
+        "redirectURL": response.headers.get("Location", ""),
+        "headersSize": -1,
+        "bodySize": -1,
+        "content": {"size": -1, "mimeType": content_type},
+    }
+    # Never read a streamed response from the recorder thread
+    content = response._content
+    if isinstance(content, bytes):
+        entry["bodySize"] = len(content)
+        entry["content"].update(build_har_content(content, content_type))
+        entry["content"]["size"] = len(content)
+    return entry
+
+
+def build_har_timings(response):
+    timings = getattr(response, "timings", None)
+    if timings is None:
+        return {"send": 0, "wait": response.elapsed.total_seconds() * 1000, "receive": 0}
+    return {
+        "dns": timings.dns * 1000,
+        "connect": (timings.connect + timings.tls) * 1000,
+        "ssl": timings.tls * 1000,
+        "send": 0,
+        "wait": timings.ttfb * 1000,
+        "receive": timings.download * 1000,
+    }
+
+
+def build_har_entry(response, completed):
+    """
+    Converts a response, and its request, to a HAR entry.
+    ``completed`` is the epoch time when the response has been received.
+    """
+    timings = getattr(response, "timings", None)
+    total = timings.total if timings else response.elapsed.total_seconds()
+    started = datetime.fromtimestamp(completed - total, timezone.utc)
+    return {
+        "startedDateTime": started.isoformat(),
+        "time": total * 1000,
+        "request": build_har_request(response.request, build_http_version(response)),
+        "response": build_har_response(response),
+        "cache": {},
+        "timings": build_har_timings(response),
+    }
+
+
+class TrafficRecorder(object):
+    """
+    Writes the exchanges to a JSON Lines or HAR file from a background thread.
+
+    ``record`` only puts the response in a bounded queue, conversion and writes
+    happen in the writer thread so the request thread never waits for the disk.
+    When the queue is full the exchange is dropped and counted in ``dropped``.
+    Exchanges that can't be converted or written are counted in ``errors``,
+    after a write error the writer stops and the following exchanges are dropped.
+    """
+
+    def __init__(self, path, format="jsonl", queue_size=1000):
+        if format not in RECORD_FORMATS:
+            raise ValueError(
+                "Unknown record format: %s, valid values are %s"
+                % (format, ", ".join(RECORD_FORMATS))
+            )
+        try:
+            queue_size = int(queue_size)
+        except ValueError as err:
+            raise ValueError("Error converting record parameter: %s" % err)
+        self.path = path
+        self.format = format
+        self.recorded = 0
+        self.dropped = 0
+        self.errors = 0
+        self._failed = False
+        self._closed = False
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._file = open(path, "w", encoding="utf-8")
+        self._thread = threading.Thread(
+            target=self._write_entries, name="RequestsLibraryRecorder", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def record(self, response):
+        if self._failed:
+            self.dropped += 1
+            return
+        try:
+            self._queue.put_nowait((response, time.time()))
+        except queue.Full:
+            self.dropped += 1
+
+    def _write_entries(self):
+        try:
+            self._write_queued_entries()
+        except OSError as err:
+            self._failed = True
+            self.errors += 1
+            logger.warn("Recording traffic to %s failed: %s" % (self.path, err))
+        finally:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+
+    def _write_queued_entries(self):
+        separator = ""
+        if self.format == "har":
+            self._file.write(
+                '{"log": {"version": "%s", "creator": {"name": "RequestsLibrary", '
+                '"version": "%s"}, "entries": [\n' % (HAR_VERSION, VERSION)
+            )
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            response, completed = item
+            for exchange in list(response.history) + [response]:
+                try:
+                    entry = json.dumps(build_har_entry(exchange, completed))
+                except Exception:
+                    self.errors += 1
+                    continue
+                if self.format == "har":
+                    self._file.write(separator + entry)
+                    separator = ",\n"
+                else:
+                    self._file.write(entry + "\n")
+                self.recorded += 1
+            if self._queue.empty():
+                self._file.flush()
+        if self.format == "har":
+            self._file.write("\n]}}\n")
+
+    def close(self):
+        """
+        Writes the queued exchanges and closes the file, it can be called more than once.
+        Warns when some exchanges have not been recorded.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        while self._thread.is_alive():
+            try:
+                self._queue.put(None, timeout=0.1)
+            except queue.Full:
+                continue
+            self._thread.join()
+        if self.dropped or self.errors:
+            logger.warn(
+                "%d requests have not been recorded to %s"
+                % (self.dropped + self.errors, self.path)
+            )
@@ -0,0 +1,308 @@
+import base64
+import io
+import json
+import os
+import threading
+from collections import defaultdict
+
+from requests.adapters import BaseAdapter
+from requests.exceptions import ConnectionError
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from RequestsLibrary.compat import httplib
+
+REPLAY_MODES = ("record", "replay", "new_episodes")
+REPLAY_MATCHERS = ("method", "url", "body", "headers")
+HEADER_MATCHER_PREFIX = "header:"
+# Headers compared by the headers matcher, the others change between runs
+MATCHED_HEADERS = ("Accept", "Accept-Language", "Content-Type")
+# Headers masked in the cassette, that is meant to be shared
+CREDENTIAL_HEADERS = ("Authorization", "Proxy-Authorization", "Cookie")
+MASK = "*****"
+
+
+def check_replay_mode(mode):
+    if mode not in REPLAY_MODES:
+        raise ValueError(
+            "Unknown replay mode: %s, valid values are %s"
+            % (mode, ", ".join(REPLAY_MODES))
+        )
+    return mode
+
+
+def parse_replay_match(match):
+    """
+    Converts a comma separated string, or a list, of matchers to a tuple.
+    Besides the ``REPLAY_MATCHERS``, ``header:<name>`` matches a single header.
+    """
+    if isinstance(match, str):
+        match = match.split(",")
+    match = tuple(m.strip() for m in match if m.strip())
+    for matcher in match:
+        if matcher.startswith(HEADER_MATCHER_PREFIX) and matcher[len(HEADER_MATCHER_PREFIX):]:
+            continue
+        if matcher not in REPLAY_MATCHERS:
+            raise ValueError(
+                "Unknown replay matcher: %s, valid values are %s and header:<name>"
+                % (matcher, ", ".join(REPLAY_MATCHERS))
+            )
+    return match
+
+
+def encode_body(body):
+    """
+    Bodies are stored as text when they are UTF-8, in base64 otherwise.
+    """
+    if body is None:
+        return None
+    if isinstance(body, str):
+        return body
+    try:
+        return body.decode("utf-8")
+    except UnicodeDecodeError:
+        return {"base64": base64.b64encode(body).decode("ascii")}
+
+
+def decode_body(body):
+    if body is None:
+        return b""
+    if isinstance(body, dict):
+        return base64.b64decode(body["base64"])
+    return body.encode("utf-8")
+
+
+def response_header_items(response):
+    """
+    Headers of the response as received, so with repeated ones like Set-Cookie.
+    """
+    original = getattr(response.raw, "_original_response", None)
+    msg = getattr(original, "msg", None)
+    if msg is not None:
+        return [[name, value] for name, value in msg.items()]
+    return [[name, value] for name, value in response.headers.items()]
+
+
+def request_body(request):
+    body = request.body
+    if body is not None and not isinstance(body, (bytes, str)):
+        # Streamed bodies have already been sent and can't be read again
+        return None
+    return encode_body(body)
+
+
+def mask_headers(headers):
+    """
+    Returns the headers as a dictionary with the credential headers masked.
+    """
+    credentials = [name.lower() for name in CREDENTIAL_HEADERS]
+    return dict(
+        (name, MASK if name.lower() in credentials else value)
+        for name, value in headers.items()
+    )
+
+
+def matched_headers(match):
+    """
+    Returns the names of the headers compared by the ``match`` matchers.
+    """
+    names = list(MATCHED_HEADERS) if "headers" in match else []
+    names.extend(
+        matcher[len(HEADER_MATCHER_PREFIX):]
+        for matcher in match
+        if matcher.startswith(HEADER_MATCHER_PREFIX)
+    )
+    return names
+
+
+def build_interaction(request, response):
+    return {
+        "request": {
+            "method": request.method,
+            "url": request.url,
+            "headers": mask_headers(request.headers),
+            "body": request_body(request),
+        },
+        "response": {
+            "status": response.status_code,
+            "reason": response.reason,
+            "url": response.url,
+            "headers": response_header_items(response),
+            "body": encode_body(response.content),
+        },
+    }
+
+
+class BufferedRawResponse(object):
+    """
+    Minimal urllib3 like raw response over a body already in memory, like
+    a replayed one, what requests needs to read the content and to extract
+    the cookies.
+    """
+
+    version = 11
+
+    def __init__(self, status, reason, headers, content):
+        self.status = status
+        self.reason = reason
+        self.msg = httplib.HTTPMessage()
+        for name, value in headers:
+            self.msg[name] = value
+        self._original_response = self
+        self._body = io.BytesIO(content)
+
+    def read(self, amt=None, **kwargs):
+        return self._body.read(amt)
+
+    def stream(self, chunk_size=1024, decode_content=True):
+        chunk = self._body.read(chunk_size)
+        while chunk:
+            yield chunk
+            chunk = self._body.read(chunk_size)
+
+    def close(self):
+        pass
+
+    def release_conn(self):
+        pass
+
+
+def build_replayed_response(request, interaction):
+    recorded = interaction["response"]
+    content = decode_body(recorded["body"])
+    response = Response()
+    response.status_code = recorded["status"]
+    response.reason = recorded["reason"]
+    response.url = recorded["url"]
+    response.headers = CaseInsensitiveDict()
+    for name, value in recorded["headers"]:
+        if name in response.headers:
+            response.headers[name] = "%s, %s" % (response.headers[name], value)
+        else:
+            response.headers[name] = value
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.raw = BufferedRawResponse(
+        response.status_code, response.reason, recorded["headers"], content
+    )
+    response._content = content
+    response._content_consumed = True
+    response.request = request
+    response.replayed = True
+    return response
+
+
+class Cassette(object):
+    """
+    The interactions, request and response pairs, recorded in a JSON Lines file.
+
+    The file is read when the cassette is created, and truncated in ``record``
+    mode, then each new interaction is appended to it as soon as it's recorded.
+    Requests are matched on the ``match`` attributes, each interaction is played
+    once in the order it was recorded and the last one is repeated when they are
+    all used, so the same request can have different responses over time.
+    """
+
+    def __init__(self, path, mode="new_episodes", match=("method", "url")):
+        self.path = path
+        self.mode = check_replay_mode(mode)
+        self.match = parse_replay_match(match)
+        self.headers = matched_headers(self.match)
+        self.interactions = []
+        self.played = set()
+        self.recorded = 0
+        # Interactions by method and url, the other matchers are checked one by one
+        self._index = defaultdict(list)
+        self._lock = threading.Lock()
+        if mode != "record" and os.path.exists(path):
+            with open(path, encoding="utf-8") as cassette:
+                for line in cassette:
+                    if line.strip():
+                        self._add(json.loads(line))
+        elif mode == "record":
+            open(path, "w").close()
+
+    def _key(self, method, url):
+        return (
+            method if "method" in self.match else None,
+            url if "url" in self.match else None,
+        )
+
+    def _add(self, interaction):
+        self.interactions.append(interaction)
+        recorded = interaction["request"]
+        self._index[self._key(recorded["method"], recorded["url"])].append(
+            len(self.interactions) - 1
+        )
+
+    def _matches(self, request, recorded):
+        if "body" in self.match and request_body(request) != recorded["body"]:
+            return False
+        if self.headers:
+            headers = CaseInsensitiveDict(mask_headers(request.headers))
+            recorded_headers = CaseInsensitiveDict(recorded["headers"])
+            for name in self.headers:
+                if headers.get(name) != recorded_headers.get(name):
+                    return False
+        return True
+
+    def play(self, request):
+        """
+        Returns the recorded interaction for the request, None if there's none.
+        """
+        with self._lock:
+            matching = [
+                index
+                for index in self._index.get(self._key(request.method, request.url), [])
+                if self._matches(request, self.interactions[index]["request"])
+            ]
+            if not matching:
+                return None
+            unplayed = [index for index in matching if index not in self.played]
+            index = unplayed[0] if unplayed else matching[-1]
+            self.played.add(index)
+            return self.interactions[index]
+
+    def record(self, request, response):
+        interaction = build_interaction(request, response)
+        with self._lock:
+            self._add(interaction)
+            self.played.add(len(self.interactions) - 1)
+            self.recorded += 1
+            with open(self.path, "a", encoding="utf-8") as cassette:
+                cassette.write(json.dumps(interaction, separators=(",", ":")) + "\n")
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    Transport adapter that plays the requests back from a ``Cassette``.
+
+    In ``record`` mode every request is sent with ``adapter`` and recorded,
+    in ``replay`` mode every request is served from the cassette and the ones
+    that have not been recorded fail, in ``new_episodes`` mode the recorded
+    requests are served from the cassette and the others sent and recorded.
+    """
+
+    def __init__(self, adapter, cassette):
+        super(ReplayAdapter, self).__init__()
+        self.adapter = adapter
+        self.cassette = cassette
+
+    def send(self, request, **kwargs):
+        if self.cassette.mode != "record":
+            interaction = self.cassette.play(request)
+            if interaction is not None:
+                return build_replayed_response(request, interaction)
+            if self.cassette.mode == "replay":
+                raise ConnectionError(
+                    "No recorded response for %s %s in cassette %s"
+                    % (request.method, request.url, self.cassette.path),
+                    request=request,
+                )
+        response = self.adapter.send(request, **kwargs)
+        self.cassette.record(request, response)
+        response.replayed = False
+        return response
+
+    def close(self):
+        self.adapter.close()
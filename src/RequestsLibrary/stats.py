@@ -0,0 +1,167 @@
+import math
+import re
+import threading
+from array import array
+
+from RequestsLibrary.compat import urlparse
+
+# Path segments that identify a resource rather than an endpoint
+ID_SEGMENT = re.compile(
+    r"^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+    r"|[0-9a-fA-F]{16,})$"
+)
+MAX_TEMPLATES = 100
+OTHER_TEMPLATE = "other"
+
+
+def url_template(method, url):
+    """
+    Returns the ``METHOD /path`` template of a request, with query string
+    removed and numeric, uuid or hexadecimal path segments replaced by ``{id}``.
+    """
+    path = urlparse(url).path or "/"
+    segments = ["{id}" if ID_SEGMENT.match(s) else s for s in path.split("/")]
+    return "%s %s" % (method.upper(), "/".join(segments))
+
+
+class LatencyHistogram(object):
+    """
+    Fixed memory histogram of latencies in the style of HdrHistogram.
+
+    Values are recorded in microseconds in log-linear buckets: every power of two
+    range is split in ``2 ** (sub_bucket_bits - 1)`` linear buckets, so a recorded
+    value is known within a relative error of ``2 ** (1 - sub_bucket_bits)``,
+    about 1.6% with the default 7 bits. Values above ``highest_value`` are clamped,
+    the exact maximum is kept apart.
+    """
+
+    def __init__(self, highest_value=3600 * 10**6, sub_bucket_bits=7):
+        self.sub_bucket_bits = sub_bucket_bits
+        self.sub_bucket_count = 1 << sub_bucket_bits
+        self.sub_bucket_half = self.sub_bucket_count >> 1
+        self.highest_value = highest_value
+        self.counts = array("Q", bytes(8 * (self._index(highest_value) + 1)))
+        self.total_count = 0
+        self.max_value = 0
+
+    def _index(self, value):
+        if value < self.sub_bucket_count:
+            return value
+        shift = value.bit_length() - self.sub_bucket_bits
+        return (
+            self.sub_bucket_count
+            + (shift - 1) * self.sub_bucket_half
+            + (value >> shift)
+            - self.sub_bucket_half
+        )
+
+    def _highest_equivalent_value(self, index):
+        if index < self.sub_bucket_count:
+            return index
+        shift, offset = divmod(index - self.sub_bucket_count, self.sub_bucket_half)
+        shift += 1
+        return ((self.sub_bucket_half + offset + 1) << shift) - 1
+
+    def record(self, value):
+        value = max(int(value), 0)
+        self.max_value = max(self.max_value, value)
+        self.counts[self._index(min(value, self.highest_value))] += 1
+        self.total_count += 1
+
+    def percentile(self, percentile):
+        """
+        Returns the value at the given percentile, 0 if nothing has been recorded.
+        """
+        if not self.total_count:
+            return 0
+        if percentile >= 100:
+            return self.max_value
+        target = max(int(math.ceil(percentile / 100.0 * self.total_count)), 1)
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= target:
+                return min(self._highest_equivalent_value(index), self.max_value)
+        return self.max_value
+
+
+class RequestStatistics(object):
+    """
+    Count, errors, received bytes and latency histogram of a set of requests.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.bytes = 0
+        self.histogram = LatencyHistogram()
+
+    def record(self, elapsed, size, error):
+        self.count += 1
+        self.bytes += size
+        if error:
+            self.errors += 1
+        if elapsed is not None:
+            self.histogram.record(elapsed * 10**6)
+
+    def summary(self):
+        """
+        Returns the statistics as a dictionary, latencies are in seconds.
+        """
+        summary = {"count": self.count, "errors": self.errors, "bytes": self.bytes}
+        for name, percentile in (("p50", 50), ("p90", 90), ("p99", 99)):
+            summary[name] = self.histogram.percentile(percentile) / 10.0**6
+        summary["max"] = self.histogram.max_value / 10.0**6
+        return summary
+
+
+class SessionStatistics(object):
+    """
+    Statistics of the requests sent on a session, in total and by URL template.
+
+    At most ``max_templates`` templates are kept, so that the memory used doesn't grow
+    with the number of different URLs, requests of any other template are recorded
+    together as ``other``.
+    """
+
+    def __init__(self, max_templates=MAX_TEMPLATES):
+        self.max_templates = max_templates
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.total = RequestStatistics()
+            self.templates = {}
+
+    def record(self, method, url, elapsed=None, size=0, error=False):
+        template = url_template(method, url)
+        with self._lock:
+            if template not in self.templates:
+                if len(self.templates) >= self.max_templates:
+                    template = OTHER_TEMPLATE
+                if template not in self.templates:
+                    self.templates[template] = RequestStatistics()
+            self.total.record(elapsed, size, error)
+            self.templates[template].record(elapsed, size, error)
+
+    def summary(self):
+        with self._lock:
+            summary = self.total.summary()
+            summary["requests"] = dict(
+                (template, stats.summary())
+                for template, stats in sorted(self.templates.items())
+            )
+        return summary
+
+
+def response_size(response):
+    """
+    Size of the response body, without reading it if the response is streamed.
+    """
+    if isinstance(response._content, bytes):
+        return len(response._content)
+    try:
+        return int(response.headers.get("Content-Length", 0))
+    except ValueError:
+        return 0
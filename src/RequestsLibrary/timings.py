@@ -0,0 +1,210 @@
+import socket
+from collections import namedtuple
+from time import perf_counter
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError
+from urllib3.util.connection import allowed_gai_family
+
+from RequestsLibrary.wiretrace import HTTP_VERSIONS, WireTraceConnectionMixin
+
+Timings = namedtuple("Timings", ["dns", "connect", "tls", "ttfb", "download", "total"])
+Timings.__doc__ = """Durations in seconds of the phases of a request.
+
+``dns``, ``connect`` and ``tls`` are zero when an already open connection is reused.
+``ttfb`` is the time to the first byte of the response, from when the request is sent,
+connection setup excluded, and ``download`` the time spent reading the body.
+"""
+
+
+def build_timings(start, headers_received, end, dns=0.0, connect=0.0, tls=0.0):
+    ttfb = max(headers_received - start - dns - connect - tls, 0.0)
+    return Timings(dns, connect, tls, ttfb, end - headers_received, end - start)
+
+
+class TimingConnectionMixin(object):
+    """
+    Records the DNS resolution, TCP connect and TLS handshake durations
+    of a new connection, they are handed out to the first request only.
+    """
+
+    setup_timings = None
+    _dns_time = 0.0
+    _connect_time = 0.0
+
+    def _new_conn(self):
+        dns_host = self._dns_host
+        start = perf_counter()
+        try:
+            addresses = socket.getaddrinfo(
+                dns_host, self.port, allowed_gai_family(), socket.SOCK_STREAM
+            )
+        except socket.gaierror:
+            # urllib3 raises its own name resolution error
+            return super(TimingConnectionMixin, self)._new_conn()
+        resolved = perf_counter()
+
+        # Connect to the already resolved addresses, the first that works is used
+        try:
+            for index, address in enumerate(addresses):
+                self._dns_host = address[4][0]
+                try:
+                    sock = super(TimingConnectionMixin, self)._new_conn()
+                    break
+                except ConnectTimeoutError:
+                    if index == len(addresses) - 1:
+                        raise
+        finally:
+            self._dns_host = dns_host
+
+        self._dns_time = resolved - start
+        self._connect_time = perf_counter() - resolved
+        return sock
+
+    def _setup_timings(self, total):
+        return (self._dns_time, self._connect_time, 0.0)
+
+    def connect(self):
+        start = perf_counter()
+        super(TimingConnectionMixin, self).connect()
+        self.setup_timings = self._setup_timings(perf_counter() - start)
+
+    def pop_setup_timings(self):
+        timings = self.setup_timings or (0.0, 0.0, 0.0)
+        self.setup_timings = None
+        return timings
+
+
+class TimingHTTPConnection(
+    WireTraceConnectionMixin, TimingConnectionMixin, HTTPConnection
+):
+    pass
+
+
+class TimingHTTPSConnection(
+    WireTraceConnectionMixin, TimingConnectionMixin, HTTPSConnection
+):
+
+    def _setup_timings(self, total):
+        tls = max(total - self._dns_time - self._connect_time, 0.0)
+        return (self._dns_time, self._connect_time, tls)
+
+
+class TimingHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimingHTTPConnection
+
+
+class TimingHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimingHTTPSConnection
+
+
+TIMING_POOL_CLASSES = {
+    "http": TimingHTTPConnectionPool,
+    "https": TimingHTTPSConnectionPool,
+}
+
+
+class TimingHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that attaches to each response the ``timings`` of the request
+    and, when ``wire_trace`` is 1 or more, its ``wire_trace``.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.wire_trace = int(kwargs.pop("wire_trace", 0))
+        super(TimingHTTPAdapter, self).__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super(TimingHTTPAdapter, self).init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = TIMING_POOL_CLASSES
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        manager = super(TimingHTTPAdapter, self).proxy_manager_for(
+            proxy, **proxy_kwargs
+        )
+        # SOCKS proxies have their own connection classes
+        if not proxy.lower().startswith("socks"):
+            manager.pool_classes_by_scheme = TIMING_POOL_CLASSES
+        return manager
+
+    def send(
+        self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None
+    ):
+        start = perf_counter()
+        response = super(TimingHTTPAdapter, self).send(
+            request,
+            stream=True,
+            timeout=timeout,
+            verify=verify,
+            cert=cert,
+            proxies=proxies,
+        )
+        headers_received = perf_counter()
+
+        connection = getattr(response.raw, "connection", None)
+        if isinstance(connection, TimingConnectionMixin):
+            dns, connect, tls = connection.pop_setup_timings()
+            trace = connection.pop_wire_trace()
+        else:
+            dns, connect, tls = (0.0, 0.0, 0.0)
+            trace = None
+
+        if not stream:
+            response.content
+        response.timings = build_timings(
+            start, headers_received, perf_counter(), dns, connect, tls
+        )
+        if self.wire_trace >= 1 and trace is not None:
+            trace.response(
+                HTTP_VERSIONS.get(response.raw.version, "HTTP/1.1"),
+                response.status_code,
+                response.reason,
+                response.raw.headers.items(),
+            )
+            if not stream:
+                trace.bytes_received = response.raw.tell()
+            trace.timings = response.timings
+            response.wire_trace = trace
+        return response
+
+
+class TraceTimer(object):
+    """
+    Callback for the httpx ``trace`` extension that records when the connection
+    phases and the response headers are completed. DNS resolution is part of the
+    TCP connect phase in httpx.
+    """
+
+    def __init__(self):
+        self.start = perf_counter()
+        self.events = {}
+
+    def __call__(self, name, info):
+        self.events[name] = perf_counter()
+
+    async def atrace(self, name, info):
+        self(name, info)
+
+    def _duration(self, phase):
+        started = self.events.get("connection.%s.started" % phase)
+        completed = self.events.get("connection.%s.complete" % phase)
+        if started is None or completed is None:
+            return 0.0
+        return completed - started
+
+    def timings(self, end):
+        received = [
+            t
+            for name, t in self.events.items()
+            if name.endswith("receive_response_headers.complete")
+        ]
+        headers_received = received[-1] if received else end
+        return build_timings(
+            self.start,
+            headers_received,
+            end,
+            connect=self._duration("connect_tcp"),
+            tls=self._duration("start_tls"),
+        )
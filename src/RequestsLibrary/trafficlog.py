@@ -0,0 +1,189 @@
+from collections import deque
+
+from robot.api import logger
+from robot.running.context import EXECUTION_CONTEXTS
+
+from RequestsLibrary import log
+
+LOG_MODES = ("full", "on_failure")
+
+
+def check_log_mode(mode):
+    if mode not in LOG_MODES:
+        raise ValueError(
+            "Unknown log mode: %s, valid values are %s" % (mode, ", ".join(LOG_MODES))
+        )
+    return mode
+
+
+def current_suite():
+    context = EXECUTION_CONTEXTS.current
+    return context.suite if context is not None else None
+
+
+def flush_traffic_log_on_failure(func):
+    """
+    Decorator of the library check methods that logs the buffered exchanges when they fail.
+    """
+
+    def decorator(self, *args, **kwargs):
+        try:
+            return func(self, *args, **kwargs)
+        except Exception:
+            self._traffic_log.flush()
+            raise
+
+    decorator.__name__ = func.__name__
+    decorator.__doc__ = func.__doc__
+    return decorator
+
+
+class LogSettings(object):
+    """
+    How the exchanges of the library, or of a session, are logged.
+
+    Only one exchange every ``sample_rate`` is logged, and once the bodies logged
+    in the current suite reach ``byte_budget`` characters the following exchanges
+    are logged without bodies. The counters of what has not been logged are kept
+    together with the settings, so sessions with their own settings are sampled
+    and budgeted apart from the library. The counters are reported with ``report``.
+    """
+
+    def __init__(self, mode="full", sample_rate=1, byte_budget=None):
+        try:
+            sample_rate = int(sample_rate)
+            byte_budget = int(byte_budget) if byte_budget is not None else None
+        except ValueError as err:
+            raise ValueError("Error converting log parameter: %s" % err)
+        if sample_rate < 1:
+            raise ValueError("Log sample rate must be at least 1: %s" % sample_rate)
+        if byte_budget is not None and byte_budget < 0:
+            raise ValueError("Log byte budget can't be negative: %s" % byte_budget)
+        self.mode = check_log_mode(mode)
+        self.sample_rate = sample_rate
+        self.byte_budget = byte_budget
+        self.exchanges = 0
+        self.suppressed = 0
+        self.bodies_suppressed = 0
+        self.suppressed_reported = 0
+        self.bodies_suppressed_reported = 0
+        self.budget_spent = 0
+        self.budget_reported = False
+        self._suite = None
+
+    def override(self, mode=None, sample_rate=None, byte_budget=None):
+        """
+        Returns new settings with the given values instead of the current ones,
+        or None when there's nothing to override.
+        """
+        if mode is None and sample_rate is None and byte_budget is None:
+            return None
+        return LogSettings(
+            mode if mode is not None else self.mode,
+            sample_rate if sample_rate is not None else self.sample_rate,
+            byte_budget if byte_budget is not None else self.byte_budget,
+        )
+
+    def is_sampled(self):
+        self.exchanges += 1
+        if (self.exchanges - 1) % self.sample_rate == 0:
+            return True
+        self.suppressed += 1
+        return False
+
+    def has_budget(self):
+        suite = current_suite()
+        if suite is not self._suite:
+            self._suite = suite
+            self.budget_spent = 0
+            self.budget_reported = False
+        if self.byte_budget is None or self.budget_spent < self.byte_budget:
+            return True
+        self.bodies_suppressed += 1
+        return False
+
+    def report_sampling(self):
+        if self.suppressed > self.suppressed_reported:
+            self.suppressed_reported = self.suppressed
+            logger.info(
+                "%d requests not logged so far, log_sample_rate is %d"
+                % (self.suppressed, self.sample_rate)
+            )
+
+    def report(self):
+        """
+        Logs how many exchanges have not been logged, and how many have been logged
+        without bodies, since the last report.
+        """
+        self.report_sampling()
+        if self.bodies_suppressed > self.bodies_suppressed_reported:
+            self.bodies_suppressed_reported = self.bodies_suppressed
+            logger.info(
+                "%d requests logged without bodies so far, log_byte_budget is %d"
+                % (self.bodies_suppressed, self.byte_budget)
+            )
+
+
+class TrafficLog(object):
+    """
+    Writes the requests and responses of the library to the Robot Framework log.
+
+    In ``full`` mode each request and response is logged as soon as it's completed.
+    In ``on_failure`` mode only a one line summary is logged, while the last
+    ``buffer_size`` responses are kept in a ring buffer and their requests and
+    responses are logged in full only when ``flush`` is called on a failure.
+    Both are subject to the sampling and byte budget of the ``LogSettings``.
+    With ``summary_only`` the exchanges are always logged with the one line summary.
+    """
+
+    def __init__(self, settings=None, buffer_size=10, digest=None):
+        try:
+            buffer_size = int(buffer_size)
+        except ValueError as err:
+            raise ValueError("Error converting log parameter: %s" % err)
+        if buffer_size < 1:
+            raise ValueError("Log buffer size must be at least 1: %s" % buffer_size)
+        self.settings = settings or LogSettings()
+        self.digest = digest
+        self.summary_only = False
+        self._buffer = deque(maxlen=buffer_size)
+
+    def log(self, response, settings=None):
+        """
+        Logs the exchange of the ``response`` with the given ``settings``,
+        the library ones when None.
+        """
+        settings = settings or self.settings
+        if settings.mode == "on_failure":
+            self._buffer.append(response)
+
+        if not settings.is_sampled():
+            return
+        settings.report_sampling()
+
+        if settings.mode == "on_failure" or self.summary_only:
+            log.log_summary(response)
+        elif settings.has_budget():
+            settings.budget_spent += log.log_request(response, self.digest)
+            settings.budget_spent += log.log_response(response, self.digest)
+        else:
+            if not settings.budget_reported:
+                settings.budget_reported = True
+                logger.info(
+                    "Log byte budget of %d spent, bodies are not logged until the end of the suite"
+                    % settings.byte_budget
+                )
+            log.log_request(response, self.digest, log_body=False)
+            log.log_response(response, self.digest, log_body=False)
+
+    def flush(self):
+        """
+        Logs in full the buffered exchanges, oldest first, and empties the buffer.
+        """
+        if not self._buffer:
+            return
+        logger.info("Last %d requests before the failure:" % len(self._buffer))
+        while self._buffer:
+            response = self._buffer.popleft()
+            log.log_request(response, self.digest)
+            log.log_response(response, self.digest)
@@ -6,20 +6,11 @@ from requests.status_codes import codes
 from requests.structures import CaseInsensitiveDict
 from robot.api import logger
 
+from RequestsLibrary.chunked import ChunkedBody
 from RequestsLibrary.compat import urlencode
 from RequestsLibrary.exceptions import UnknownStatusError
 
 
-class WritableObject:
-    """HTTP stream handler"""
-
-    def __init__(self):
-        self.content = []
-
-    def write(self, string):
-        self.content.append(string)
-
-
 def parse_named_status(status_code):
     """
     Converts named status from human readable to integer
@@ -93,8 +84,8 @@ def utf8_urlencode(data):
 
 
 def format_data_according_to_header(session, data, headers):
-    # when data is an open file descriptor we ignore it
-    if is_file_descriptor(data):
+    # when data is an open file descriptor or a chunked body we ignore it
+    if is_file_descriptor(data) or isinstance(data, ChunkedBody):
         return data
 
     # Merged headers are already case insensitive
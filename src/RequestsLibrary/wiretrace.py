@@ -0,0 +1,125 @@
+import requests
+from robot.api import logger
+
+HTTP_VERSIONS = {10: "HTTP/1.0", 11: "HTTP/1.1", 20: "HTTP/2"}
+
+
+class WireTrace(object):
+    """
+    What has been sent and received on the connection for a single request:
+    request line and headers, status line and headers, byte counts and timings.
+
+    Byte counts are of the bodies as they are on the wire, so before decompression
+    and with the chunked encoding framing. ``bytes_received`` is None when the
+    response is streamed and it has not been read yet.
+    """
+
+    def __init__(self):
+        self.sent = []
+        self.received = []
+        self.bytes_sent = 0
+        self.bytes_received = None
+        self.timings = None
+        self.headers_sent = False
+
+    def request_line(self, method, url, http_version="HTTP/1.1"):
+        self.sent.append("%s %s %s" % (method, url, http_version))
+
+    def header(self, name, value):
+        self.sent.append("%s: %s" % (name, value))
+
+    def response(self, http_version, status, reason, headers):
+        self.received.append("%s %s %s" % (http_version, status, reason or ""))
+        self.received.extend("%s: %s" % (name, value) for name, value in headers)
+
+    def format(self):
+        lines = ["send: %s" % line for line in self.sent]
+        lines.append("sent: %d body bytes" % self.bytes_sent)
+        lines.extend("reply: %s" % line for line in self.received[:1])
+        lines.extend("header: %s" % line for line in self.received[1:])
+        if self.bytes_received is not None:
+            lines.append("received: %d body bytes" % self.bytes_received)
+        if self.timings is not None:
+            lines.append(
+                "timings: "
+                + " ".join(
+                    "%s=%.3fs" % (name, value)
+                    for name, value in self.timings._asdict().items()
+                )
+            )
+        return "\n".join(lines)
+
+
+class WireTraceConnectionMixin(object):
+    """
+    Records in a ``WireTrace`` the request line, the headers and the body bytes
+    sent on the connection. A new trace is started by each request, the adapter
+    takes it with ``pop_wire_trace`` once the response has been received.
+    """
+
+    wire_trace = None
+
+    def putrequest(self, method, url, *args, **kwargs):
+        self.wire_trace = WireTrace()
+        self.wire_trace.request_line(method, url)
+        return super(WireTraceConnectionMixin, self).putrequest(
+            method, url, *args, **kwargs
+        )
+
+    def putheader(self, header, *values):
+        super(WireTraceConnectionMixin, self).putheader(header, *values)
+        if self.wire_trace is not None:
+            self.wire_trace.header(header, ", ".join(str(v) for v in values))
+
+    def endheaders(self, *args, **kwargs):
+        super(WireTraceConnectionMixin, self).endheaders(*args, **kwargs)
+        if self.wire_trace is not None:
+            self.wire_trace.headers_sent = True
+
+    def send(self, data):
+        super(WireTraceConnectionMixin, self).send(data)
+        trace = self.wire_trace
+        if trace is not None and trace.headers_sent and isinstance(data, (bytes, bytearray)):
+            trace.bytes_sent += len(data)
+
+    def pop_wire_trace(self):
+        trace, self.wire_trace = self.wire_trace, None
+        return trace
+
+
+def build_httpx_wire_trace(httpx_request, httpx_response, timings=None):
+    """
+    Builds the trace of a request sent with httpx, from the request and response
+    as they have been sent and received by the transport.
+    """
+    trace = WireTrace()
+    trace.request_line(
+        httpx_request.method,
+        httpx_request.url.raw_path.decode("ascii"),
+        httpx_response.http_version,
+    )
+    for name, value in httpx_request.headers.multi_items():
+        trace.header(name, value)
+    trace.bytes_sent = int(httpx_request.headers.get("Content-Length", 0))
+    trace.response(
+        httpx_response.http_version,
+        httpx_response.status_code,
+        httpx_response.reason_phrase,
+        httpx_response.headers.multi_items(),
+    )
+    if httpx_response.is_stream_consumed:
+        trace.bytes_received = httpx_response.num_bytes_downloaded
+    trace.timings = timings
+    return trace
+
+
+def log_wire_trace(response):
+    """
+    Logs at DEBUG level the wire trace of the response and of its redirects, if any.
+    """
+    if not isinstance(response, requests.Response):
+        return
+    for r in response.history + [response]:
+        trace = getattr(r, "wire_trace", None)
+        if trace is not None:
+            logger.debug(trace.format())
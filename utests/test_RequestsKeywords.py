@@ -1,3 +1,5 @@
+import pytest
+
 from RequestsLibrary import RequestsLibrary
 from utests import mock
 
@@ -81,3 +83,31 @@ def test_merge_url_with_url_override_base():
     session, keywords = build_mocked_session_keywords('http://www.domain.com')
     url = keywords._merge_url(session, 'https://new.domain.com')
     assert url == 'https://new.domain.com'
+
+
+def test_session_less_request_function_without_keep_alive():
+    keywords = RequestsLibrary()
+    assert keywords._get_session_less_request_function() == keywords._session_less_request
+
+
+def test_session_less_request_function_with_keep_alive_shares_adapters():
+    keywords = RequestsLibrary(session_less_keep_alive=True)
+    first = keywords._get_session_less_request_function().__self__
+    second = keywords._get_session_less_request_function().__self__
+    assert first is not second
+    assert first.get_adapter('https://a.domain.com') is second.get_adapter('https://b.domain.com')
+    assert first.get_adapter('http://a.domain.com') is second.get_adapter('http://b.domain.com')
+
+
+def test_session_less_keep_alive_does_not_share_cookies():
+    keywords = RequestsLibrary(session_less_keep_alive='True')
+    first = keywords._get_session_less_request_function().__self__
+    first.cookies.set('a', '1')
+    second = keywords._get_session_less_request_function().__self__
+    assert len(second.cookies) == 0
+
+
+def test_log_binary_digest_must_be_a_known_algorithm():
+    assert RequestsLibrary(log_binary_digest='sha256').log_binary_digest == 'sha256'
+    with pytest.raises(ValueError):
+        RequestsLibrary(log_binary_digest='not-a-digest')
@@ -1,5 +1,10 @@
+import io
 import os
 
+import pytest
+from requests import Response
+from requests.exceptions import ConnectionError
+
 from RequestsLibrary import RequestsLibrary
 from utests import SCRIPT_DIR
 from utests import mock
@@ -32,6 +37,16 @@ def test_common_request_files_descriptor_closing_when_passed_as_files_param():
             assert f2.closed is True
 
 
+def test_common_request_files_are_streamed():
+    session, m_common_request = build_mocked_session_common_request()
+    with open(os.path.join(SCRIPT_DIR, '../atests/randombytes.bin'), 'rb') as f:
+        m_common_request('post', session, '/', data={'name': 'value'}, files={'randombytes': f})
+        kwargs = session.request.call_args[1]
+        assert kwargs['files'] is None
+        assert kwargs['headers']['Content-Type'] == kwargs['data'].content_type
+        assert f.closed is True
+
+
 def test_common_request_verify_override_true():
     session, m_common_request = build_mocked_session_common_request(verify=False)
     m_common_request('get', session, '/', verify=True)
@@ -100,3 +115,116 @@ def test_common_request_with_touple_timeout_override():
     session, m_common_request = build_mocked_session_common_request(timeout=None)
     m_common_request('get', session, '/', timeout=(123.4, 432.1))
     session.request.assert_called_with('get','http://mocking.rules/', timeout=(123.4, 432.1), cookies={})
+
+
+def build_response(method, url, status_code=200, **kwargs):
+    response = Response()
+    response.status_code = status_code
+    response.url = url
+    return response
+
+
+@mock.patch('RequestsLibrary.trafficlog.log')
+def test_send_requests_concurrently_keeps_requests_order(mocked_log):
+    keywords = RequestsLibrary()
+    session = keywords.create_session('alias', 'http://mocking.rules')
+    session.request = mock.MagicMock(side_effect=build_response)
+    requests = [{'method': 'GET', 'url': '/%s' % i} for i in range(20)]
+    responses = keywords.send_requests_concurrently('alias', requests, max_workers=5)
+    assert [r.url for r in responses] == ['http://mocking.rules/%s' % i for i in range(20)]
+    assert keywords.last_response is responses[-1]
+    assert mocked_log.log_response.call_count == 20
+
+
+@mock.patch('RequestsLibrary.trafficlog.log')
+def test_send_requests_concurrently_passes_request_arguments(mocked_log):
+    keywords = RequestsLibrary()
+    session = keywords.create_session('alias', 'http://mocking.rules')
+    session.request = mock.MagicMock(side_effect=build_response)
+    requests = [{'method': 'POST', 'url': '/', 'json': {'a': 1}, 'expected_status': '200'},
+                {'method': 'HEAD', 'url': '/'}]
+    keywords.send_requests_concurrently('alias', requests)
+    session.request.assert_any_call('POST', 'http://mocking.rules/', timeout=None, cookies={}, json={'a': 1})
+    session.request.assert_any_call('HEAD', 'http://mocking.rules/', timeout=None, cookies={},
+                                    allow_redirects=False)
+    assert 'expected_status' in requests[0]
+
+
+@mock.patch('RequestsLibrary.trafficlog.log')
+def test_send_requests_concurrently_checks_each_status(mocked_log):
+    keywords = RequestsLibrary()
+    session = keywords.create_session('alias', 'http://mocking.rules')
+    session.request = mock.MagicMock(side_effect=lambda method, url, **kwargs: build_response(
+        method, url, status_code=201 if url.endswith('created') else 200))
+    requests = [{'method': 'GET', 'url': '/ok'},
+                {'method': 'GET', 'url': '/created', 'expected_status': 'OK'}]
+    with pytest.raises(AssertionError, match='/created Expected status: 201 != 200'):
+        keywords.send_requests_concurrently('alias', requests)
+
+
+def test_send_requests_concurrently_without_url():
+    keywords = RequestsLibrary()
+    keywords.create_session('alias', 'http://mocking.rules')
+    with pytest.raises(ValueError):
+        keywords.send_requests_concurrently('alias', [{'method': 'GET'}])
+
+
+@mock.patch('RequestsLibrary.trafficlog.log')
+def test_session_statistics_are_recorded(mocked_log):
+    keywords = RequestsLibrary()
+    session = keywords.create_session('alias', 'http://mocking.rules')
+    session.request = mock.MagicMock(side_effect=lambda method, url, **kwargs: build_response(
+        method, url, status_code=404 if url.endswith('missing') else 200))
+    requests = [{'method': 'GET', 'url': '/posts/%s' % i} for i in range(10)]
+    keywords.send_requests_concurrently('alias', requests)
+    keywords.get_on_session('alias', '/missing', expected_status='404')
+
+    session.request.side_effect = ConnectionError()
+    with pytest.raises(ConnectionError):
+        keywords.post_on_session('alias', '/posts')
+
+    stats = keywords.get_session_statistics('alias', reset=True)
+    assert stats['count'] == 12
+    assert stats['errors'] == 2
+    assert stats['requests']['GET /posts/{id}']['count'] == 10
+    assert stats['requests']['GET /missing']['errors'] == 1
+    assert stats['requests']['POST /posts']['errors'] == 1
+    assert keywords.get_session_statistics('alias')['count'] == 0
+
+
+@mock.patch('RequestsLibrary.trafficlog.log')
+def test_failed_download_is_logged(mocked_log, tmp_path):
+    keywords = RequestsLibrary()
+    session = keywords.create_session('alias', 'http://mocking.rules', log_mode='on_failure')
+    response = build_response('GET', 'http://mocking.rules/file.bin')
+    response.headers['Content-Length'] = '1000'
+    session.request = mock.MagicMock(return_value=response)
+    with pytest.raises(AssertionError, match='Download is bigger than max size of 10 bytes'):
+        keywords.download_file_on_session('alias', '/file.bin', str(tmp_path / 'file.bin'),
+                                          max_size=10)
+    mocked_log.log_response.assert_called_once()
+    assert mocked_log.log_response.call_args[0][0] is response
+
+
+@mock.patch('RequestsLibrary.trafficlog.log')
+def test_ranged_download_fails_when_resource_changes(mocked_log, tmp_path):
+    keywords = RequestsLibrary()
+    session = keywords.create_session('alias', 'http://mocking.rules')
+    range_headers = []
+
+    def request(method, url, **kwargs):
+        response = build_response(method, url)
+        response.raw = io.BytesIO(b'')
+        response.headers['ETag'] = '"v1"' if method == 'HEAD' else '"v2"'
+        response.headers['Accept-Ranges'] = 'bytes'
+        response.headers['Content-Length'] = '1000'
+        if method == 'GET':
+            range_headers.append(kwargs['headers'])
+        return response
+
+    session.request = mock.MagicMock(side_effect=request)
+    with pytest.raises(AssertionError, match='Expected the bytes .* but the response is 200'):
+        keywords.download_file_on_session('alias', '/file.bin', str(tmp_path / 'file.bin'),
+                                          chunk_size=100, connections=2)
+    assert range_headers and all(headers['If-Range'] == '"v1"' for headers in range_headers)
+    assert list(tmp_path.iterdir()) == []
@@ -1,4 +1,9 @@
+import threading
 import unittest
+from datetime import timedelta
+
+import pytest
+from requests.models import Response
 
 from RequestsLibrary import compat
 from RequestsLibrary.RequestsKeywords import RequestsKeywords
@@ -31,3 +36,72 @@ class TestUrlLibWarnings(unittest.TestCase):
         with self.assertRaises(AssertionError):
             with self.assertWarns(DeprecationWarning):
                 keywords.create_session('alias', 'http://mocking.rules')
+
+
+def test_create_session_pool_settings_are_applied():
+    keywords = SessionKeywords()
+    session = keywords.create_session('alias', 'http://mocking.rules',
+                                      pool_connections='4', pool_maxsize='20', pool_block='True')
+    for prefix in ('http://', 'https://'):
+        adapter = session.get_adapter(prefix)
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 20
+        assert adapter._pool_block is True
+
+
+def test_create_session_pool_settings_are_applied_without_retries():
+    keywords = SessionKeywords()
+    session = keywords.create_session('alias', 'http://mocking.rules', max_retries=0, pool_maxsize=50)
+    adapter = session.get_adapter('https://')
+    assert adapter._pool_maxsize == 50
+    assert adapter.max_retries.total == 0
+
+
+def _response_with_elapsed(seconds):
+    response = Response()
+    response.url = 'http://mocking.rules/'
+    response.elapsed = timedelta(seconds=seconds)
+    return response
+
+
+def test_check_response_time_passes_when_faster():
+    SessionKeywords()._check_response_time('200ms', _response_with_elapsed(0.1))
+    SessionKeywords()._check_response_time('1', _response_with_elapsed(0.5))
+
+
+def test_check_response_time_is_skipped_without_max_time():
+    SessionKeywords()._check_response_time(None, _response_with_elapsed(10))
+
+
+def test_check_response_time_fails_when_slower():
+    with pytest.raises(AssertionError) as err:
+        SessionKeywords()._check_response_time('0.5s', _response_with_elapsed(0.75), 'Too slow')
+    assert str(err.value) == 'Too slow Url: http://mocking.rules/ Response time 0.750s is not less than 0.500s'
+
+
+def test_timeout_and_cookies_are_kept_by_session():
+    keywords = SessionKeywords()
+    first = keywords.create_session('first', 'http://mocking.rules', timeout=1, cookies={'a': '1'})
+    second = keywords.create_session('second', 'http://mocking.rules', timeout=(2, 3))
+    assert keywords._get_timeout(first, None) == 1.0
+    assert keywords._get_timeout(second, None) == (2.0, 3.0)
+    assert keywords._get_timeout(first, 5) == 5.0
+    assert keywords._get_timeout(None, None) is None
+    assert first.request_cookies == {'a': '1'}
+    assert second.request_cookies == {}
+
+
+def test_last_response_is_kept_by_thread_and_by_session():
+    keywords = SessionKeywords()
+    session = keywords.create_session('alias', 'http://mocking.rules')
+    response = Response()
+    keywords._set_last_response(session, response)
+
+    other_thread = []
+    thread = threading.Thread(target=lambda: other_thread.append(keywords.get_last_response()))
+    thread.start()
+    thread.join()
+
+    assert other_thread == [None]
+    assert keywords.get_last_response() is response
+    assert keywords.get_last_response('alias') is response
@@ -0,0 +1,75 @@
+import json
+
+import pytest
+import requests
+
+from RequestsLibrary.apptransport import (
+    ASGIAdapter,
+    WSGIAdapter,
+    build_app_adapter,
+    import_app,
+)
+
+
+def wsgi_app(environ, start_response):
+    body = environ['wsgi.input'].read(int(environ.get('CONTENT_LENGTH') or 0))
+    start_response('201 Created', [('Content-Type', 'application/json'),
+                                   ('Set-Cookie', 'a=1'), ('Set-Cookie', 'b=2')])
+    return [json.dumps({
+        'method': environ['REQUEST_METHOD'],
+        'path': environ['PATH_INFO'],
+        'query': environ['QUERY_STRING'],
+        'host': environ['SERVER_NAME'],
+        'header': environ.get('HTTP_X_TEST'),
+        'body': body.decode('utf-8'),
+    }).encode('utf-8')]
+
+
+async def asgi_app(scope, receive, send):
+    message = await receive()
+    await send({'type': 'http.response.start', 'status': 200,
+                'headers': [(b'content-type', b'text/plain')]})
+    await send({'type': 'http.response.body', 'body': b'%s %s ' % (
+        scope['method'].encode(), scope['path'].encode()), 'more_body': True})
+    await send({'type': 'http.response.body', 'body': message['body']})
+
+
+def _session(app):
+    session = requests.Session()
+    adapter = build_app_adapter(app)
+    session.mount('http://', adapter)
+    return session, adapter
+
+
+def test_import_app():
+    assert import_app('json:dumps') is json.dumps
+    assert import_app(wsgi_app) is wsgi_app
+    with pytest.raises(ValueError):
+        import_app('json')
+
+
+def test_app_type_is_detected():
+    assert isinstance(build_app_adapter(wsgi_app), WSGIAdapter)
+    assert isinstance(build_app_adapter(asgi_app), ASGIAdapter)
+    with pytest.raises(ValueError):
+        build_app_adapter('json:__name__')
+
+
+def test_wsgi_app_is_called_in_process():
+    session, _ = _session(wsgi_app)
+    response = session.post('http://testserver/some%20path?id=1', data='body',
+                            headers={'X-Test': 'yes'})
+    assert response.status_code == 201
+    assert response.reason == 'Created'
+    assert response.json() == {'method': 'POST', 'path': '/some path', 'query': 'id=1',
+                               'host': 'testserver', 'header': 'yes', 'body': 'body'}
+    assert response.headers['Set-Cookie'] == 'a=1, b=2'
+    assert session.cookies.get_dict() == {'a': '1', 'b': '2'}
+
+
+def test_asgi_app_is_called_in_process():
+    session, _ = _session(asgi_app)
+    response = session.put('http://testserver/items', data=b'data')
+    assert response.status_code == 200
+    assert response.reason == 'OK'
+    assert response.text == 'PUT /items data'
@@ -0,0 +1,151 @@
+from email.utils import formatdate
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.models import Response
+
+from RequestsLibrary.cache import (
+    CacheEntry,
+    CachingAdapter,
+    ResponseCache,
+    parse_cache_control,
+)
+
+URL = 'http://mocking.rules/config'
+
+
+class FakeAdapter(BaseAdapter):
+
+    def __init__(self, *responses):
+        super(FakeAdapter, self).__init__()
+        self.responses = list(responses)
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        status, headers, content = self.responses.pop(0)
+        response = Response()
+        response.status_code = status
+        response.headers.update(headers)
+        response._content = content
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def _session(*responses, **cache_settings):
+    adapter = FakeAdapter(*responses)
+    cache = ResponseCache(**cache_settings)
+    session = requests.Session()
+    session.mount('http://', CachingAdapter(adapter, cache))
+    return session, adapter, cache
+
+
+def test_parse_cache_control():
+    assert parse_cache_control('max-age=60, No-Cache, private="x"') == {
+        'max-age': '60', 'no-cache': None, 'private': 'x'}
+    assert parse_cache_control(None) == {}
+
+
+def test_fresh_response_is_served_from_cache():
+    session, adapter, cache = _session((200, {'Cache-Control': 'max-age=60'}, b'data'))
+    first = session.get(URL)
+    second = session.get(URL)
+    assert len(adapter.requests) == 1
+    assert first.from_cache is False
+    assert second.from_cache is True
+    assert second.content == b'data'
+    assert second.headers['Age'] == '0'
+    assert cache.summary() == {'hits': 1, 'misses': 1, 'entries': 1, 'bytes': 4}
+
+
+def test_stale_response_is_revalidated_with_etag():
+    session, adapter, _ = _session(
+        (200, {'Cache-Control': 'max-age=0', 'ETag': '"v1"'}, b'data'),
+        (304, {'Cache-Control': 'max-age=60', 'ETag': '"v1"'}, b''))
+    session.get(URL)
+    response = session.get(URL)
+    assert adapter.requests[1].headers['If-None-Match'] == '"v1"'
+    assert response.status_code == 200
+    assert response.content == b'data'
+    assert response.from_cache is True
+    # the 304 headers refreshed the entry
+    assert session.get(URL).from_cache is True
+    assert len(adapter.requests) == 2
+
+
+def test_stale_response_is_replaced_when_changed():
+    session, adapter, _ = _session(
+        (200, {'Last-Modified': formatdate(0, usegmt=True), 'Cache-Control': 'no-cache'}, b'old'),
+        (200, {'Cache-Control': 'max-age=60'}, b'new'))
+    session.get(URL)
+    response = session.get(URL)
+    assert 'If-Modified-Since' in adapter.requests[1].headers
+    assert response.content == b'new'
+    assert session.get(URL).content == b'new'
+
+
+def test_heuristic_freshness_from_last_modified():
+    entry = CacheEntry(
+        FakeAdapter((200, {'Date': formatdate(1000, usegmt=True),
+                           'Last-Modified': formatdate(0, usegmt=True)}, b'')).send(
+            requests.Request('GET', URL).prepare()),
+        1000, 1000)
+    assert entry.freshness_lifetime() == 100
+    assert entry.is_fresh(1050)
+    assert not entry.is_fresh(1101)
+
+
+def test_no_store_and_uncacheable_responses_are_not_stored():
+    session, adapter, cache = _session(
+        (200, {'Cache-Control': 'no-store, max-age=60'}, b'data'),
+        (200, {}, b'data'),
+        (200, {'Cache-Control': 'max-age=60'}, b'data'))
+    session.get(URL)
+    session.get(URL)
+    session.get(URL, headers={'Cache-Control': 'no-store'})
+    assert len(adapter.requests) == 3
+    assert len(cache) == 0
+
+
+def test_unsafe_request_invalidates_entry():
+    session, adapter, cache = _session(
+        (200, {'Cache-Control': 'max-age=60'}, b'data'),
+        (201, {}, b''),
+        (200, {'Cache-Control': 'max-age=60'}, b'new'))
+    session.get(URL)
+    session.post(URL, data='x')
+    assert len(cache) == 0
+    assert session.get(URL).content == b'new'
+
+
+def test_vary_header_must_match():
+    session, adapter, _ = _session(
+        (200, {'Cache-Control': 'max-age=60', 'Vary': 'Accept'}, b'json'),
+        (200, {'Cache-Control': 'max-age=60', 'Vary': 'Accept'}, b'xml'))
+    session.get(URL, headers={'Accept': 'application/json'})
+    assert session.get(URL, headers={'Accept': 'application/xml'}).content == b'xml'
+    assert len(adapter.requests) == 2
+
+
+def test_least_recently_used_entries_are_evicted():
+    fresh = (200, {'Cache-Control': 'max-age=60'}, b'12345')
+    session, adapter, cache = _session(fresh, fresh, fresh, fresh, max_entries=2, max_bytes=12)
+    session.get(URL + '/1')
+    session.get(URL + '/2')
+    session.get(URL + '/1')
+    session.get(URL + '/3')
+    assert session.get(URL + '/1').from_cache is True
+    assert session.get(URL + '/2').from_cache is False
+    assert len(cache) == 2
+    assert cache.size == 10
+
+
+def test_responses_bigger_than_cache_are_not_stored():
+    session, adapter, cache = _session((200, {'Cache-Control': 'max-age=60'}, b'12345'), max_bytes=4)
+    session.get(URL)
+    assert len(cache) == 0
@@ -0,0 +1,47 @@
+import pytest
+import requests
+
+from RequestsLibrary.chunked import (
+    ChunkedBody,
+    check_chunk_size,
+    iter_file_chunks,
+    iter_rechunked,
+)
+from RequestsLibrary.log import format_request_body_to_log_string
+
+
+def test_iter_file_chunks(tmp_path):
+    path = tmp_path / 'body.bin'
+    path.write_bytes(b'0123456789')
+    assert list(iter_file_chunks(str(path), 4)) == [b'0123', b'4567', b'89']
+
+
+def test_iter_rechunked():
+    assert list(iter_rechunked(['abc', b'de', 1, 'fgh'], 3)) == [b'abc', b'de1', b'fgh']
+    assert list(iter_rechunked(['abcdefg'], 3)) == [b'abc', b'def', b'g']
+
+
+def test_check_chunk_size():
+    assert check_chunk_size('10') == 10
+    with pytest.raises(ValueError):
+        check_chunk_size(0)
+    with pytest.raises(ValueError):
+        check_chunk_size('a lot')
+
+
+def test_chunked_body_counts_bytes_sent():
+    body = ChunkedBody(['abc', b'', 'de'], 'list')
+    assert list(body) == [b'abc', b'de']
+    assert body.bytes_sent == 5
+    assert body.chunks_sent == 2
+    assert body.elapsed is not None
+    assert repr(body).startswith('<chunked body from list, 5 bytes in 2 chunks sent in ')
+
+
+def test_chunked_body_is_sent_with_transfer_encoding():
+    body = ChunkedBody([b'data'])
+    prepared = requests.Request('POST', 'http://mocking.rules', data=body).prepare()
+    assert prepared.headers['Transfer-Encoding'] == 'chunked'
+    assert 'Content-Length' not in prepared.headers
+    assert format_request_body_to_log_string(prepared) == (
+        '<chunked body, 0 bytes in 0 chunks, not completely sent>')
@@ -0,0 +1,163 @@
+import gzip
+import io
+import zlib
+
+import pytest
+import requests
+import urllib3
+from requests.adapters import BaseAdapter
+from requests.exceptions import ContentDecodingError
+from requests.models import Response
+from urllib3.response import HTTPResponse
+
+from RequestsLibrary.chunked import ChunkedBody
+from RequestsLibrary.compression import (
+    CompressingAdapter,
+    DecodedSizeLimitAdapter,
+    check_request_compression,
+    compress_body,
+    compress_request,
+)
+
+BODY = b'{"message": "compress me"}\n' * 100
+
+
+class FakeAdapter(BaseAdapter):
+
+    def __init__(self, body=None, content=b'', encoding='gzip'):
+        super(FakeAdapter, self).__init__()
+        self.requests = []
+        self.body = body
+        self.content = content
+        self.encoding = encoding
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        response = Response()
+        response.status_code = 200
+        response.url = request.url
+        response.request = request
+        if self.body is None:
+            response._content = self.content
+            response._content_consumed = True
+        else:
+            response.raw = HTTPResponse(io.BytesIO(self.body), preload_content=False,
+                                        headers={'Content-Encoding': self.encoding})
+        return response
+
+    def close(self):
+        pass
+
+
+def _prepare(data=None, json=None, headers=None):
+    return requests.Request('POST', 'http://mocking.rules', data=data, json=json,
+                            headers=headers).prepare()
+
+
+def test_check_request_compression():
+    assert check_request_compression(None) == (None, 1024)
+    assert check_request_compression('GZIP', '10') == ('gzip', 10)
+    with pytest.raises(ValueError):
+        check_request_compression('br')
+
+
+@pytest.mark.parametrize('encoding, decompress', [
+    ('gzip', gzip.decompress),
+    ('deflate', zlib.decompress),
+])
+def test_body_is_compressed(encoding, decompress):
+    request = _prepare(data=BODY)
+    compressed = compress_request(request, encoding)
+    assert compressed.headers['Content-Encoding'] == encoding
+    assert compressed.headers['Content-Length'] == str(len(compressed.body))
+    assert decompress(compressed.body) == BODY
+    assert request.body == BODY
+    assert 'Content-Encoding' not in request.headers
+
+
+def test_gzip_body_is_always_the_same():
+    assert compress_request(_prepare(data=BODY), 'gzip').body == compress_request(
+        _prepare(data=BODY), 'gzip').body
+
+
+def test_small_or_encoded_bodies_are_not_compressed():
+    small = _prepare(json={'a': 1})
+    assert compress_request(small, 'gzip') is small
+    encoded = _prepare(data=BODY, headers={'Content-Encoding': 'br'})
+    assert compress_request(encoded, 'gzip') is encoded
+    assert compress_request(_prepare(), 'gzip').body is None
+
+
+def test_streamed_body_is_compressed_while_sent():
+    request = _prepare(data=io.BytesIO(BODY))
+    compressed = compress_request(request, 'gzip')
+    assert isinstance(compressed.body, ChunkedBody)
+    assert compressed.headers['Transfer-Encoding'] == 'chunked'
+    assert 'Content-Length' not in compressed.headers
+    assert gzip.decompress(b''.join(compressed.body)) == BODY
+
+
+def test_compressing_adapter():
+    adapter = FakeAdapter()
+    session = requests.Session()
+    session.mount('http://', CompressingAdapter(adapter, 'deflate', 10))
+    session.post('http://mocking.rules', json={'message': 'compress me'})
+    sent = adapter.requests[0]
+    assert sent.headers['Content-Encoding'] == 'deflate'
+    assert zlib.decompress(sent.body) == b'{"message": "compress me"}'
+
+
+def _limited_session(body, max_size, encoding='gzip'):
+    session = requests.Session()
+    session.mount('http://', DecodedSizeLimitAdapter(FakeAdapter(body, encoding=encoding),
+                                                     max_size))
+    return session
+
+
+def test_decoded_body_within_max_size():
+    response = _limited_session(gzip.compress(BODY), len(BODY)).get('http://mocking.rules')
+    assert response.content == BODY
+
+
+def _compress_br(data):
+    brotli = pytest.importorskip('brotli')
+    return brotli.compress(data)
+
+
+def _compress_zstd(data):
+    if not urllib3.response.HAS_ZSTD:
+        pytest.skip('zstd decoding not supported by urllib3')
+    pytest.importorskip('zstandard')
+    return compress_body(data, 'zstd')
+
+
+@pytest.mark.parametrize('encoding, compress', [('br', _compress_br), ('zstd', _compress_zstd)])
+def test_br_and_zstd_bodies_are_decoded(encoding, compress):
+    assert encoding in requests.utils.DEFAULT_ACCEPT_ENCODING
+    body = compress(BODY)
+    response = _limited_session(body, len(BODY), encoding).get('http://mocking.rules')
+    assert response.content == BODY
+    with pytest.raises(ContentDecodingError):
+        _limited_session(body, len(BODY) - 1, encoding).get('http://mocking.rules')
+
+
+def test_decompression_bomb_fails_before_being_decoded():
+    bomb = gzip.compress(b'\0' * 10 * 1024 * 1024)
+    response = _limited_session(bomb, 1024).get('http://mocking.rules', stream=True)
+    chunks = response.iter_content(512)
+    assert len(next(chunks)) == 512
+    with pytest.raises(ContentDecodingError) as err:
+        next(chunks)
+        next(chunks)
+    assert str(err.value) == 'Url: http://mocking.rules/ Decoded body is bigger than max size of 1024 bytes'
+    assert response.raw.decoded_size <= 1536
+
+
+def test_read_content_is_checked():
+    session = requests.Session()
+    session.mount('http://', DecodedSizeLimitAdapter(FakeAdapter(content=b'abc'), 3))
+    assert session.get('http://mocking.rules').content == b'abc'
+    session.mount('http://', DecodedSizeLimitAdapter(FakeAdapter(content=b'abc'), 2))
+    with pytest.raises(ContentDecodingError) as err:
+        session.get('http://mocking.rules')
+    assert 'Decoded body is bigger than max size of 2 bytes' in str(err.value)
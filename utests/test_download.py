@@ -0,0 +1,210 @@
+import hashlib
+import io
+
+import pytest
+import requests
+from requests.models import Response
+
+from RequestsLibrary.download import (
+    Download,
+    check_download_settings,
+    format_download_to_log_string,
+    preallocate,
+    ranged_download_size,
+    resume_validator,
+    save_range,
+    save_response,
+    split_ranges,
+)
+from RequestsLibrary.log import format_response_body_to_log_string
+
+BODY = b'0123456789' * 100
+
+
+class BrokenRaw(io.BytesIO):
+
+    def __init__(self, body, broken_at):
+        super(BrokenRaw, self).__init__(body)
+        self.broken_at = broken_at
+
+    def read(self, size=-1):
+        if self.tell() >= self.broken_at:
+            raise requests.exceptions.ChunkedEncodingError('Connection reset by peer')
+        return super(BrokenRaw, self).read(min(size, self.broken_at - self.tell()))
+
+
+def _streamed_response(body=BODY, content_length=True, broken_at=None):
+    response = Response()
+    response.status_code = 200
+    response.url = 'http://mocking.rules/file.bin'
+    response.raw = io.BytesIO(body) if broken_at is None else BrokenRaw(body, broken_at)
+    if content_length:
+        response.headers['Content-Length'] = str(len(body))
+    return response
+
+
+def test_save_response(tmp_path):
+    path = str(tmp_path / 'file.bin')
+    download = save_response(_streamed_response(), path, chunk_size=64)
+    assert download == Download(path, len(BODY), 'sha256', hashlib.sha256(BODY).hexdigest())
+    with open(path, 'rb') as saved:
+        assert saved.read() == BODY
+    assert not (tmp_path / 'file.bin.part').exists()
+
+
+@pytest.mark.parametrize('digest', [None, 'None', 'NONE', ''])
+def test_save_response_without_digest(tmp_path, digest):
+    download = save_response(_streamed_response(), str(tmp_path / 'file.bin'), digest=digest)
+    assert download.algorithm is None
+    assert download.digest is None
+
+
+def test_save_response_unknown_digest(tmp_path):
+    with pytest.raises(ValueError):
+        save_response(_streamed_response(), str(tmp_path / 'file.bin'), digest='nope')
+
+
+@pytest.mark.parametrize('content_length', [True, False])
+def test_save_response_bigger_than_max_size(tmp_path, content_length):
+    with pytest.raises(AssertionError) as err:
+        save_response(_streamed_response(content_length=content_length),
+                      str(tmp_path / 'file.bin'), chunk_size=64, max_size=100)
+    assert str(err.value) == ('Url: http://mocking.rules/file.bin Download is bigger '
+                              'than max size of 100 bytes')
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_downloaded_body_is_logged_as_summary():
+    response = _streamed_response()
+    response.download = Download('/tmp/file.bin', 1000, 'md5', 'abc')
+    assert format_response_body_to_log_string(response) == (
+        '<downloaded 1000 bytes to /tmp/file.bin, md5=abc>')
+    assert format_download_to_log_string(Download('f', 1, None, None)) == '<downloaded 1 bytes to f>'
+    assert format_download_to_log_string(Download('f', 1, None, None, 4)) == (
+        '<downloaded 1 bytes to f with 4 range requests>')
+
+
+def test_check_download_settings():
+    assert check_download_settings('64', None, '4') == (64, None, 4)
+    with pytest.raises(ValueError):
+        check_download_settings(64, None, 0)
+
+
+def test_split_ranges():
+    assert split_ranges(10, 3) == [(0, 3), (4, 6), (7, 9)]
+    assert split_ranges(4, 4) == [(0, 0), (1, 1), (2, 2), (3, 3)]
+
+
+@pytest.mark.parametrize('status, headers, size', [
+    (200, {'Accept-Ranges': 'bytes', 'Content-Length': '1000'}, 1000),
+    (200, {'Accept-Ranges': 'none', 'Content-Length': '1000'}, None),
+    (200, {'Accept-Ranges': 'bytes'}, None),
+    (200, {'Accept-Ranges': 'bytes', 'Content-Length': '1000', 'Content-Encoding': 'gzip'}, None),
+    (404, {'Accept-Ranges': 'bytes', 'Content-Length': '1000'}, None),
+])
+def test_ranged_download_size(status, headers, size):
+    response = Response()
+    response.status_code = status
+    response.headers.update(headers)
+    assert ranged_download_size(response) == size
+
+
+def _range_response(start, end, status=206):
+    response = _streamed_response(BODY[start:end + 1])
+    response.status_code = status
+    response.headers['Content-Range'] = 'bytes %d-%d/%d' % (start, end, len(BODY))
+    return response
+
+
+def test_ranges_are_saved_in_place(tmp_path):
+    path = str(tmp_path / 'file.bin.part')
+    preallocate(path, len(BODY))
+    for start, end in reversed(split_ranges(len(BODY), 3)):
+        save_range(_range_response(start, end), path, start, end, chunk_size=64)
+    with open(path, 'rb') as saved:
+        assert saved.read() == BODY
+
+
+def test_save_range_fails_on_full_response(tmp_path):
+    path = str(tmp_path / 'file.bin.part')
+    preallocate(path, len(BODY))
+    with pytest.raises(AssertionError) as err:
+        save_range(_streamed_response(), path, 0, 99)
+    assert str(err.value) == ('Url: http://mocking.rules/file.bin Expected the bytes 0-99 '
+                              'but the response is 200 ')
+
+
+def test_resume_validator():
+    response = Response()
+    assert resume_validator(response) is None
+    response.headers['Last-Modified'] = 'Wed, 21 Oct 2015 07:28:00 GMT'
+    response.headers['ETag'] = 'W/"weak"'
+    assert resume_validator(response) == 'Wed, 21 Oct 2015 07:28:00 GMT'
+    response.headers['ETag'] = '"strong"'
+    assert resume_validator(response) == '"strong"'
+
+
+def test_interrupted_download_is_resumed(tmp_path):
+    response = _streamed_response(broken_at=300)
+    response.headers['ETag'] = '"v1"'
+    reopened = []
+
+    def reopen(headers):
+        reopened.append(headers)
+        return _range_response(300, len(BODY) - 1)
+
+    path = str(tmp_path / 'file.bin')
+    download = save_response(response, path, chunk_size=64, reopen=reopen, resume=1)
+    assert reopened == [{'Range': 'bytes=300-', 'If-Range': '"v1"'}]
+    assert download.digest == hashlib.sha256(BODY).hexdigest()
+    with open(path, 'rb') as saved:
+        assert saved.read() == BODY
+
+
+def test_interrupted_download_starts_over_on_full_response(tmp_path):
+    reopened = []
+
+    def reopen(headers):
+        reopened.append(headers)
+        return _streamed_response()
+
+    path = str(tmp_path / 'file.bin')
+    download = save_response(_streamed_response(broken_at=300), path, chunk_size=64,
+                             reopen=reopen, resume=1)
+    assert reopened == [{}]
+    assert download.size == len(BODY)
+    assert download.digest == hashlib.sha256(BODY).hexdigest()
+
+
+def test_interrupted_download_fails_after_resume_attempts(tmp_path):
+    def reopen(headers):
+        return _streamed_response(broken_at=0)
+
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        save_response(_streamed_response(broken_at=300), str(tmp_path / 'file.bin'),
+                      reopen=reopen, resume=2)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_interrupted_range_is_resumed(tmp_path):
+    path = str(tmp_path / 'file.bin.part')
+    preallocate(path, len(BODY))
+    response = _range_response(0, 499)
+    response.raw = BrokenRaw(BODY[:500], 100)
+    reopened = []
+
+    def reopen(headers):
+        reopened.append(headers)
+        return _range_response(100, 499)
+
+    save_range(response, path, 0, 499, chunk_size=64, reopen=reopen, resume=1, validator='"v1"')
+    assert reopened == [{'Range': 'bytes=100-499', 'If-Range': '"v1"'}]
+    with open(path, 'rb') as saved:
+        assert saved.read(500) == BODY[:500]
+
+
+def test_partially_read_body_is_not_logged():
+    response = _streamed_response()
+    response._content_consumed = True
+    assert format_response_body_to_log_string(response) == (
+        '<not logged, the body has been streamed>')
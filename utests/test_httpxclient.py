@@ -0,0 +1,211 @@
+import asyncio
+import gzip
+import json
+import ssl
+
+import httpx
+import pytest
+import requests
+
+from RequestsLibrary import RequestsLibrary
+from RequestsLibrary.httpxclient import AsyncEngine, HTTP2Adapter, build_timeout
+from utests import mock
+
+
+def echo(request):
+    return httpx.Response(200, json={'method': request.method,
+                                     'url': str(request.url),
+                                     'headers': dict(request.headers),
+                                     'body': request.read().decode()},
+                          headers={'Set-Cookie': 'session=abc'})
+
+
+class MockedTransport(httpx.AsyncBaseTransport):
+
+    def __init__(self, handler):
+        self.handler = handler
+
+    async def handle_async_request(self, request):
+        await request.aread()
+        response = self.handler(request)
+        # a not yet read stream, like the real transports return
+        return httpx.Response(response.status_code, headers=response.headers,
+                              stream=httpx.ByteStream(response.content))
+
+
+def build_async_session(alias='alias', url='http://mocking.rules', handler=echo):
+    keywords = RequestsLibrary()
+    session = keywords.create_session(alias, url, headers={'X-Session': 'yes'}, engine='async')
+    patcher = mock.patch('RequestsLibrary.httpxclient.build_client_settings',
+                         return_value={'transport': MockedTransport(handler)})
+    return keywords, session, patcher
+
+
+def test_create_session_with_unknown_engine():
+    keywords = RequestsLibrary()
+    with pytest.raises(ValueError):
+        keywords.create_session('alias', 'http://mocking.rules', engine='unknown')
+
+
+def test_build_timeout_with_tuple():
+    timeout = build_timeout((1.0, 2.0))
+    assert timeout.connect == 1.0
+    assert timeout.read == 2.0
+    assert timeout.pool is None
+
+
+def test_async_request_is_prepared_by_session():
+    keywords, session, patcher = build_async_session()
+    with patcher:
+        response = asyncio.run(keywords.post_on_session_async('alias', '/endpoint', json={'a': 1}))
+    assert isinstance(response, requests.Response)
+    assert response.request.url == 'http://mocking.rules/endpoint'
+    body = response.json()
+    assert body['method'] == 'POST'
+    assert body['headers']['x-session'] == 'yes'
+    assert json.loads(body['body']) == {'a': 1}
+    assert keywords.last_response is response
+
+
+def test_async_request_cookies_are_stored_in_session():
+    keywords, session, patcher = build_async_session()
+    with patcher:
+        asyncio.run(keywords.get_on_session_async('alias', '/'))
+    assert session.cookies['session'] == 'abc'
+
+
+def test_async_request_status_is_checked():
+    keywords, session, patcher = build_async_session(handler=lambda request: httpx.Response(500))
+    with patcher:
+        with pytest.raises(requests.HTTPError):
+            asyncio.run(keywords.get_on_session_async('alias', '/'))
+
+
+def test_async_refused_connection_is_a_requests_error():
+    keywords = RequestsLibrary()
+    keywords.create_session('alias', 'http://127.0.0.1:1', engine='async', max_retries=0)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        asyncio.run(keywords.get_on_session_async('alias', '/'))
+    summary = keywords.get_session_statistics('alias')
+    assert summary['count'] == 1
+    assert summary['errors'] == 1
+
+
+def test_async_engine_streams_file_body():
+    keywords, session, patcher = build_async_session()
+    with patcher, open(__file__, 'rb') as f:
+        response = asyncio.run(keywords.put_on_session_async('alias', '/', data=f))
+        assert f.closed is True
+    with open(__file__) as f:
+        assert response.json()['body'] == f.read()
+
+
+def test_async_engine_client_is_closed():
+    engine = AsyncEngine(requests.Session())
+    loop = asyncio.new_event_loop()
+    client = loop.run_until_complete(get_client(engine))
+    engine.close()
+    assert client.is_closed
+    loop.close()
+
+
+async def get_client(engine):
+    return engine._get_client()
+
+
+def build_http2_session(handler=echo):
+    keywords = RequestsLibrary()
+    session = keywords.create_session('alias', 'https://mocking.rules', http2=True)
+    adapter = session.get_adapter('https://')
+    adapter._get_transport = mock.MagicMock(return_value=httpx.MockTransport(handler))
+    return keywords, session, adapter
+
+
+def test_create_session_with_http2_mounts_a_single_adapter():
+    keywords = RequestsLibrary()
+    session = keywords.create_session('alias', 'https://mocking.rules', http2=True, max_retries=2)
+    adapter = session.get_adapter('https://')
+    assert isinstance(adapter, HTTP2Adapter)
+    assert session.get_adapter('http://') is adapter
+    assert adapter.max_retries == 2
+
+
+def test_http2_adapter_returns_requests_response():
+    keywords, session, adapter = build_http2_session()
+    response = keywords.post_on_session('alias', '/endpoint', data={'a': '1'})
+    assert isinstance(response, requests.Response)
+    assert response.url == 'https://mocking.rules/endpoint'
+    assert response.json()['body'] == 'a=1'
+    assert response.json()['headers']['content-type'] == 'application/x-www-form-urlencoded'
+    assert response.raw.version == 11
+    assert response.connection is adapter
+
+
+def test_http2_adapter_cookies_are_stored_in_session():
+    keywords, session, adapter = build_http2_session()
+    keywords.get_on_session('alias', '/')
+    assert session.cookies['session'] == 'abc'
+
+
+def test_http2_adapter_raw_read():
+    keywords, session, adapter = build_http2_session(lambda request: httpx.Response(200, content=b'0123456789'))
+    response = session.get('https://mocking.rules', stream=True)
+    assert response.raw.read(4) == b'0123'
+    assert response.raw.read() == b'456789'
+
+
+def test_http2_decompression_bomb_fails_before_being_decoded():
+    bomb = gzip.compress(b'\0' * 50 * 1024 * 1024)
+    chunks = [bomb[i:i + 1024] for i in range(0, len(bomb), 1024)]
+    sent = []
+
+    def stream():
+        for chunk in chunks:
+            sent.append(chunk)
+            yield chunk
+
+    keywords = RequestsLibrary()
+    session = keywords.create_session('alias', 'https://mocking.rules', http2=True,
+                                      max_decoded_size=1024 * 1024)
+    adapter = session.get_adapter('https://').adapter
+    adapter._get_transport = mock.MagicMock(return_value=httpx.MockTransport(
+        lambda request: httpx.Response(200, headers={'Content-Encoding': 'gzip'}, content=stream())))
+    with pytest.raises(requests.exceptions.ContentDecodingError):
+        keywords.get_on_session('alias', '/')
+    assert len(sent) < len(chunks) / 2
+
+
+def test_http2_adapter_connection_error():
+    def raise_connect_error(request):
+        raise httpx.ConnectError('refused', request=request)
+    keywords, session, adapter = build_http2_session(raise_connect_error)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        keywords.get_on_session('alias', '/')
+
+
+def test_http2_adapter_ssl_error():
+    def raise_ssl_error(request):
+        try:
+            raise ssl.SSLCertVerificationError('certificate verify failed')
+        except ssl.SSLError as err:
+            raise httpx.ConnectError('handshake failed', request=request) from err
+    keywords, session, adapter = build_http2_session(raise_ssl_error)
+    with pytest.raises(requests.exceptions.SSLError):
+        keywords.get_on_session('alias', '/')
+
+
+def test_http2_adapter_connection_error_mentioning_ssl_is_not_ssl_error():
+    def raise_connect_error(request):
+        raise httpx.ConnectError('SSL port refused', request=request)
+    keywords, session, adapter = build_http2_session(raise_connect_error)
+    with pytest.raises(requests.exceptions.ConnectionError) as err:
+        keywords.get_on_session('alias', '/')
+    assert not isinstance(err.value, requests.exceptions.SSLError)
+
+
+def test_http2_adapter_read_timeout():
+    def raise_read_timeout(request):
+        raise httpx.ReadTimeout('timeout', request=request)
+    keywords, session, adapter = build_http2_session(raise_read_timeout)
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        keywords.get_on_session('alias', '/', timeout=1)
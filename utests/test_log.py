@@ -1,10 +1,20 @@
+import hashlib
 import json
 import os
 import pytest
 
-from requests import Request
-
-from RequestsLibrary.log import format_data_to_log_string, log_request, log_response
+from requests import Request, Response
+from requests.utils import get_encoding_from_headers
+
+from RequestsLibrary.log import (
+    format_binary_to_log_string,
+    format_data_to_log_string,
+    is_binary,
+    log_request,
+    log_response,
+    response_text_to_log,
+)
+from RequestsLibrary.timings import Timings
 from utests import SCRIPT_DIR
 from utests import mock
 
@@ -218,3 +228,123 @@ def test_format_data_truncate_info_level(mocked_logger):
     mocked_logger.DEBUG = 10
     truncated = format_data_to_log_string(data)
     assert truncated == data[:10000] + '... (set the log level to DEBUG or TRACE to see the full content)'
+
+
+@mock.patch('RequestsLibrary.log.logger')
+def test_log_response_timings(mocked_logger):
+    response = mock.MagicMock()
+    response.request.method = 'GET'
+    response.timings = Timings(0.001, 0.002, 0.003, 0.0105, 0.02, 0.0365)
+    log_response(response)
+    assert mocked_logger.debug.call_args[0][0] == ("GET Response timings : dns=1.000ms, connect=2.000ms, "
+                                                   "tls=3.000ms, ttfb=10.500ms, download=20.000ms, total=36.500ms")
+
+
+def _response_with_content(content, content_type=None):
+    response = Response()
+    response._content = content
+    if content_type:
+        response.headers['Content-Type'] = content_type
+    response.encoding = get_encoding_from_headers(response.headers)
+    return response
+
+
+def test_response_text_to_log_decodes_only_the_logged_prefix():
+    response = _response_with_content(('à' * 100).encode('utf-8'), 'text/plain; charset=utf-8')
+    text = response_text_to_log(response, limit=10)
+    assert text == 'à' * 22
+    assert format_data_to_log_string(text, 10).startswith('à' * 10 + '...')
+
+
+def test_response_text_to_log_short_body_is_complete():
+    response = _response_with_content(b'{"key": "value"}', 'application/json')
+    assert response_text_to_log(response) == '{"key": "value"}'
+
+
+@mock.patch('RequestsLibrary.log.chardet')
+def test_response_text_to_log_json_without_charset_skips_detection(mocked_chardet):
+    response = _response_with_content('{"key": "välue"}'.encode('utf-8'), 'application/problem+json')
+    response.encoding = None
+    assert response_text_to_log(response) == '{"key": "välue"}'
+    mocked_chardet.detect.assert_not_called()
+
+
+@mock.patch('RequestsLibrary.log.chardet')
+def test_response_text_to_log_detects_charset_on_prefix_only(mocked_chardet):
+    mocked_chardet.detect.return_value = {'encoding': 'latin-1'}
+    response = _response_with_content(b'\xe0' * 1000, 'application/octet-stream')
+    assert response_text_to_log(response, limit=10) == 'à' * 44
+    mocked_chardet.detect.assert_called_once_with(b'\xe0' * 44)
+
+
+def test_response_text_to_log_empty_body():
+    assert response_text_to_log(_response_with_content(b'')) == ''
+
+
+@mock.patch('RequestsLibrary.log.logging')
+def test_response_text_to_log_full_text_at_debug_level(mocked_logging):
+    mocked_logging.getLogger().level = 10
+    mocked_logging.DEBUG = 10
+    response = _response_with_content(b'a' * 100, 'text/plain')
+    assert response_text_to_log(response, limit=10) == 'a' * 100
+
+
+@mock.patch('RequestsLibrary.log.EXECUTION_CONTEXTS')
+@mock.patch('RequestsLibrary.log.logging')
+@mock.patch('RequestsLibrary.log.logger')
+def test_log_response_skipped_when_info_is_hidden(mocked_logger, mocked_logging, mocked_contexts):
+    mocked_logging.getLogger().level = 30
+    mocked_logging.INFO = 20
+    response = mock.MagicMock()
+    log_response(response)
+    mocked_logger.info.assert_not_called()
+    response.content.__getitem__.assert_not_called()
+
+
+def test_is_binary_by_content_type():
+    assert is_binary(b'text', 'image/png')
+    assert is_binary(b'text', 'application/octet-stream')
+    assert is_binary(b'text', 'application/x-protobuf')
+    assert not is_binary(b'\x00\x01', 'text/plain; charset=utf-8')
+    assert not is_binary(b'\x00\x01', 'application/vnd.api+json')
+
+
+def test_is_binary_by_content():
+    with open(os.path.join(SCRIPT_DIR, '../atests/randombytes.bin'), 'rb') as f:
+        assert is_binary(f.read())
+    with open(os.path.join(SCRIPT_DIR, '../atests/data.json'), 'rb') as f:
+        assert not is_binary(f.read(), 'multipart/form-data')
+    assert not is_binary('àèìòù\r\n\t'.encode('latin-1'))
+
+
+def test_format_binary_to_log_string():
+    data = bytes(range(20))
+    assert format_binary_to_log_string(data, 'application/octet-stream') == (
+        '<binary data: 20 bytes, content-type=application/octet-stream, '
+        'preview=00 01 02 03 04 05 06 07 08 09 0a 0b 0c 0d 0e 0f ...>')
+    assert format_binary_to_log_string(b'\x00\xff', digest='sha256') == (
+        '<binary data: 2 bytes, preview=00 ff, sha256=%s>' % hashlib.sha256(b'\x00\xff').hexdigest())
+
+
+@mock.patch('RequestsLibrary.log.logger')
+def test_log_request_with_binary_body(mocked_logger):
+    request = Request(method='post', url='http://mock.rulezz', data=b'\x89PNG\r\n\x1a\n\x00',
+                      headers={'Content-Type': 'image/png'}).prepare()
+    response = mock.MagicMock()
+    response.history = []
+    response.request = request
+    log_request(response, 'md5')
+    assert mocked_logger.info.call_args[0][0].endswith(
+        'body=<binary data: 9 bytes, content-type=image/png, preview=89 50 4e 47 0d 0a 1a 0a 00, '
+        'md5=%s> \n ' % hashlib.md5(b'\x89PNG\r\n\x1a\n\x00').hexdigest())
+
+
+@mock.patch('RequestsLibrary.log.logger')
+def test_log_response_with_binary_body_is_not_decoded(mocked_logger):
+    response = _response_with_content(b'\x00\x01\x02', 'application/octet-stream')
+    response.request = Request(method='get', url='http://mock.rulezz').prepare()
+    with mock.patch.object(Response, 'text', new_callable=mock.PropertyMock) as text:
+        log_response(response)
+        text.assert_not_called()
+    assert 'body=<binary data: 3 bytes, content-type=application/octet-stream, preview=00 01 02> \n ' in \
+        mocked_logger.info.call_args[0][0]
@@ -0,0 +1,56 @@
+import io
+import os
+
+import requests
+
+from RequestsLibrary.multipart import MultipartEncoder, build_multipart_encoder
+from utests import SCRIPT_DIR
+
+RANDOMBYTES = os.path.join(SCRIPT_DIR, '../atests/randombytes.bin')
+
+
+def _requests_body(data, files):
+    prepared = requests.Request('POST', 'http://mocking.rules', data=data, files=files).prepare()
+    return prepared.body, prepared.headers['Content-Type'].split('boundary=')[1]
+
+
+def test_encoder_body_is_the_same_as_requests():
+    data = {'name': 'value', 'list': ['1', 2]}
+    with open(RANDOMBYTES, 'rb') as f:
+        body, boundary = _requests_body(data, {'file': f, 'text': ('a.txt', 'text', 'text/plain')})
+    with open(RANDOMBYTES, 'rb') as f:
+        encoder = MultipartEncoder(data, [('file', f), ('text', ('a.txt', 'text', 'text/plain'))],
+                                   boundary)
+        assert len(encoder) == len(body)
+        assert encoder.read() == body
+        assert encoder.content_type == 'multipart/form-data; boundary=%s' % boundary
+
+
+def test_encoder_reads_in_chunks_and_rewinds():
+    with open(RANDOMBYTES, 'rb') as f:
+        encoder = MultipartEncoder(files={'file': f})
+        chunks = list(iter(lambda: encoder.read(100), b''))
+        assert all(len(chunk) == 100 for chunk in chunks[:-1])
+        encoder.seek(0)
+        assert b''.join(chunks) == encoder.read()
+        encoder.close()
+        assert f.closed
+
+
+def test_encoder_is_sent_with_content_length():
+    with open(RANDOMBYTES, 'rb') as f:
+        encoder = MultipartEncoder(files={'file': f})
+        prepared = requests.Request('POST', 'http://mocking.rules', data=encoder).prepare()
+    assert prepared.body is encoder
+    assert prepared.headers['Content-Length'] == str(len(encoder))
+    assert 'Transfer-Encoding' not in prepared.headers
+
+
+def test_build_multipart_encoder_only_for_binary_files():
+    assert build_multipart_encoder(None, None) is None
+    assert build_multipart_encoder(None, {'file': ('a.txt', 'text')}) is None
+    assert build_multipart_encoder(None, {'file': io.StringIO('text')}) is None
+    with open(RANDOMBYTES, 'rb') as f:
+        assert build_multipart_encoder('raw', {'file': f}) is None
+        assert isinstance(build_multipart_encoder({'a': 'b'}, {'file': ('name', f)}),
+                          MultipartEncoder)
@@ -0,0 +1,111 @@
+import base64
+import json
+
+import pytest
+from requests import Request, Response
+
+from RequestsLibrary.recorder import TrafficRecorder, build_har_entry
+from RequestsLibrary.timings import Timings
+from utests import mock
+
+
+def _response(content=b'{"key": "value"}', content_type='application/json', history=()):
+    response = Response()
+    response.status_code = 200
+    response.reason = 'OK'
+    response.url = 'http://mocking.rules/posts?id=1'
+    response._content = content
+    response.headers['Content-Type'] = content_type
+    response.request = Request('post', response.url, data=b'payload',
+                               headers={'Authorization': 'secret'}).prepare()
+    response.timings = Timings(0.001, 0.002, 0.0, 0.01, 0.005, 0.018)
+    response.history = list(history)
+    return response
+
+
+def test_build_har_entry():
+    entry = build_har_entry(_response(), 1000.018)
+    assert entry['startedDateTime'] == '1970-01-01T00:16:40+00:00'
+    assert entry['time'] == pytest.approx(18)
+    assert entry['request']['method'] == 'POST'
+    assert entry['request']['postData']['text'] == 'payload'
+    assert entry['request']['queryString'] == [{'name': 'id', 'value': '1'}]
+    assert {'name': 'Authorization', 'value': '*****'} in entry['request']['headers']
+    assert entry['response']['status'] == 200
+    assert entry['response']['content'] == {'size': 16, 'mimeType': 'application/json', 'text': '{"key": "value"}'}
+    assert entry['timings']['wait'] == pytest.approx(10)
+
+
+def test_build_har_entry_with_binary_body():
+    entry = build_har_entry(_response(b'\x00\x01\x02', 'image/png'), 1000)
+    assert entry['response']['content']['encoding'] == 'base64'
+    assert base64.b64decode(entry['response']['content']['text']) == b'\x00\x01\x02'
+
+
+def test_build_har_entry_does_not_read_streamed_response():
+    response = _response(content=False)
+    entry = build_har_entry(response, 1000)
+    assert entry['response']['bodySize'] == -1
+    assert 'text' not in entry['response']['content']
+
+
+def test_record_jsonl(tmp_path):
+    path = tmp_path / 'traffic.jsonl'
+    recorder = TrafficRecorder(str(path))
+    recorder.record(_response(history=[_response()]))
+    recorder.record(_response())
+    recorder.close()
+    recorder.close()
+    lines = path.read_text().splitlines()
+    assert len(lines) == 3
+    assert recorder.recorded == 3
+    assert json.loads(lines[0])['request']['url'] == 'http://mocking.rules/posts?id=1'
+
+
+def test_record_har(tmp_path):
+    path = tmp_path / 'traffic.har'
+    recorder = TrafficRecorder(str(path), format='har')
+    recorder.record(_response())
+    recorder.record(_response())
+    recorder.close()
+    har = json.loads(path.read_text())
+    assert har['log']['version'] == '1.2'
+    assert len(har['log']['entries']) == 2
+
+
+def test_empty_har_is_valid(tmp_path):
+    path = tmp_path / 'traffic.har'
+    TrafficRecorder(str(path), format='har').close()
+    assert json.loads(path.read_text())['log']['entries'] == []
+
+
+def test_full_queue_drops_exchanges(tmp_path):
+    recorder = TrafficRecorder(str(tmp_path / 'traffic.jsonl'), queue_size=1)
+    recorder._queue.put(None)  # stops the writer, so nothing is taken from the queue
+    recorder._thread.join()
+    recorder.record(_response())
+    recorder.record(_response())
+    assert recorder.dropped == 1
+    recorder.close()
+
+
+@mock.patch('RequestsLibrary.recorder.logger')
+def test_write_error_stops_the_recording(mocked_logger, tmp_path):
+    recorder = TrafficRecorder(str(tmp_path / 'traffic.jsonl'))
+    recorder._file.close()
+    recorder._file = mock.MagicMock()
+    recorder._file.write.side_effect = OSError('No space left on device')
+    recorder.record(_response())
+    recorder._thread.join()
+    recorder.record(_response())
+    recorder.close()
+    assert recorder.errors == 1
+    assert recorder.dropped == 1
+    recorder._file.close.assert_called_once_with()
+    mocked_logger.warn.assert_called_with(
+        '2 requests have not been recorded to %s' % (tmp_path / 'traffic.jsonl'))
+
+
+def test_invalid_format(tmp_path):
+    with pytest.raises(ValueError):
+        TrafficRecorder(str(tmp_path / 'traffic.xml'), format='xml')
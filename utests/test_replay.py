@@ -0,0 +1,150 @@
+import json
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+from requests.models import Response
+
+from RequestsLibrary.replay import (
+    Cassette,
+    ReplayAdapter,
+    decode_body,
+    encode_body,
+    parse_replay_match,
+)
+
+URL = 'http://mocking.rules/posts'
+
+
+class FakeAdapter(BaseAdapter):
+
+    def __init__(self):
+        super(FakeAdapter, self).__init__()
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        response = Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.headers['Content-Type'] = 'text/plain'
+        response.headers['Set-Cookie'] = 'token=%d' % len(self.requests)
+        response._content = ('response %d' % len(self.requests)).encode('utf-8')
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def _session(path, mode='new_episodes', match='method,url'):
+    adapter = FakeAdapter()
+    session = requests.Session()
+    session.mount('http://', ReplayAdapter(adapter, Cassette(str(path), mode, match)))
+    return session, adapter
+
+
+def test_encode_body():
+    assert encode_body(None) is None
+    assert encode_body('text') == 'text'
+    assert encode_body(b'text') == 'text'
+    assert encode_body(b'\xff\x00') == {'base64': '/wA='}
+    assert decode_body(encode_body(b'\xff\x00')) == b'\xff\x00'
+
+
+def test_parse_replay_match():
+    assert parse_replay_match('method, url,body') == ('method', 'url', 'body')
+    assert parse_replay_match('url,header:X-Tenant') == ('url', 'header:X-Tenant')
+    with pytest.raises(ValueError):
+        parse_replay_match('method,cookies')
+    with pytest.raises(ValueError):
+        parse_replay_match('header:')
+
+
+def test_unknown_replay_mode(tmp_path):
+    with pytest.raises(ValueError):
+        Cassette(str(tmp_path / 'cassette.jsonl'), 'once')
+
+
+def test_record_then_replay(tmp_path):
+    path = tmp_path / 'cassette.jsonl'
+    session, adapter = _session(path, 'record')
+    recorded = session.get(URL)
+    assert recorded.replayed is False
+    assert len(path.read_text().splitlines()) == 1
+
+    session, adapter = _session(path, 'replay')
+    replayed = session.get(URL)
+    assert adapter.requests == []
+    assert replayed.replayed is True
+    assert replayed.text == recorded.text
+    assert replayed.headers['Content-Type'] == 'text/plain'
+    assert session.cookies['token'] == '1'
+
+
+def test_replay_fails_on_unrecorded_request(tmp_path):
+    session, _ = _session(tmp_path / 'cassette.jsonl', 'replay')
+    with pytest.raises(requests.exceptions.ConnectionError) as err:
+        session.get(URL)
+    assert 'No recorded response for GET %s' % URL in str(err.value)
+
+
+def test_new_episodes_are_recorded(tmp_path):
+    path = tmp_path / 'cassette.jsonl'
+    session, adapter = _session(path)
+    session.get(URL)
+    session, adapter = _session(path)
+    assert session.get(URL).replayed is True
+    assert session.get(URL + '/1').replayed is False
+    assert len(adapter.requests) == 1
+    assert [json.loads(line)['request']['url'] for line in path.read_text().splitlines()] == [
+        URL, URL + '/1']
+
+
+def test_same_request_is_replayed_in_recorded_order(tmp_path):
+    path = tmp_path / 'cassette.jsonl'
+    session, _ = _session(path, 'record')
+    session.get(URL)
+    session.get(URL)
+    session, _ = _session(path, 'replay')
+    assert session.get(URL).text == 'response 1'
+    assert session.get(URL).text == 'response 2'
+    assert session.get(URL).text == 'response 2'
+
+
+def test_match_on_body(tmp_path):
+    path = tmp_path / 'cassette.jsonl'
+    session, _ = _session(path, 'record')
+    session.post(URL, data='first')
+    session.post(URL, data='second')
+    session, _ = _session(path, 'replay', 'method,url,body')
+    assert session.post(URL, data='second').text == 'response 2'
+    with pytest.raises(requests.exceptions.ConnectionError):
+        session.post(URL, data='third')
+
+
+def test_credential_headers_are_masked(tmp_path):
+    path = tmp_path / 'cassette.jsonl'
+    session, _ = _session(path, 'record')
+    session.get(URL, headers={'Authorization': 'Bearer secret', 'Proxy-Authorization': 'secret',
+                              'Cookie': 'session=secret', 'Accept': 'text/plain'})
+    assert 'secret' not in path.read_text()
+    headers = json.loads(path.read_text())['request']['headers']
+    assert headers['Authorization'] == '*****'
+    assert headers['Accept'] == 'text/plain'
+
+
+def test_match_on_stable_headers(tmp_path):
+    path = tmp_path / 'cassette.jsonl'
+    session, _ = _session(path, 'record')
+    session.get(URL, headers={'Accept': 'text/plain', 'User-Agent': 'first', 'X-Tenant': 'a'})
+    session, _ = _session(path, 'replay', 'method,url,headers')
+    assert session.get(URL, headers={'Accept': 'text/plain', 'User-Agent': 'second'}).replayed
+    with pytest.raises(requests.exceptions.ConnectionError):
+        session.get(URL, headers={'Accept': 'application/json'})
+    session, _ = _session(path, 'replay', 'method,url,header:X-Tenant')
+    assert session.get(URL, headers={'X-Tenant': 'a'}).replayed
+    with pytest.raises(requests.exceptions.ConnectionError):
+        session.get(URL, headers={'X-Tenant': 'b'})
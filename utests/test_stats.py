@@ -0,0 +1,102 @@
+from requests.models import Response
+
+from RequestsLibrary.stats import (
+    LatencyHistogram,
+    SessionStatistics,
+    response_size,
+    url_template,
+)
+
+
+def _response(content=b'hello'):
+    response = Response()
+    response._content = content
+    return response
+
+
+def test_url_template_replaces_ids_and_drops_query():
+    assert url_template('get', 'http://host/posts/12/comments?page=2') == 'GET /posts/{id}/comments'
+    assert url_template('DELETE', '/users/6f1c2a7e-4b1d-4c8e-9c3a-2b7a1e0f9d11') == 'DELETE /users/{id}'
+    assert url_template('GET', 'http://host/commits/0123456789abcdef0123') == 'GET /commits/{id}'
+    assert url_template('GET', 'http://host') == 'GET /'
+    assert url_template('GET', '/v2/posts') == 'GET /v2/posts'
+
+
+def test_histogram_small_values_are_exact():
+    histogram = LatencyHistogram()
+    for value in range(1, 101):
+        histogram.record(value)
+    assert histogram.percentile(50) == 50
+    assert histogram.percentile(90) == 90
+    assert histogram.percentile(100) == 100
+
+
+def test_histogram_large_values_are_within_precision():
+    histogram = LatencyHistogram()
+    for value in range(1, 10001):
+        histogram.record(value * 1000)
+    for percentile in (50, 90, 99):
+        expected = percentile * 100 * 1000
+        assert abs(histogram.percentile(percentile) - expected) <= expected / 64.0
+    assert histogram.percentile(100) == 10000 * 1000
+    assert histogram.max_value == 10000 * 1000
+
+
+def test_histogram_has_fixed_size():
+    histogram = LatencyHistogram()
+    size = len(histogram.counts)
+    for value in (0, 1, 10**3, 10**6, 10**9, 10**12):
+        histogram.record(value)
+    assert len(histogram.counts) == size
+    assert histogram.max_value == 10**12
+    assert histogram.percentile(100) == 10**12
+
+
+def test_histogram_empty_percentile_is_zero():
+    assert LatencyHistogram().percentile(99) == 0
+
+
+def test_session_statistics_summary():
+    statistics = SessionStatistics()
+    statistics.record('GET', 'http://mocking.rules/posts/1?a=b', 0.25, 5)
+    statistics.record('GET', 'http://mocking.rules/posts/2', 0.5, 0, error=True)
+    statistics.record('POST', 'http://mocking.rules/posts', error=True)
+
+    summary = statistics.summary()
+    assert summary['count'] == 3
+    assert summary['errors'] == 2
+    assert summary['bytes'] == 5
+    assert summary['max'] == 0.5
+    assert abs(summary['p50'] - 0.25) < 0.25 / 64
+    assert summary['requests']['GET /posts/{id}']['count'] == 2
+    assert summary['requests']['GET /posts/{id}']['errors'] == 1
+    assert summary['requests']['POST /posts'] == {
+        'count': 1, 'errors': 1, 'bytes': 0, 'p50': 0.0, 'p90': 0.0, 'p99': 0.0, 'max': 0.0}
+
+
+def test_session_statistics_reset():
+    statistics = SessionStatistics()
+    statistics.record('GET', 'http://mocking.rules/', 0.1)
+    statistics.reset()
+    assert statistics.summary()['count'] == 0
+    assert statistics.summary()['requests'] == {}
+
+
+def test_session_statistics_templates_are_bounded():
+    statistics = SessionStatistics(max_templates=10)
+    for index in range(100):
+        statistics.record('GET', 'http://mocking.rules/users/user%d' % index, 0.1)
+    statistics.record('GET', 'http://mocking.rules/users/user0', 0.1)
+
+    requests = statistics.summary()['requests']
+    assert len(statistics.templates) == 11
+    assert requests['GET /users/user0']['count'] == 2
+    assert requests['other']['count'] == 90
+
+
+def test_response_size_of_streamed_response_uses_content_length():
+    response = _response(content=False)
+    response.headers['Content-Length'] = '42'
+    assert response_size(response) == 42
+    del response.headers['Content-Length']
+    assert response_size(response) == 0
@@ -0,0 +1,55 @@
+from RequestsLibrary.timings import (
+    TIMING_POOL_CLASSES,
+    Timings,
+    TimingHTTPAdapter,
+    TimingHTTPSConnection,
+    TraceTimer,
+    build_timings,
+)
+
+
+def test_build_timings():
+    timings = build_timings(10.0, 10.5, 12.0, dns=0.125, connect=0.125, tls=0.25)
+    assert timings == Timings(0.125, 0.125, 0.25, 0.0, 1.5, 2.0)
+
+
+def test_build_timings_reused_connection():
+    timings = build_timings(10.0, 10.5, 12.0)
+    assert timings.dns == timings.connect == timings.tls == 0.0
+    assert timings.ttfb == 0.5
+
+
+def test_timing_adapter_uses_timing_pools():
+    adapter = TimingHTTPAdapter()
+    assert adapter.poolmanager.pool_classes_by_scheme == TIMING_POOL_CLASSES
+
+
+def test_timing_adapter_uses_timing_pools_with_proxy():
+    adapter = TimingHTTPAdapter()
+    manager = adapter.proxy_manager_for('http://proxy.mocking.rules:3128')
+    assert manager.pool_classes_by_scheme == TIMING_POOL_CLASSES
+
+
+def test_setup_timings_are_given_to_first_request_only():
+    connection = TimingHTTPSConnection('mocking.rules')
+    connection._dns_time = 0.1
+    connection._connect_time = 0.2
+    connection.setup_timings = connection._setup_timings(0.5)
+    assert connection.pop_setup_timings() == (0.1, 0.2, 0.2)
+    assert connection.pop_setup_timings() == (0.0, 0.0, 0.0)
+
+
+def test_trace_timer():
+    timer = TraceTimer()
+    timer.start = 0.0
+    timer.events = {'connection.connect_tcp.started': 0.0,
+                    'connection.connect_tcp.complete': 0.125,
+                    'connection.start_tls.started': 0.125,
+                    'connection.start_tls.complete': 0.375,
+                    'http2.receive_response_headers.complete': 0.5}
+    timings = timer.timings(1.0)
+    assert timings.connect == 0.125
+    assert timings.tls == 0.25
+    assert timings.ttfb == 0.125
+    assert timings.download == 0.5
+    assert timings.total == 1.0
@@ -0,0 +1,147 @@
+import pytest
+
+from RequestsLibrary import RequestsLibrary
+from RequestsLibrary.trafficlog import LogSettings, TrafficLog
+from utests import mock
+
+
+@mock.patch('RequestsLibrary.trafficlog.log')
+def test_full_mode_logs_request_and_response(mocked_log):
+    traffic_log = TrafficLog(digest='md5')
+    response = mock.MagicMock()
+    traffic_log.log(response)
+    mocked_log.log_request.assert_called_once_with(response, 'md5')
+    mocked_log.log_response.assert_called_once_with(response, 'md5')
+    mocked_log.log_summary.assert_not_called()
+
+
+@mock.patch('RequestsLibrary.trafficlog.log')
+def test_on_failure_mode_logs_summary_only(mocked_log):
+    traffic_log = TrafficLog(LogSettings(mode='on_failure'))
+    traffic_log.log(mock.MagicMock())
+    mocked_log.log_summary.assert_called_once()
+    mocked_log.log_request.assert_not_called()
+    mocked_log.log_response.assert_not_called()
+
+
+@mock.patch('RequestsLibrary.trafficlog.log')
+def test_session_mode_overrides_library_mode(mocked_log):
+    traffic_log = TrafficLog(LogSettings(mode='on_failure'))
+    traffic_log.log(mock.MagicMock(), LogSettings(mode='full'))
+    mocked_log.log_response.assert_called_once()
+    mocked_log.log_summary.assert_not_called()
+
+
+@mock.patch('RequestsLibrary.trafficlog.logger')
+@mock.patch('RequestsLibrary.trafficlog.log')
+def test_flush_logs_last_buffered_exchanges_in_order(mocked_log, mocked_logger):
+    traffic_log = TrafficLog(LogSettings(mode='on_failure'), buffer_size=3)
+    responses = [mock.MagicMock(name=str(i)) for i in range(5)]
+    for response in responses:
+        traffic_log.log(response)
+    traffic_log.flush()
+    mocked_logger.info.assert_called_once_with('Last 3 requests before the failure:')
+    assert [c[0][0] for c in mocked_log.log_response.call_args_list] == responses[2:]
+
+    traffic_log.flush()
+    assert mocked_log.log_response.call_count == 3
+
+
+def test_invalid_log_settings():
+    with pytest.raises(ValueError):
+        LogSettings(mode='sometimes')
+    with pytest.raises(ValueError):
+        LogSettings(sample_rate='0')
+    with pytest.raises(ValueError):
+        LogSettings(byte_budget='-1')
+    with pytest.raises(ValueError):
+        TrafficLog(buffer_size='0')
+    with pytest.raises(ValueError):
+        TrafficLog(buffer_size='many')
+
+
+@mock.patch('RequestsLibrary.trafficlog.log')
+def test_failed_status_check_flushes_the_buffer(mocked_log):
+    keywords = RequestsLibrary(log_mode='on_failure')
+    session = keywords.create_session('alias', 'http://mocking.rules')
+    response = mock.MagicMock()
+    session.request = mock.MagicMock(return_value=response)
+    keywords._common_request('get', session, '/')
+    mocked_log.log_summary.assert_called_once_with(response)
+    with pytest.raises(Exception):
+        keywords.status_should_be('200', response)
+    mocked_log.log_response.assert_called_once_with(response, None)
+
+
+def test_create_session_with_invalid_log_mode():
+    with pytest.raises(ValueError):
+        RequestsLibrary().create_session('alias', 'http://mocking.rules', log_mode='never')
+
+
+@mock.patch('RequestsLibrary.trafficlog.logger')
+@mock.patch('RequestsLibrary.trafficlog.log')
+def test_sample_rate_logs_every_nth_exchange(mocked_log, mocked_logger):
+    traffic_log = TrafficLog(LogSettings(sample_rate='3'))
+    responses = [mock.MagicMock(name=str(i)) for i in range(7)]
+    for response in responses:
+        traffic_log.log(response)
+    assert [c[0][0] for c in mocked_log.log_response.call_args_list] == [responses[0], responses[3], responses[6]]
+    assert traffic_log.settings.suppressed == 4
+    mocked_logger.info.assert_called_with('4 requests not logged so far, log_sample_rate is 3')
+
+
+@mock.patch('RequestsLibrary.trafficlog.logger')
+@mock.patch('RequestsLibrary.trafficlog.log')
+def test_byte_budget_stops_logging_bodies(mocked_log, mocked_logger):
+    mocked_log.log_request.return_value = 0
+    mocked_log.log_response.return_value = 60
+    traffic_log = TrafficLog(LogSettings(byte_budget='100'))
+    for _ in range(4):
+        traffic_log.log(mock.MagicMock())
+    assert [c[1] for c in mocked_log.log_response.call_args_list] == [{}, {}, {'log_body': False}, {'log_body': False}]
+    assert traffic_log.settings.bodies_suppressed == 2
+    mocked_logger.info.assert_called_once_with(
+        'Log byte budget of 100 spent, bodies are not logged until the end of the suite')
+
+
+@mock.patch('RequestsLibrary.trafficlog.logger')
+@mock.patch('RequestsLibrary.trafficlog.log')
+def test_suppressed_exchanges_are_reported_at_the_end_of_the_test(mocked_log, mocked_logger):
+    mocked_log.log_request.return_value = 0
+    mocked_log.log_response.return_value = 100
+    keywords = RequestsLibrary(log_sample_rate=2, log_byte_budget=100)
+    for _ in range(6):
+        keywords._traffic_log.log(mock.MagicMock())
+    mocked_logger.info.reset_mock()
+    keywords._end_test('test', {})
+    assert [c[0][0] for c in mocked_logger.info.call_args_list] == [
+        '3 requests not logged so far, log_sample_rate is 2',
+        '2 requests logged without bodies so far, log_byte_budget is 100']
+    mocked_logger.info.reset_mock()
+    keywords._end_test('test', {})
+    mocked_logger.info.assert_not_called()
+
+
+@mock.patch('RequestsLibrary.trafficlog.current_suite')
+@mock.patch('RequestsLibrary.trafficlog.log')
+def test_byte_budget_is_reset_in_a_new_suite(mocked_log, mocked_suite):
+    mocked_log.log_request.return_value = 0
+    mocked_log.log_response.return_value = 100
+    mocked_suite.return_value = 'suite 1'
+    traffic_log = TrafficLog(LogSettings(byte_budget=100))
+    traffic_log.log(mock.MagicMock())
+    traffic_log.log(mock.MagicMock())
+    mocked_suite.return_value = 'suite 2'
+    traffic_log.log(mock.MagicMock())
+    assert [c[1] for c in mocked_log.log_response.call_args_list] == [{}, {'log_body': False}, {}]
+
+
+def test_session_log_settings_override_the_library_ones():
+    keywords = RequestsLibrary(log_mode='on_failure', log_sample_rate=10, log_byte_budget=1000)
+    session = keywords.create_session('alias', 'http://mocking.rules', log_sample_rate=2)
+    assert session.log_settings.mode == 'on_failure'
+    assert session.log_settings.sample_rate == 2
+    assert session.log_settings.byte_budget == 1000
+    assert session.log_settings is not keywords._traffic_log.settings
+    session = keywords.create_session('other', 'http://mocking.rules')
+    assert session.log_settings is None
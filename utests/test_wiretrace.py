@@ -0,0 +1,77 @@
+import httpx
+import requests
+
+from RequestsLibrary.timings import TimingHTTPConnection, Timings
+from RequestsLibrary.wiretrace import (
+    WireTrace,
+    build_httpx_wire_trace,
+    log_wire_trace,
+)
+from utests import mock
+
+
+def test_connection_records_request_and_body_bytes():
+    connection = TimingHTTPConnection('mocking.rules')
+    connection.sock = mock.Mock()
+    connection.request('POST', '/anything', body=b'12345', headers={'X-Test': 'yes'})
+    trace = connection.pop_wire_trace()
+    assert trace.sent[0] == 'POST /anything HTTP/1.1'
+    assert 'X-Test: yes' in trace.sent
+    assert 'Content-Length: 5' in trace.sent
+    assert trace.bytes_sent == 5
+    assert connection.pop_wire_trace() is None
+
+
+def test_connection_counts_chunked_body_on_the_wire():
+    connection = TimingHTTPConnection('mocking.rules')
+    connection.sock = mock.Mock()
+    connection.request('POST', '/anything', body=iter([b'abc']))
+    trace = connection.pop_wire_trace()
+    assert 'Transfer-Encoding: chunked' in trace.sent
+    assert trace.bytes_sent == len(b'3\r\nabc\r\n0\r\n\r\n')
+
+
+def test_wire_trace_format():
+    trace = WireTrace()
+    trace.request_line('GET', '/')
+    trace.header('Host', 'mocking.rules')
+    trace.response('HTTP/1.1', 200, 'OK', [('Content-Length', '2')])
+    trace.bytes_received = 2
+    trace.timings = Timings(0.0, 0.0, 0.0, 0.5, 0.25, 0.75)
+    assert trace.format() == '\n'.join([
+        'send: GET / HTTP/1.1',
+        'send: Host: mocking.rules',
+        'sent: 0 body bytes',
+        'reply: HTTP/1.1 200 OK',
+        'header: Content-Length: 2',
+        'received: 2 body bytes',
+        'timings: dns=0.000s connect=0.000s tls=0.000s ttfb=0.500s download=0.250s total=0.750s'])
+
+
+def test_build_httpx_wire_trace():
+    transport = httpx.MockTransport(lambda request: httpx.Response(201, stream=httpx.ByteStream(b'done')))
+    with httpx.Client(transport=transport) as client:
+        httpx_response = client.post('http://mocking.rules/posts?id=1', content=b'data')
+    trace = build_httpx_wire_trace(httpx_response.request, httpx_response)
+    assert trace.sent[0] == 'POST /posts?id=1 HTTP/1.1'
+    assert trace.bytes_sent == 4
+    assert trace.received[0] == 'HTTP/1.1 201 Created'
+    assert trace.bytes_received == 4
+
+
+@mock.patch('RequestsLibrary.wiretrace.logger')
+def test_log_wire_trace_logs_redirects_first(mocked_logger):
+    redirect = requests.Response()
+    redirect.wire_trace = mock.Mock(**{'format.return_value': 'redirect'})
+    response = requests.Response()
+    response.history = [redirect]
+    response.wire_trace = mock.Mock(**{'format.return_value': 'response'})
+    log_wire_trace(response)
+    assert mocked_logger.debug.call_args_list == [mock.call('redirect'), mock.call('response')]
+
+
+@mock.patch('RequestsLibrary.wiretrace.logger')
+def test_log_wire_trace_without_trace(mocked_logger):
+    log_wire_trace(requests.Response())
+    log_wire_trace(mock.MagicMock())
+    mocked_logger.debug.assert_not_called()